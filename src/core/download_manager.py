@@ -12,6 +12,8 @@ Usage:
 """
 
 import logging
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
@@ -41,15 +43,17 @@ class DownloadManager:
         extract_audio (bool): Whether to extract audio only
         add_metadata (bool): Whether to add metadata
         custom_base_name (str): Custom base name for files
+        concurrency (int): Number of videos downloaded in parallel in batch downloads
         video_downloader (VideoDownloader): Core video downloader
         tiktok_downloader (TikTokDownloader): TikTok-specific downloader
-        excel_manager (ExcelMetadataManager): Excel metadata manager
+        excel_manager (ExcelMetadataManager): Excel metadata manager (loaded on first access)
         url_processor (URLProcessor): URL processing utility
     """
     
     def __init__(self, output_dir: str = "downloads", quality: str = "best", 
                  extract_audio: bool = False, add_metadata: bool = True,
-                 custom_base_name: str = None, platform: str = "tiktok"):
+                 custom_base_name: str = None, platform: str = "tiktok",
+                 concurrency: int = 1):
         """
         Initialize the download manager.
         
@@ -60,6 +64,7 @@ class DownloadManager:
             add_metadata (bool): Add metadata to files (default: True)
             custom_base_name (str): Custom base name for files (default: None)
             platform (str): Platform to download from (default: "tiktok")
+            concurrency (int): Videos downloaded in parallel in batch downloads (default: 1)
         """
         self.output_dir = Path(output_dir)
         self.quality = quality
@@ -67,6 +72,14 @@ class DownloadManager:
         self.add_metadata = add_metadata
         self.custom_base_name = custom_base_name
         self.platform = platform.lower()
+        self.concurrency = concurrency
+        
+        # Serializes Excel metadata writes from concurrent downloads
+        self._excel_lock = threading.Lock()
+        
+        # The metadata workbook is loaded on first use (see excel_manager)
+        self._excel_manager: Optional[ExcelMetadataManager] = None
+        self._excel_load_lock = threading.Lock()
         
         # Create output directory
         self.output_dir.mkdir(exist_ok=True)
@@ -102,16 +115,6 @@ class DownloadManager:
             # Use generic video downloader for other platforms
             self.primary_downloader = self.video_downloader
         
-        # Initialize Excel metadata manager
-        excel_filename = None
-        if self.custom_base_name:
-            excel_filename = f"{self.custom_base_name}__metadata.xlsx"
-        
-        self.excel_manager = ExcelMetadataManager(
-            output_dir=str(self.output_dir),
-            filename=excel_filename
-        )
-        
         # Initialize URL processor
         self.url_processor = URLProcessor()
         
@@ -145,17 +148,46 @@ class DownloadManager:
         
         # Update Excel manager if needed
         if 'output_dir' in kwargs or 'custom_base_name' in kwargs:
-            excel_filename = None
-            if self.custom_base_name:
-                excel_filename = f"{self.custom_base_name}__metadata.xlsx"
-            
-            self.excel_manager = ExcelMetadataManager(
-                output_dir=str(self.output_dir),
-                filename=excel_filename
-            )
+            self.reload_excel_file()
         
         logger.info("Download manager settings updated")
     
+    def reload_excel_file(self):
+        """
+        Drop the current Excel metadata manager so the metadata file for the
+        current output directory and custom base name is loaded from disk on
+        next use.
+        
+        Use this after another process has written to the metadata file.
+        """
+        with self._excel_load_lock:
+            if self._excel_manager is not None:
+                self._excel_manager.close_workbook()
+            self._excel_manager = None
+    
+    @property
+    def excel_manager(self) -> ExcelMetadataManager:
+        """
+        Excel metadata manager for the current settings, created on first access.
+        
+        Settings changes and reloads only invalidate it, so a sequence of them
+        costs a single workbook load.
+        
+        Returns:
+            ExcelMetadataManager: Excel metadata manager
+        """
+        with self._excel_load_lock:
+            if self._excel_manager is None:
+                excel_filename = None
+                if self.custom_base_name:
+                    excel_filename = f"{self.custom_base_name}__metadata.xlsx"
+                
+                self._excel_manager = ExcelMetadataManager(
+                    output_dir=str(self.output_dir),
+                    filename=excel_filename
+                )
+            return self._excel_manager
+    
     def get_excel_status(self) -> dict:
         """
         Get information about the current Excel metadata file status.
@@ -231,6 +263,18 @@ class DownloadManager:
         """
         return self.url_processor.process_batch_text(text, self.platform)
     
+    def process_batch_list(self, urls: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        Process a list of URL entries without joining them into batch text.
+        
+        Args:
+            urls (List[str]): URL entries
+            
+        Returns:
+            Tuple[List[str], List[str]]: (valid_urls, invalid_urls)
+        """
+        return self.url_processor.process_batch_list(urls, self.platform)
+    
     def download_single_video(self, url: str, export_to_excel: bool = True) -> Dict[str, Any]:
         """
         Download a single video and optionally export metadata to Excel.
@@ -256,12 +300,11 @@ class DownloadManager:
                 result['error'] = f"Invalid {self.platform} URL: {url}"
                 return result
             
-            # Check if already downloaded
-            if hasattr(self.primary_downloader, 'is_url_already_downloaded'):
-                if self.primary_downloader.is_url_already_downloaded(url, self.excel_manager.excel_file):
-                    result['success'] = True
-                    result['error'] = "Video already downloaded"
-                    return result
+            # Check if already downloaded (in-memory index of the metadata file)
+            if self.excel_manager.contains_url(url):
+                result['success'] = True
+                result['error'] = "Video already downloaded"
+                return result
             
             # Get video info first
             info = self.primary_downloader.get_video_info(url)
@@ -269,15 +312,18 @@ class DownloadManager:
                 result['error'] = "Failed to extract video information"
                 return result
             
-            # Download the video
-            success = self.primary_downloader.download_video(url)
+            # Download the video; the file number is taken only now, after the
+            # checks above, and handed back if the download fails
+            video_number = self.primary_downloader.reserve_video_number()
+            success = self.primary_downloader.download_video(url, video_number)
             if not success:
+                self.primary_downloader.release_video_number(video_number)
                 result['error'] = "Download failed"
                 return result
             
             # Get download path
             if hasattr(self.primary_downloader, 'get_download_path'):
-                download_path = self.primary_downloader.get_download_path(info)
+                download_path = self.primary_downloader.get_download_path(info, video_number)
             else:
                 download_path = ""
             
@@ -289,7 +335,9 @@ class DownloadManager:
             
             # Export to Excel if requested
             if export_to_excel:
-                self.excel_manager.add_video_metadata(info, download_path)
+                with self._excel_lock:
+                    self.excel_manager.add_video_metadata(info, download_path)
+                    self.excel_manager.remember_url(url)
             
             result.update({
                 'success': True,
@@ -337,20 +385,13 @@ class DownloadManager:
             self.primary_downloader.reset_video_counter()
         
         # Download videos
-        results = []
-        successful = 0
-        failed = 0
-        
-        for i, url in enumerate(valid_urls, 1):
+        def download(i: int, url: str) -> Dict[str, Any]:
             logger.info(f"Processing video {i}/{len(valid_urls)}: {url}")
-            
-            result = self.download_single_video(url, export_to_excel)
-            results.append(result)
-            
-            if result['success']:
-                successful += 1
-            else:
-                failed += 1
+            return self.download_single_video(url, export_to_excel)
+        
+        results = self._run_batch(download, valid_urls)
+        successful = sum(1 for result in results if result['success'])
+        failed = len(results) - successful
         
         # Save Excel file if metadata was exported
         if export_to_excel and successful > 0:
@@ -423,167 +464,215 @@ class DownloadManager:
             logger.info(f"Starting video counter: {self.primary_downloader.video_counter}")
         
         # Process each video individually
-        results = []
-        successful = 0
-        failed = 0
+        def process(i: int, url: str) -> Dict[str, Any]:
+            return self._process_excel_video(
+                i, len(valid_urls), url, export_to_excel, progress_callback
+            )
         
-        for i, url in enumerate(valid_urls, 1):
-            logger.info(f"Processing video {i}/{len(valid_urls)}: {url}")
+        results = self._run_batch(process, valid_urls)
+        successful = sum(1 for result in results if result['success'])
+        failed = len(results) - successful
+        
+        # Final Excel save for any rows that could not be appended in place;
+        # rows appended by _process_excel_video are already in the file
+        excel_file_path = None
+        if export_to_excel and successful > 0:
+            excel_file_path = str(self.excel_manager.excel_file)
+            if self.excel_manager.has_unsaved_changes():
+                try:
+                    self.excel_manager.save_excel_file()
+                    logger.info(f"Final Excel metadata saved to: {excel_file_path}")
+                except Exception as e:
+                    logger.error(f"Error saving final Excel file: {e}")
+        
+        # Prepare summary
+        summary = {
+            'total': len(urls),
+            'valid_urls': len(valid_urls),
+            'invalid_urls': len(invalid_urls),
+            'successful': successful,
+            'failed': failed,
+            'results': results,
+            'excel_file': excel_file_path
+        }
+        
+        logger.info(f"Excel-based download completed: {successful}/{len(valid_urls)} successful")
+        return summary
+    
+    def _process_excel_video(self, i: int, total: int, url: str, export_to_excel: bool,
+                             progress_callback=None) -> Dict[str, Any]:
+        """
+        Download one video of an Excel batch, fetch its metadata and add it to Excel.
+        
+        Args:
+            i (int): 1-based position of the video in the batch
+            total (int): Number of videos in the batch
+            url (str): Video URL
+            export_to_excel (bool): Whether to export metadata to Excel
+            progress_callback (callable, optional): Progress callback, see download_videos_from_excel
             
-            # Call progress callback if provided
+        Returns:
+            Dict[str, Any]: Result information for this video
+        """
+        logger.info(f"Processing video {i}/{total}: {url}")
+        
+        # Call progress callback if provided
+        if progress_callback:
+            try:
+                progress_callback(i, total, "Starting download...")
+            except Exception as e:
+                logger.warning(f"Progress callback error: {e}")
+        
+        try:
+            # Step 1: Download the video first
+            logger.info(f"Downloading video {i}/{total}: {url}")
+            
+            # Log current video counter before download
+            if hasattr(self.primary_downloader, 'video_counter'):
+                logger.info(f"Video counter before download: {self.primary_downloader.video_counter}")
+            
+            # Take the file number only now, and hand it back if the download fails
+            video_number = self.primary_downloader.reserve_video_number()
+            download_success = self.primary_downloader.download_video(url, video_number)
+            
+            # Log current video counter after download
+            if hasattr(self.primary_downloader, 'video_counter'):
+                logger.info(f"Video counter after download: {self.primary_downloader.video_counter}")
+            
+            if not download_success:
+                self.primary_downloader.release_video_number(video_number)
+                logger.error(f"Failed to download video: {url}")
+                result = {
+                    'url': url,
+                    'success': False,
+                    'error': 'Download failed',
+                    'metadata': None,
+                    'download_path': None,
+                    'step': 'download'
+                }
+                return result
+            
+            # Step 2: Fetch video information after successful download
+            logger.info(f"Fetching metadata for video {i}/{total}: {url}")
+            
+            # Update progress for metadata extraction
             if progress_callback:
                 try:
-                    progress_callback(i, len(valid_urls), "Starting download...")
+                    progress_callback(i, total, "Extracting metadata...")
                 except Exception as e:
                     logger.warning(f"Progress callback error: {e}")
             
-            try:
-                # Step 1: Download the video first
-                logger.info(f"Downloading video {i}/{len(valid_urls)}: {url}")
-                
-                # Log current video counter before download
-                if hasattr(self.primary_downloader, 'video_counter'):
-                    logger.info(f"Video counter before download: {self.primary_downloader.video_counter}")
-                
-                download_success = self.primary_downloader.download_video(url)
-                
-                # Log current video counter after download
-                if hasattr(self.primary_downloader, 'video_counter'):
-                    logger.info(f"Video counter after download: {self.primary_downloader.video_counter}")
-                
-                if not download_success:
-                    logger.error(f"Failed to download video: {url}")
-                    result = {
-                        'url': url,
-                        'success': False,
-                        'error': 'Download failed',
-                        'metadata': None,
-                        'download_path': None,
-                        'step': 'download'
-                    }
-                    results.append(result)
-                    failed += 1
-                    continue
-                
-                # Step 2: Fetch video information after successful download
-                logger.info(f"Fetching metadata for video {i}/{len(valid_urls)}: {url}")
-                
-                # Update progress for metadata extraction
-                if progress_callback:
-                    try:
-                        progress_callback(i, len(valid_urls), "Extracting metadata...")
-                    except Exception as e:
-                        logger.warning(f"Progress callback error: {e}")
-                
-                info = self.primary_downloader.get_video_info(url)
-                
-                if not info:
-                    logger.error(f"Failed to extract video information: {url}")
-                    result = {
-                        'url': url,
-                        'success': False,
-                        'error': 'Failed to extract video information',
-                        'metadata': None,
-                        'download_path': None,
-                        'step': 'metadata_extraction'
-                    }
-                    results.append(result)
-                    failed += 1
-                    continue
-                
-                # Step 3: Get download path
-                download_path = ""
-                if hasattr(self.primary_downloader, 'get_download_path'):
-                    download_path = self.primary_downloader.get_download_path(info)
-                    logger.info(f"Generated download path: {download_path}")
-                else:
-                    logger.warning("Downloader does not have get_download_path method")
-                
-                # Step 4: Extract metadata for Excel
-                if self.platform == "tiktok" and hasattr(self.primary_downloader, 'extract_tiktok_metadata'):
-                    metadata = self.primary_downloader.extract_tiktok_metadata(info)
-                else:
-                    metadata = info
-                
-                # Step 5: Add metadata to Excel immediately
-                if export_to_excel:
-                    logger.info(f"Adding metadata to Excel for video {i}/{len(valid_urls)}: {url}")
-                    
-                    # Update progress for Excel processing
-                    if progress_callback:
-                        try:
-                            video_title = info.get('title', 'Unknown')
-                            progress_callback(i, len(valid_urls), f"Adding to Excel: {video_title}")
-                        except Exception as e:
-                            logger.warning(f"Progress callback error: {e}")
-                    
-                    self.excel_manager.add_video_metadata(info, download_path)
-                    
-                    # Save Excel file after each video to ensure data persistence
-                    try:
-                        self.excel_manager.save_excel_file()
-                        logger.info(f"Excel file updated for video {i}/{len(valid_urls)}")
-                    except Exception as excel_error:
-                        logger.error(f"Error saving Excel file for video {i}: {excel_error}")
-                
-                # Step 6: Record successful result
+            info = self.primary_downloader.get_video_info(url)
+            
+            if not info:
+                logger.error(f"Failed to extract video information: {url}")
                 result = {
                     'url': url,
-                    'success': True,
-                    'error': None,
-                    'metadata': metadata,
-                    'download_path': download_path,
-                    'step': 'completed'
+                    'success': False,
+                    'error': 'Failed to extract video information',
+                    'metadata': None,
+                    'download_path': None,
+                    'step': 'metadata_extraction'
                 }
-                results.append(result)
-                successful += 1
+                return result
+            
+            # Step 3: Get download path
+            download_path = ""
+            if hasattr(self.primary_downloader, 'get_download_path'):
+                download_path = self.primary_downloader.get_download_path(info, video_number)
+                logger.info(f"Generated download path: {download_path}")
+            else:
+                logger.warning("Downloader does not have get_download_path method")
+            
+            # Step 4: Extract metadata for Excel
+            if self.platform == "tiktok" and hasattr(self.primary_downloader, 'extract_tiktok_metadata'):
+                metadata = self.primary_downloader.extract_tiktok_metadata(info)
+            else:
+                metadata = info
+            
+            # Step 5: Add metadata to Excel immediately
+            if export_to_excel:
+                logger.info(f"Adding metadata to Excel for video {i}/{total}: {url}")
                 
-                # Update progress for completion
+                # Update progress for Excel processing
                 if progress_callback:
                     try:
                         video_title = info.get('title', 'Unknown')
-                        progress_callback(i, len(valid_urls), f"Completed: {video_title}")
+                        progress_callback(i, total, f"Adding to Excel: {video_title}")
                     except Exception as e:
                         logger.warning(f"Progress callback error: {e}")
                 
-                logger.info(f"Successfully processed video {i}/{len(valid_urls)}: {info.get('title', 'Unknown')}")
-                
-            except Exception as e:
-                logger.error(f"Unexpected error processing video {i}/{len(valid_urls)} {url}: {e}")
-                result = {
-                    'url': url,
-                    'success': False,
-                    'error': str(e),
-                    'metadata': None,
-                    'download_path': None,
-                    'step': 'error'
-                }
-                results.append(result)
-                failed += 1
+                with self._excel_lock:
+                    # Write the row into the file right away to ensure data persistence;
+                    # the sheet XML is extended directly, which is much cheaper than an
+                    # openpyxl save but still rewrites the whole archive
+                    if self.excel_manager.append_video_metadata_in_place(info, download_path):
+                        logger.info(f"Excel file updated for video {i}/{total}")
+            
+            # Step 6: Record successful result
+            result = {
+                'url': url,
+                'success': True,
+                'error': None,
+                'metadata': metadata,
+                'download_path': download_path,
+                'step': 'completed'
+            }
+            
+            # Update progress for completion
+            if progress_callback:
+                try:
+                    video_title = info.get('title', 'Unknown')
+                    progress_callback(i, total, f"Completed: {video_title}")
+                except Exception as e:
+                    logger.warning(f"Progress callback error: {e}")
+            
+            logger.info(f"Successfully processed video {i}/{total}: {info.get('title', 'Unknown')}")
+            return result
+            
+        except Exception as e:
+            logger.error(f"Unexpected error processing video {i}/{total} {url}: {e}")
+            result = {
+                'url': url,
+                'success': False,
+                'error': str(e),
+                'metadata': None,
+                'download_path': None,
+                'step': 'error'
+            }
+            return result
+    
+    def _run_batch(self, worker, urls: List[str]) -> List[Dict[str, Any]]:
+        """
+        Run worker(index, url) for every URL and return the results in input order.
         
-        # Final Excel save to ensure all data is persisted
-        excel_file_path = None
-        if export_to_excel and successful > 0:
-            try:
-                self.excel_manager.save_excel_file()
-                excel_file_path = str(self.excel_manager.excel_file)
-                logger.info(f"Final Excel metadata saved to: {excel_file_path}")
-            except Exception as e:
-                logger.error(f"Error saving final Excel file: {e}")
+        With concurrency > 1 the URLs are processed on a thread pool. Workers
+        reserve a video number only once a download actually starts (see
+        VideoDownloader.reserve_video_number), so parallel downloads never share
+        a file name and skipped URLs leave no gaps.
         
-        # Prepare summary
-        summary = {
-            'total': len(urls),
-            'valid_urls': len(valid_urls),
-            'invalid_urls': len(invalid_urls),
-            'successful': successful,
-            'failed': failed,
-            'results': results,
-            'excel_file': excel_file_path
-        }
+        Args:
+            worker (callable): Function taking (1-based index, url)
+            urls (List[str]): URLs to process
+            
+        Returns:
+            List[Dict[str, Any]]: Worker results, in the same order as urls
+        """
+        if self.concurrency <= 1 or len(urls) <= 1:
+            return [worker(i, url) for i, url in enumerate(urls, 1)]
         
-        logger.info(f"Excel-based download completed: {successful}/{len(valid_urls)} successful")
-        return summary
+        results = [None] * len(urls)
+        
+        with ThreadPoolExecutor(max_workers=min(self.concurrency, len(urls)),
+                                thread_name_prefix="video") as executor:
+            futures = {
+                executor.submit(worker, i, url): i
+                for i, url in enumerate(urls, 1)
+            }
+            for future in as_completed(futures):
+                results[futures[future] - 1] = future.result()
+        
+        return results
     
     def process_existing_downloads(self, export_to_excel: bool = True) -> Dict[str, Any]:
         """
@@ -599,18 +688,35 @@ class DownloadManager:
             return {'processed': 0, 'excel_file': None}
         
         try:
-            processed_count = self.excel_manager.process_existing_downloads(
-                str(self.output_dir), 
-                self.custom_base_name
-            )
-            
-            if processed_count > 0:
-                self.excel_manager.save_excel_file()
-                logger.info(f"Processed {processed_count} existing downloads")
+            with self._excel_lock:
+                # A bulk-mode manager (streamed write-only save) is much faster, but
+                # its save rewrites the workbook from the metadata values alone;
+                # use it only when that reproduces the file, then reload the
+                # regular manager
+                use_bulk = self.excel_manager.can_rewrite_in_bulk()
+                if use_bulk:
+                    manager = ExcelMetadataManager(
+                        output_dir=str(self.output_dir),
+                        filename=self.excel_manager.excel_file.name,
+                        bulk_mode=True
+                    )
+                else:
+                    manager = self.excel_manager
+                
+                processed_count = manager.process_existing_downloads(
+                    str(self.output_dir), 
+                    self.custom_base_name
+                )
+                
+                if processed_count > 0:
+                    manager.save_excel_file()
+                    if use_bulk:
+                        self.reload_excel_file()
+                    logger.info(f"Processed {processed_count} existing downloads")
             
             return {
                 'processed': processed_count,
-                'excel_file': str(self.excel_manager.excel_file)
+                'excel_file': str(manager.excel_file)
             }
             
         except Exception as e:
@@ -640,7 +746,11 @@ class DownloadManager:
     def cleanup(self):
         """Clean up resources and close files."""
         try:
-            self.excel_manager.close_workbook()
+            self.primary_downloader.close()
+            if self.video_downloader is not self.primary_downloader:
+                self.video_downloader.close()
+            if self._excel_manager is not None:
+                self._excel_manager.close_workbook()
             logger.info("Download manager cleanup completed")
         except Exception as e:
             logger.error(f"Error during cleanup: {e}")
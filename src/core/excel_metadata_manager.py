@@ -10,20 +10,67 @@ Usage:
     manager = ExcelMetadataManager(output_dir="downloads", filename="videos_metadata.xlsx")
     manager.add_video_metadata(video_info, download_path)
     manager.save_excel_file()
+    
+    # Append one video straight into the existing file, without a full save
+    manager.append_video_metadata_in_place(video_info, download_path)
+    
+    # Bulk export: rows are buffered and streamed to disk in one write-only pass
+    bulk_manager = ExcelMetadataManager(output_dir="downloads", bulk_mode=True)
 """
 
 import os
+import json
 import logging
+import multiprocessing
+import zipfile
 import openpyxl
+import xml.etree.ElementTree as ET
+from contextlib import closing
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, List, Optional
+from typing import Dict, Any, List, Optional, Tuple
 from datetime import datetime
+from openpyxl.cell import WriteOnlyCell
 from openpyxl.styles import Font, PatternFill, Alignment
 from openpyxl.utils import get_column_letter
 
+from .xlsx_writer import append_rows
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Fields of a yt-dlp .info.json file that are used for an Excel row
+_INFO_FIELDS = (
+    'id', 'title', 'description', 'uploader', 'uploader_id', 'channel', 'channel_id',
+    'upload_date', 'duration', 'view_count', 'like_count', 'comment_count',
+    'repost_count', 'webpage_url', 'thumbnail', 'format', 'filesize', 'width',
+    'height', 'ext'
+)
+
+# Minimum number of .info.json files before parsing is spread over worker processes
+_PARALLEL_PARSE_THRESHOLD = 64
+
+
+def _read_info_file(info_file: Path) -> Tuple[Optional[Dict[str, Any]], Optional[str]]:
+    """
+    Read a yt-dlp .info.json file, keeping only the fields used for Excel rows.
+    
+    Defined at module level so it can run in a worker process; only the small
+    field subset is sent back to the writer.
+    
+    Args:
+        info_file (Path): Path to the .info.json file
+        
+    Returns:
+        Tuple[Optional[Dict[str, Any]], Optional[str]]: (info, error message)
+    """
+    try:
+        with open(info_file, 'r', encoding='utf-8') as f:
+            info = json.load(f)
+        return {key: info[key] for key in _INFO_FIELDS if key in info}, None
+    except Exception as e:
+        return None, str(e)
+
 
 class ExcelMetadataManager:
     """
@@ -41,15 +88,26 @@ class ExcelMetadataManager:
         workbook (openpyxl.Workbook): Excel workbook object
         worksheet (openpyxl.worksheet.worksheet.Worksheet): Active worksheet
         headers (List[str]): List of column headers for metadata
+        bulk_mode (bool): Whether rows are buffered and written with a write-only workbook
     """
     
-    def __init__(self, output_dir: str = "downloads", filename: str = None):
+    # 1-based columns formatted with thousands separators:
+    # view count, like count, comment count, repost count, file size
+    NUMBER_COLUMNS = (11, 12, 13, 14, 19)
+    
+    def __init__(self, output_dir: str = "downloads", filename: str = None, bulk_mode: bool = False):
         """
         Initialize the Excel metadata manager.
         
+        In bulk mode no workbook is kept in memory: existing rows are read with a
+        read-only workbook, new rows are buffered as plain values, and
+        save_excel_file() streams everything to disk with a write-only workbook.
+        Use it for large exports; the default mode suits incremental updates.
+        
         Args:
             output_dir (str): Directory to save Excel files (default: "downloads")
             filename (str): Excel filename (default: auto-generated with timestamp)
+            bulk_mode (bool): Buffer rows and save with a write-only workbook (default: False)
         """
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(exist_ok=True)
@@ -71,13 +129,25 @@ class ExcelMetadataManager:
             'Download Date', 'Download Path'
         ]
         
-        # Try to load existing Excel file, create new one if it doesn't exist
-        if self.excel_file.exists():
-            logger.info(f"Loading existing Excel file: {self.excel_file}")
-            self._load_existing_excel()
+        # Video IDs and URLs already in the file, for O(1) duplicate checks
+        self._existing_ids = set()
+        self._existing_urls = set()
+        
+        # Whether the in-memory data differs from the file on disk
+        self._unsaved_changes = False
+        
+        self.bulk_mode = bulk_mode
+        if bulk_mode:
+            self._init_bulk_mode()
         else:
-            logger.info(f"Creating new Excel file: {self.excel_file}")
-            self._create_new_excel()
+            # Try to load existing Excel file, create new one if it doesn't exist
+            if self.excel_file.exists():
+                logger.info(f"Loading existing Excel file: {self.excel_file}")
+                self._load_existing_excel()
+            else:
+                logger.info(f"Creating new Excel file: {self.excel_file}")
+                self._create_new_excel()
+            self._index_worksheet()
         
         logger.info(f"ExcelMetadataManager initialized with file: {self.excel_file}")
     
@@ -87,6 +157,7 @@ class ExcelMetadataManager:
         self.worksheet = self.workbook.active
         self.worksheet.title = "Video Metadata"
         self._setup_excel_headers()
+        self._unsaved_changes = True
         logger.info("Created new Excel workbook with headers")
     
     def _load_existing_excel(self):
@@ -111,20 +182,258 @@ class ExcelMetadataManager:
             else:
                 logger.info("Existing Excel file is empty, setting up headers")
                 self._setup_excel_headers()
+                self._unsaved_changes = True
                 
         except Exception as e:
             logger.error(f"Error loading existing Excel file: {e}")
             logger.info("Creating new Excel file due to loading error")
             self._create_new_excel()
     
+    def _init_bulk_mode(self):
+        """Read existing rows (if any) into the bulk buffer using a read-only workbook."""
+        self.workbook = None
+        self.worksheet = None
+        self._rows = []
+        
+        if not self.excel_file.exists():
+            logger.info(f"Creating new Excel file in bulk mode: {self.excel_file}")
+            return
+        
+        try:
+            workbook = openpyxl.load_workbook(
+                str(self.excel_file), read_only=True, data_only=True, keep_links=False
+            )
+            with closing(workbook):
+                rows = workbook.active.iter_rows(values_only=True)
+                existing_headers = next(rows, None) or ()
+                
+                # Check if headers match our expected format
+                if len(existing_headers) >= len(self.headers):
+                    for row in rows:
+                        if any(value is not None for value in row):
+                            self._add_bulk_row(list(row))
+                    logger.info(f"Loaded existing Excel file with {len(self._rows)} data rows (bulk mode)")
+                else:
+                    logger.warning("Existing Excel file has different structure, creating new one")
+                    self._unsaved_changes = True
+        except Exception as e:
+            logger.error(f"Error loading existing Excel file: {e}")
+            logger.info("Creating new Excel file due to loading error")
+            self._unsaved_changes = True
+            self._rows = []
+            self._existing_ids.clear()
+            self._existing_urls.clear()
+    
+    def _add_bulk_row(self, row: List[Any]):
+        """
+        Buffer a row in bulk mode and index its video ID and URL for duplicate checks.
+        
+        Args:
+            row (List[Any]): Row values in header order
+        """
+        self._rows.append(row)
+        self._index_row(row)
+    
+    def _index_row(self, row):
+        """
+        Record a row's video ID and original URL for duplicate checks.
+        
+        Args:
+            row (Sequence[Any]): Row values in header order
+        """
+        if row[0]:
+            self._existing_ids.add(str(row[0]))
+        if len(row) > 15 and row[15]:
+            self._existing_urls.add(str(row[15]))
+    
+    def _index_worksheet(self):
+        """Rebuild the duplicate-check index from the loaded worksheet in one pass."""
+        self._existing_ids.clear()
+        self._existing_urls.clear()
+        for row in self.worksheet.iter_rows(min_row=2, max_col=16, values_only=True):
+            self._index_row(row)
+    
+    def contains_url(self, url: str) -> bool:
+        """
+        Check whether a URL is already recorded in the Excel file (in memory, no file I/O).
+        
+        Args:
+            url (str): URL to check
+            
+        Returns:
+            bool: True if the URL has been recorded
+        """
+        return bool(url) and str(url) in self._existing_urls
+    
+    def remember_url(self, url: str):
+        """
+        Record an additional URL (e.g. the short link a video was requested by)
+        as downloaded, so later contains_url() checks match it.
+        
+        Args:
+            url (str): URL to record
+        """
+        if url:
+            self._existing_urls.add(str(url))
+    
+    def can_rewrite_in_bulk(self) -> bool:
+        """
+        Check whether a bulk-mode save can replace the file without losing anything.
+        
+        A bulk save writes a new workbook with only the "Video Metadata" sheet:
+        cell values, the standard header row, the '#,##0' count format and
+        column widths computed from the content. It is therefore only used for
+        a file that does not exist yet (and has no rows waiting in memory), or
+        for one whose loaded copy matches the file (no unsaved changes) and
+        holds nothing beyond that. Any of the following makes it
+        unsafe: another sheet or defined names, formulas, other cell styles,
+        column widths the bulk save would change (including widths that lag
+        behind in-place appends), empty rows, merged cells, conditional
+        formatting, data validation, filters, freeze panes, images or charts.
+        
+        Returns:
+            bool: True if a bulk-mode save would reproduce the file
+        """
+        if not self.excel_file.exists():
+            return self._total_rows() <= 1
+        if self.worksheet is None or self._unsaved_changes:
+            return False
+        
+        workbook, worksheet = self.workbook, self.worksheet
+        if (len(workbook.sheetnames) != 1 or workbook.defined_names or worksheet.defined_names
+                or worksheet.merged_cells.ranges or len(worksheet.conditional_formatting)
+                or worksheet.data_validations.dataValidation or worksheet.auto_filter.ref
+                or worksheet.freeze_panes or worksheet._images or worksheet._charts):
+            return False
+        
+        # Header row exactly as _setup_excel_headers writes it
+        header_font, header_fill, header_alignment = self._header_style()
+        # (_cells holds only the cells stored in the file, so nothing is created)
+        for col, header in enumerate(self.headers, 1):
+            cell = worksheet._cells.get((1, col))
+            if cell is None:
+                return False
+            style = cell._style
+            if (style is None or cell.value != header or cell.font != header_font or cell.fill != header_fill
+                    or cell.alignment != header_alignment
+                    or style.borderId or style.numFmtId or style.protectionId):
+                return False
+        
+        # Data cells: no formulas, and no style other than the count format
+        number_columns = set(self.NUMBER_COLUMNS)
+        header_count = len(self.headers)
+        for (row, col), cell in worksheet._cells.items():
+            if row == 1:
+                if col > header_count and (cell.value is not None or cell.has_style):
+                    return False
+                continue
+            if cell.data_type == 'f':
+                return False
+            style = cell._style
+            if style is None:
+                continue
+            if (style.fontId or style.fillId or style.borderId or style.protectionId
+                    or style.alignmentId or style.quotePrefix or style.pivotButton
+                    or style.numFmtId not in (0, 3)
+                    or (style.numFmtId == 3 and col not in number_columns)):
+                return False
+        
+        # Every data row is kept, and the column widths come out the same
+        rows = list(worksheet.iter_rows(min_row=2, values_only=True))
+        if not all(any(value is not None for value in row) for row in rows):
+            return False
+        widths = self._content_widths(rows)
+        sized = set()
+        for dimension in worksheet.column_dimensions.values():
+            if dimension.hidden or dimension.outlineLevel:
+                return False
+            if not dimension.customWidth:
+                continue
+            for col in range(dimension.min, dimension.max + 1):
+                if col > header_count or dimension.width != widths[col - 1]:
+                    return False
+                sized.add(col)
+        return len(sized) == header_count
+    
+    @staticmethod
+    def _header_style() -> Tuple[Font, PatternFill, Alignment]:
+        """
+        Get the font, fill and alignment of the header row.
+        
+        Returns:
+            Tuple[Font, PatternFill, Alignment]: Header cell styling
+        """
+        return (
+            Font(bold=True, color="FFFFFF"),
+            PatternFill(start_color="366092", end_color="366092", fill_type="solid"),
+            Alignment(horizontal="center", vertical="center"),
+        )
+    
+    def _content_widths(self, rows) -> List[int]:
+        """
+        Compute column widths the way the regular save grows them: 15 by default,
+        widened to fit the longest value (at most 50).
+        
+        Args:
+            rows (Iterable[Sequence[Any]]): Data rows in header order
+            
+        Returns:
+            List[int]: Width of each header column
+        """
+        columns = range(len(self.headers))
+        widths = [15] * len(columns)
+        for row in rows:
+            for col, value in zip(columns, row):
+                if value:
+                    content_length = len(str(value))
+                    if content_length > widths[col]:
+                        widths[col] = min(content_length + 2, 50)
+        return widths
+    
+    def _save_bulk(self):
+        """Write the header and all buffered rows with a write-only workbook."""
+        workbook = openpyxl.Workbook(write_only=True)
+        worksheet = workbook.create_sheet("Video Metadata")
+        
+        # Column widths must be set before the first row is written
+        widths = self._content_widths(self._rows)
+        for col, width in enumerate(widths, 1):
+            worksheet.column_dimensions[get_column_letter(col)].width = width
+        
+        # Header row with the same styling as _setup_excel_headers
+        header_font, header_fill, header_alignment = self._header_style()
+        header_cells = []
+        for header in self.headers:
+            cell = WriteOnlyCell(worksheet, value=header)
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = header_alignment
+            header_cells.append(cell)
+        worksheet.append(header_cells)
+        
+        # Data rows; only non-zero counts need a styled cell
+        number_indexes = [col - 1 for col in self.NUMBER_COLUMNS]
+        for row in self._rows:
+            values = list(row)
+            row_length = len(values)
+            for index in number_indexes:
+                if index < row_length and values[index]:
+                    cell = WriteOnlyCell(worksheet, value=values[index])
+                    cell.number_format = '#,##0'
+                    values[index] = cell
+            worksheet.append(values)
+        
+        workbook.save(str(self.excel_file))
+    
     def _setup_excel_headers(self):
         """Setup Excel worksheet with headers and formatting."""
         # Add headers
+        header_font, header_fill, header_alignment = self._header_style()
         for col, header in enumerate(self.headers, 1):
             cell = self.worksheet.cell(row=1, column=col, value=header)
-            cell.font = Font(bold=True, color="FFFFFF")
-            cell.fill = PatternFill(start_color="366092", end_color="366092", fill_type="solid")
-            cell.alignment = Alignment(horizontal="center", vertical="center")
+            cell.font = header_font
+            cell.fill = header_fill
+            cell.alignment = header_alignment
         
         # Auto-adjust column widths
         for col in range(1, len(self.headers) + 1):
@@ -266,36 +575,150 @@ class ExcelMetadataManager:
                 logger.info(f"Video already exists in Excel, skipping: {info.get('title', 'Unknown')}")
                 return
             
-            # Get next row number
-            next_row = self.worksheet.max_row + 1
-            
             # Extract metadata
             metadata = self._extract_metadata_for_excel(info, download_path)
-            
-            # Add data to worksheet
-            for col, value in enumerate(metadata, 1):
-                cell = self.worksheet.cell(row=next_row, column=col, value=value)
-                
-                # Format numbers
-                if col in [11, 12, 13, 14, 19]:  # View count, like count, comment count, repost count, file size
-                    if value and value != 0:
-                        cell.number_format = '#,##0'
-            
-            # Auto-adjust column widths
-            for col in range(1, len(self.headers) + 1):
-                column_letter = get_column_letter(col)
-                current_width = self.worksheet.column_dimensions[column_letter].width
-                cell_value = self.worksheet.cell(row=next_row, column=col).value
-                if cell_value:
-                    content_length = len(str(cell_value))
-                    if content_length > current_width:
-                        self.worksheet.column_dimensions[column_letter].width = min(content_length + 2, 50)
+            self._append_row(metadata)
             
             logger.info(f"Added metadata to Excel: {info.get('title', 'Unknown')}")
             
         except Exception as e:
             logger.error(f"Error adding metadata to Excel: {e}")
     
+    def _append_row(self, metadata: List[Any]):
+        """
+        Add a row to the in-memory workbook (or bulk buffer) and index it for duplicate checks.
+        
+        Args:
+            metadata (List[Any]): Row values in header order
+        """
+        self._unsaved_changes = True
+        
+        if self.bulk_mode:
+            self._add_bulk_row(metadata)
+            return
+        
+        # Add data to worksheet as one row
+        self.worksheet.append(metadata)
+        next_row = self.worksheet.max_row
+        
+        # Format numbers
+        for col in self.NUMBER_COLUMNS:
+            if metadata[col - 1]:
+                self.worksheet.cell(row=next_row, column=col).number_format = '#,##0'
+        
+        self._index_row(metadata)
+        
+        # Auto-adjust column widths from the row values
+        for col, value in enumerate(metadata, 1):
+            if value:
+                content_length = len(str(value))
+                dimension = self.worksheet.column_dimensions[get_column_letter(col)]
+                if content_length > dimension.width:
+                    dimension.width = min(content_length + 2, 50)
+    
+    def append_rows_in_place(self, rows: List[List[Any]]) -> int:
+        """
+        Add rows and write them straight into the existing Excel file.
+        
+        The worksheet XML is extended directly (see core.xlsx_writer) instead of
+        re-serializing the workbook through openpyxl. The archive is still
+        recompressed and rewritten as a whole, so each call is O(file size),
+        just with a much smaller constant than a full save. The rows are also added to the in-memory copy, so a later
+        save_excel_file() keeps them. A file that does not exist yet is created
+        with the regular save (write-only in bulk mode), and so is a file that
+        cannot be edited in place. Column widths are only updated on a regular save.
+        
+        Args:
+            rows (List[List[Any]]): Row values in header order
+            
+        Returns:
+            int: Number of rows written (duplicates are skipped)
+        """
+        try:
+            # Skip rows already in the file or repeated within this call
+            new_rows = []
+            batch_keys = set()
+            for row in rows:
+                video_id = str(row[0]) if row[0] else ''
+                original_url = str(row[15]) if len(row) > 15 and row[15] else ''
+                if self._video_exists(video_id, original_url):
+                    continue
+                keys = {key for key in (('id', video_id), ('url', original_url)) if key[1]}
+                if keys & batch_keys:
+                    continue
+                batch_keys |= keys
+                new_rows.append(row)
+            
+            if not new_rows:
+                return 0
+            
+            # Appending in place is only correct while the file matches memory
+            written = False
+            unsaved_before = self._unsaved_changes
+            if self.excel_file.exists() and not unsaved_before:
+                try:
+                    append_rows(self.excel_file, new_rows, self.NUMBER_COLUMNS)
+                    written = True
+                except (zipfile.BadZipFile, KeyError, ValueError, ET.ParseError, OSError) as e:
+                    # OSError covers a file locked by Excel or a failed swap on Windows
+                    logger.warning(f"Cannot append to Excel file in place, saving it in full: {e}")
+            
+            for row in new_rows:
+                self._append_row(row)
+            
+            if written:
+                # The rows are already in the file
+                self._unsaved_changes = unsaved_before
+            elif not self.save_excel_file():
+                return 0
+            
+            logger.info(f"Appended {len(new_rows)} rows to Excel file: {self.excel_file}")
+            return len(new_rows)
+            
+        except Exception as e:
+            logger.error(f"Error appending rows to Excel file: {e}")
+            return 0
+    
+    def append_video_metadata_in_place(self, info: Dict[str, Any], download_path: str = "") -> bool:
+        """
+        Add video metadata and write it straight into the Excel file (see append_rows_in_place).
+        
+        Args:
+            info (Dict[str, Any]): Video information dictionary
+            download_path (str): Path where video was downloaded
+            
+        Returns:
+            bool: True if a row was written, False if it was a duplicate or failed
+        """
+        metadata = self._extract_metadata_for_excel(info, download_path)
+        return self.append_rows_in_place([metadata]) == 1
+    
+    def add_video_metadata_batch(self, infos: List[Dict[str, Any]],
+                                 download_paths: Optional[List[str]] = None) -> int:
+        """
+        Add metadata for several videos; call save_excel_file() once afterwards.
+        
+        Combined with bulk mode this writes a whole batch with a single
+        streamed save instead of one load/save cycle per video.
+        
+        Args:
+            infos (List[Dict[str, Any]]): Video information dictionaries
+            download_paths (Optional[List[str]]): Download path for each video (default: none)
+            
+        Returns:
+            int: Number of rows added (duplicates are skipped)
+        """
+        if download_paths is None:
+            download_paths = [""] * len(infos)
+        
+        rows_before = self._total_rows()
+        for info, download_path in zip(infos, download_paths):
+            self.add_video_metadata(info, download_path)
+        
+        added = self._total_rows() - rows_before
+        logger.info(f"Added {added} of {len(infos)} videos to Excel in one batch")
+        return added
+    
     def _video_exists(self, video_id: str, original_url: str) -> bool:
         """
         Check if a video already exists in the Excel file.
@@ -310,42 +733,38 @@ class ExcelMetadataManager:
         if not video_id and not original_url:
             return False
         
-        # Find the column indices for Video ID and Original URL
-        video_id_col = None
-        url_col = None
-        
-        for col in range(1, self.worksheet.max_column + 1):
-            header_value = self.worksheet.cell(row=1, column=col).value
-            if header_value == 'Video ID':
-                video_id_col = col
-            elif header_value == 'Original URL':
-                url_col = col
-        
-        # Check existing rows for duplicates
-        for row in range(2, self.worksheet.max_row + 1):
-            existing_video_id = self.worksheet.cell(row=row, column=video_id_col).value if video_id_col else None
-            existing_url = self.worksheet.cell(row=row, column=url_col).value if url_col else None
-            
-            # Check if video ID matches
-            if video_id and existing_video_id and str(video_id) == str(existing_video_id):
-                return True
-            
-            # Check if URL matches
-            if original_url and existing_url and str(original_url) == str(existing_url):
-                return True
-        
-        return False
+        # Check if video ID or URL matches an existing row
+        return (
+            bool(video_id) and str(video_id) in self._existing_ids
+            or bool(original_url) and str(original_url) in self._existing_urls
+        )
     
     def save_excel_file(self):
         """Save the Excel file with all collected metadata."""
         try:
-            self.workbook.save(str(self.excel_file))
+            if self.bulk_mode:
+                self._save_bulk()
+            else:
+                self.workbook.save(str(self.excel_file))
+            self._unsaved_changes = False
             logger.info(f"Excel file saved: {self.excel_file}")
             return True
         except Exception as e:
             logger.error(f"Error saving Excel file: {e}")
             return False
     
+    def has_unsaved_changes(self) -> bool:
+        """
+        Check whether there is data that save_excel_file() still needs to write.
+        
+        Rows written by append_rows_in_place() are already in the file, so a
+        run that only used it can skip the final full save.
+        
+        Returns:
+            bool: True if the in-memory data differs from the file
+        """
+        return self._unsaved_changes
+    
     def load_existing_excel(self, file_path: str) -> bool:
         """
         Load an existing Excel file to continue adding metadata.
@@ -357,6 +776,10 @@ class ExcelMetadataManager:
             bool: True if loaded successfully, False otherwise
         """
         try:
+            if self.bulk_mode:
+                logger.warning("load_existing_excel is not supported in bulk mode")
+                return False
+            
             if not os.path.exists(file_path):
                 logger.warning(f"Excel file does not exist: {file_path}")
                 return False
@@ -367,6 +790,9 @@ class ExcelMetadataManager:
             # Load existing workbook
             self.workbook = openpyxl.load_workbook(file_path)
             self.worksheet = self.workbook.active
+            self._unsaved_changes = False
+            
+            self._index_worksheet()
             
             # Validate the structure
             if self.worksheet.max_row > 0:
@@ -410,32 +836,40 @@ class ExcelMetadataManager:
         
         logger.info(f"Found {len(info_files)} existing video metadata files")
         
+        # List the directory once instead of globbing it for every info file
+        file_names = [
+            entry.name for entry in os.scandir(output_path)
+            if entry.is_file() and not entry.name.startswith('.')
+        ]
+        
         processed_count = 0
-        for info_file in info_files:
+        for info_file, (info, error) in zip(info_files, self._read_info_files(info_files)):
+            if error is not None:
+                logger.error(f"Error processing {info_file}: {error}")
+                continue
+            
             try:
-                # Read the JSON file
-                import json
-                with open(info_file, 'r', encoding='utf-8') as f:
-                    info = json.load(f)
-                
                 # Find corresponding video file
                 video_path = ""
                 title = info.get('title', '')
-                ext = info.get('ext', 'mp4')
+                suffix = f".{info.get('ext', 'mp4')}"
                 
                 if custom_base_name:
                     # Look for video file with custom naming pattern
-                    for video_file in output_path.glob(f"{custom_base_name}__*.{ext}"):
+                    prefix = f"{custom_base_name}__"
+                    info_base = info_file.stem.replace('.info', '')
+                    for name in file_names:
                         # Check if this file corresponds to the current info file
-                        info_base = info_file.stem.replace('.info', '')
-                        if info_base in video_file.stem:
-                            video_path = str(video_file)
+                        if (name.startswith(prefix) and name.endswith(suffix)
+                                and info_base in name[:-len(suffix)]):
+                            video_path = str(output_path / name)
                             break
                 else:
                     # Look for video file with similar name
-                    for video_file in output_path.glob(f"*.{ext}"):
-                        if title.lower() in video_file.name.lower():
-                            video_path = str(video_file)
+                    title_lower = title.lower()
+                    for name in file_names:
+                        if name.endswith(suffix) and title_lower in name.lower():
+                            video_path = str(output_path / name)
                             break
                 
                 # Add to Excel
@@ -450,6 +884,36 @@ class ExcelMetadataManager:
         logger.info(f"Successfully processed {processed_count} videos")
         return processed_count
     
+    def _read_info_files(self, info_files: List[Path]) -> List[Tuple[Optional[Dict[str, Any]], Optional[str]]]:
+        """
+        Parse .info.json files, in worker processes when there are many of them.
+        
+        Parsing is independent per file; writing stays in this process, which
+        owns the workbook.
+        
+        Args:
+            info_files (List[Path]): Paths to .info.json files
+            
+        Returns:
+            List[Tuple[Optional[Dict[str, Any]], Optional[str]]]: (info, error) per file, in order
+        """
+        if len(info_files) >= _PARALLEL_PARSE_THRESHOLD and (os.cpu_count() or 1) > 1:
+            try:
+                workers = os.cpu_count()
+                # spawn: this may run on a worker thread of a GUI process
+                with ProcessPoolExecutor(
+                    max_workers=workers,
+                    mp_context=multiprocessing.get_context("spawn")
+                ) as executor:
+                    return list(executor.map(
+                        _read_info_file, info_files,
+                        chunksize=max(1, len(info_files) // (workers * 4))
+                    ))
+            except Exception as e:
+                logger.warning(f"Parallel metadata parsing failed, parsing serially: {e}")
+        
+        return [_read_info_file(info_file) for info_file in info_files]
+    
     def get_excel_info(self) -> dict:
         """
         Get basic information about the current Excel file.
@@ -458,15 +922,16 @@ class ExcelMetadataManager:
             dict: Dictionary containing file information
         """
         try:
+            total_rows = self._total_rows()
             info = {
                 "file_path": str(self.excel_file),
                 "file_name": self.excel_file.name,
-                "total_rows": self.worksheet.max_row,
-                "total_columns": self.worksheet.max_column,
-                "data_rows": max(0, self.worksheet.max_row - 1),  # Exclude header row
+                "total_rows": total_rows,
+                "total_columns": len(self.headers) if self.bulk_mode else self.worksheet.max_column,
+                "data_rows": max(0, total_rows - 1),  # Exclude header row
                 "column_names": self.headers,
                 "file_exists": self.excel_file.exists(),
-                "is_new_file": not self.excel_file.exists() or self.worksheet.max_row <= 1
+                "is_new_file": not self.excel_file.exists() or total_rows <= 1
             }
             
             return info
@@ -475,9 +940,29 @@ class ExcelMetadataManager:
             logger.error(f"Failed to get file info: {str(e)}")
             return {"error": f"Failed to get file info: {str(e)}"}
     
+    def _total_rows(self) -> int:
+        """
+        Get the number of rows including the header row.
+        
+        Returns:
+            int: Total number of rows
+        """
+        if self.bulk_mode:
+            return len(self._rows) + 1
+        return self.worksheet.max_row
+    
     def clear_data(self):
         """Clear all data from the worksheet, keeping only headers."""
         try:
+            self._existing_ids.clear()
+            self._existing_urls.clear()
+            self._unsaved_changes = True
+            
+            if self.bulk_mode:
+                self._rows.clear()
+                logger.info("Cleared all data from Excel worksheet")
+                return
+            
             # Delete all rows except the first (header) row
             for row in range(self.worksheet.max_row, 1, -1):
                 self.worksheet.delete_rows(row)
@@ -490,6 +975,8 @@ class ExcelMetadataManager:
     def close_workbook(self):
         """Close the Excel workbook to free up resources."""
         try:
+            if self.workbook is None:
+                return
             self.workbook.close()
             logger.info("Excel workbook closed")
         except Exception as e:
@@ -506,7 +993,7 @@ class ExcelMetadataManager:
             if not self.excel_file.exists():
                 return "New file will be created"
             
-            data_rows = max(0, self.worksheet.max_row - 1)
+            data_rows = max(0, self._total_rows() - 1)
             if data_rows == 0:
                 return "Empty file - ready for new data"
             else:
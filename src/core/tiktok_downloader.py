@@ -12,6 +12,7 @@ Usage:
 """
 
 import logging
+import re
 from pathlib import Path
 from typing import Optional, Dict, Any, List
 from datetime import datetime
@@ -59,6 +60,14 @@ class TikTokDownloader(VideoDownloader):
             'www.tiktok.com'
         ]
         
+        # Precompiled equivalent of validate_url(): a scheme, "://" and a
+        # TikTok domain inside the netloc
+        self._url_re = re.compile(
+            r'^[A-Za-z][A-Za-z0-9+.\-]*://[^/?#]*(?:'
+            + '|'.join(map(re.escape, self.tiktok_domains))
+            + ')'
+        )
+        
         logger.info("TikTokDownloader initialized with TikTok-specific functionality")
     
     def validate_url(self, url: str) -> bool:
@@ -71,15 +80,10 @@ class TikTokDownloader(VideoDownloader):
         Returns:
             bool: True if URL is a valid TikTok URL, False otherwise
         """
-        if not super().validate_url(url):
+        if not url:
             return False
         
-        try:
-            import urllib.parse
-            parsed = urllib.parse.urlparse(url.strip())
-            return any(domain in parsed.netloc for domain in self.tiktok_domains)
-        except Exception:
-            return False
+        return self._url_re.match(url.strip()) is not None
     
     def extract_tiktok_metadata(self, info: Dict[str, Any]) -> Dict[str, Any]:
         """
@@ -202,12 +206,14 @@ class TikTokDownloader(VideoDownloader):
         except:
             return upload_date
     
-    def get_download_path(self, info: Dict[str, Any]) -> str:
+    def get_download_path(self, info: Dict[str, Any], video_number: Optional[int] = None) -> str:
         """
         Get the path where the video was downloaded.
         
         Args:
             info (Dict[str, Any]): Video information dictionary
+            video_number (Optional[int]): Number the video was downloaded with;
+                defaults to the most recently used counter value
             
         Returns:
             str: Download path string
@@ -216,7 +222,10 @@ class TikTokDownloader(VideoDownloader):
         
         if self.custom_base_name:
             # Use custom naming pattern
-            current_counter = self.video_counter - 1  # Adjust for the increment in _get_custom_filename
+            if video_number is None:
+                current_counter = self.video_counter - 1  # Adjust for the increment in _get_custom_filename
+            else:
+                current_counter = video_number
             possible_filename = f"{self.custom_base_name}__{current_counter}.{ext}"
             download_path = str(self.output_dir / possible_filename)
             
@@ -243,37 +252,3 @@ class TikTokDownloader(VideoDownloader):
                             break
         
         return download_path
-    
-    def is_url_already_downloaded(self, url: str, excel_file: Path = None) -> bool:
-        """
-        Check if a TikTok URL has already been downloaded by checking an Excel file.
-        
-        Args:
-            url (str): The TikTok URL to check
-            excel_file (Path): Path to Excel file to check (optional)
-            
-        Returns:
-            bool: True if URL already exists in Excel, False otherwise
-        """
-        if not excel_file or not excel_file.exists():
-            return False
-        
-        try:
-            # Load existing Excel file
-            import openpyxl
-            wb = openpyxl.load_workbook(str(excel_file))
-            ws = wb.active
-            
-            # Check if URL exists in the "Original URL" column (column 16)
-            for row in range(2, ws.max_row + 1):
-                existing_url = ws.cell(row=row, column=16).value
-                if existing_url == url:
-                    wb.close()
-                    return True
-            
-            wb.close()
-            return False
-            
-        except Exception as e:
-            logger.warning(f"Could not check Excel file for existing URL: {e}")
-            return False
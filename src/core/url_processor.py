@@ -34,6 +34,7 @@ class URLProcessor:
     Attributes:
         supported_domains (dict): Dictionary mapping platform names to domain lists
         url_patterns (dict): Dictionary mapping platform names to URL regex patterns
+        _platform_matchers (dict): Precompiled per-platform URL matchers used for batch validation
     """
     
     def __init__(self):
@@ -73,6 +74,16 @@ class URLProcessor:
             'twitter': r'https?://(?:www\.)?(?:twitter\.com|x\.com)/[^\s]+'
         }
         
+        # Precompiled matchers equivalent to validate_url() for a given platform:
+        # a scheme, "://", and one of the platform domains inside the netloc
+        self._platform_matchers = {
+            platform: re.compile(
+                r'^[a-z][a-z0-9+.\-]*://[^/?#]*(?:' + '|'.join(map(re.escape, domains)) + ')',
+                re.IGNORECASE
+            ).match
+            for platform, domains in self.supported_domains.items()
+        }
+        
         logger.info("URLProcessor initialized with support for multiple platforms")
     
     def validate_url(self, url: str, platform: str = None) -> bool:
@@ -154,6 +165,15 @@ class URLProcessor:
             valid_urls = []
             invalid_urls = []
             
+            # Known platform: one precompiled regex match per URL
+            matcher = self._platform_matchers.get(platform.lower()) if platform else None
+            if matcher is not None:
+                for url in map(str.strip, urls):
+                    (valid_urls if matcher(url) else invalid_urls).append(url)
+                
+                logger.info(f"URL validation completed: {len(valid_urls)} valid, {len(invalid_urls)} invalid")
+                return valid_urls, invalid_urls
+            
             for url in urls:
                 try:
                     if self.validate_url(url, platform):
@@ -172,10 +192,8 @@ class URLProcessor:
             return result
             
         except Exception as e:
-            logger.error(f"Error in validate_urls: {str(e)}")
-            logger.error(f"Error type: {type(e)}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            # logger.exception formats the traceback only if a handler emits the record
+            logger.exception(f"Error in validate_urls: {str(e)}")
             # Return empty lists on error
             return [], []
     
@@ -190,24 +208,31 @@ class URLProcessor:
         Returns:
             Tuple[List[str], List[str]]: (valid_urls, invalid_urls)
         """
-        try:
-            if not text:
-                logger.info("Empty text provided to process_batch_text, returning empty lists")
-                return [], []
-            
-            # Split text into lines and then by spaces to handle different formats
-            lines = text.strip().split('\n')
-            urls = []
-            
-            for line in lines:
-                line_urls = line.strip().split()
-                urls.extend(line_urls)
+        if not text:
+            logger.info("Empty text provided to process_batch_text, returning empty lists")
+            return [], []
+        
+        return self.process_batch_list(text.splitlines(), platform)
+    
+    def process_batch_list(self, urls: List[str], platform: str = None) -> Tuple[List[str], List[str]]:
+        """
+        Process a list of URL entries and extract valid URLs.
+        
+        Entries may themselves contain several whitespace-separated URLs.
+        
+        Args:
+            urls (List[str]): URL entries, e.g. lines of batch text
+            platform (str): Platform to validate against (optional)
             
-            # Remove empty strings and duplicates
-            urls = [url.strip() for url in urls if url.strip()]
-            unique_urls = list(dict.fromkeys(urls))  # Preserve order while removing duplicates
+        Returns:
+            Tuple[List[str], List[str]]: (valid_urls, invalid_urls)
+        """
+        try:
+            # Split entries by whitespace (also drops empty strings), then
+            # remove duplicates while preserving order
+            unique_urls = list(dict.fromkeys(part for entry in urls for part in entry.split()))
             
-            logger.info(f"Processed batch text: found {len(unique_urls)} unique URLs")
+            logger.info(f"Processed batch: found {len(unique_urls)} unique URLs")
             
             # Call validate_urls and ensure it returns a tuple
             validation_result = self.validate_urls(unique_urls, platform)
@@ -222,10 +247,8 @@ class URLProcessor:
                 return [], []
                 
         except Exception as e:
-            logger.error(f"Error in process_batch_text: {str(e)}")
-            logger.error(f"Error type: {type(e)}")
-            import traceback
-            logger.error(f"Traceback: {traceback.format_exc()}")
+            # logger.exception formats the traceback only if a handler emits the record
+            logger.exception(f"Error in process_batch_list: {str(e)}")
             # Return empty lists on error
             return [], []
     
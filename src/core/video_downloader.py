@@ -12,7 +12,10 @@ Usage:
 """
 
 import os
+import re
 import logging
+import threading
+import urllib.parse
 import yt_dlp
 from pathlib import Path
 from typing import Optional, Dict, Any, List
@@ -21,6 +24,9 @@ from datetime import datetime
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Characters that are not allowed in file names on common platforms
+_UNSAFE_FILENAME_CHARS_RE = re.compile(r'[<>:"/\\|?*]')
+
 
 class VideoDownloader:
     """
@@ -40,6 +46,7 @@ class VideoDownloader:
         custom_base_name (str): Custom base name for video files
         video_counter (int): Counter for video numbering
         ydl_opts (Dict): yt-dlp configuration options
+        _local (threading.local): Per-thread long-lived yt-dlp instance used for metadata extraction
     """
     
     def __init__(self, output_dir: str = "downloads", quality: str = "best", 
@@ -68,6 +75,17 @@ class VideoDownloader:
         # Configure yt-dlp options
         self.ydl_opts = self._configure_ydl_options()
         
+        # Guards the video counter when videos are downloaded concurrently;
+        # numbers released by downloads that did not happen are reused first
+        self._counter_lock = threading.Lock()
+        self._released_numbers = set()
+        
+        # yt-dlp instances for metadata extraction are created per thread on
+        # first use and kept open so their HTTP connections are reused
+        self._local = threading.local()
+        self._info_ydls = []
+        self._ydl_lock = threading.Lock()
+        
         logger.info(f"VideoDownloader initialized with output_dir: {self.output_dir}, quality: {self.quality}")
     
     def _configure_ydl_options(self) -> Dict[str, Any]:
@@ -127,9 +145,53 @@ class VideoDownloader:
         else:
             return '%(title)s.%(ext)s'
     
+    def reserve_video_number(self) -> Optional[int]:
+        """
+        Reserve the number for the custom file name of a download that is about to start.
+        
+        Used when several videos are downloaded concurrently, so each download
+        knows its file name instead of racing on the shared counter. Numbers
+        handed back with release_video_number() by failed downloads are reused
+        first, so they do not leave gaps in the sequence.
+        
+        Returns:
+            Optional[int]: Reserved number, or None when no custom base name is
+                set (title-based naming)
+        """
+        if not self.custom_base_name:
+            return None
+        
+        with self._counter_lock:
+            if self._released_numbers:
+                number = min(self._released_numbers)
+                self._released_numbers.remove(number)
+                return number
+            number = self.video_counter
+            self.video_counter += 1
+        return number
+    
+    def release_video_number(self, number: Optional[int]):
+        """
+        Hand back a number from reserve_video_number() whose download did not happen.
+        
+        Args:
+            number (Optional[int]): Reserved number (None is ignored)
+        """
+        if number is None:
+            return
+        
+        with self._counter_lock:
+            self._released_numbers.add(number)
+            # Numbers at the top of the range simply rewind the counter
+            while self.video_counter - 1 in self._released_numbers:
+                self.video_counter -= 1
+                self._released_numbers.remove(self.video_counter)
+    
     def reset_video_counter(self):
         """Reset the video counter for new batch downloads."""
-        self.video_counter = self.find_next_video_number()
+        with self._counter_lock:
+            self.video_counter = self.find_next_video_number()
+            self._released_numbers.clear()
         logger.info(f"Video counter reset to: {self.video_counter}")
     
     def find_next_video_number(self) -> int:
@@ -142,15 +204,20 @@ class VideoDownloader:
         if not self.custom_base_name:
             return 1
         
-        # Check existing files in output directory
-        existing_files = list(self.output_dir.glob(f"{self.custom_base_name}__*.*"))
-        if existing_files:
-            max_number = 0
-            for file in existing_files:
-                import re
-                match = re.search(rf'{re.escape(self.custom_base_name)}__(\d+)', file.name)
-                if match:
-                    max_number = max(max_number, int(match.group(1)))
+        # Scan the output directory once, matching names against the pattern directly
+        # (glob would treat characters such as [ in the base name as wildcards)
+        number_re = re.compile(rf'{re.escape(self.custom_base_name)}__(\d+)\.')
+        max_number = 0
+        try:
+            with os.scandir(self.output_dir) as entries:
+                for entry in entries:
+                    match = number_re.match(entry.name)
+                    if match:
+                        max_number = max(max_number, int(match.group(1)))
+        except FileNotFoundError:
+            pass
+        
+        if max_number:
             next_number = max_number + 1
             logger.info(f"Found existing files, next video number: {next_number}")
             return next_number
@@ -173,7 +240,6 @@ class VideoDownloader:
         
         # Basic URL validation
         try:
-            import urllib.parse
             parsed = urllib.parse.urlparse(url.strip())
             return bool(parsed.scheme and parsed.netloc)
         except Exception:
@@ -190,20 +256,49 @@ class VideoDownloader:
             Optional[Dict[str, Any]]: Video information dictionary or None if failed
         """
         try:
-            with yt_dlp.YoutubeDL(self.ydl_opts) as ydl:
-                logger.info(f"Extracting info for: {url}")
-                info = ydl.extract_info(url, download=False)
-                return info
+            logger.info(f"Extracting info for: {url}")
+            return self._get_info_ydl().extract_info(url, download=False)
         except Exception as e:
             logger.error(f"Failed to extract video info: {e}")
             return None
     
-    def download_video(self, url: str) -> bool:
+    def _get_info_ydl(self) -> "yt_dlp.YoutubeDL":
+        """
+        Get the calling thread's yt-dlp instance for metadata extraction, creating it on first use.
+        
+        Returns:
+            yt_dlp.YoutubeDL: Reused yt-dlp instance configured with the current options
+        """
+        ydl = getattr(self._local, 'info_ydl', None)
+        if ydl is None:
+            # YoutubeDL normalizes the dict it is given in place; pass a copy so
+            # self.ydl_opts stays comparable in update_settings()
+            ydl = yt_dlp.YoutubeDL(self.ydl_opts.copy())
+            self._local.info_ydl = ydl
+            with self._ydl_lock:
+                self._info_ydls.append(ydl)
+        return ydl
+    
+    def close(self):
+        """Close the shared yt-dlp instances and release their HTTP connections."""
+        with self._ydl_lock:
+            ydls, self._info_ydls = self._info_ydls, []
+            self._local = threading.local()
+        
+        for ydl in ydls:
+            try:
+                ydl.close()
+            except Exception as e:
+                logger.warning(f"Error closing yt-dlp instance: {e}")
+    
+    def download_video(self, url: str, video_number: Optional[int] = None) -> bool:
         """
         Download a video from the provided URL.
         
         Args:
             url (str): Video URL to download
+            video_number (Optional[int]): Number reserved with reserve_video_number()
+                for the custom file name; the next counter value is used if None
             
         Returns:
             bool: True if download successful, False otherwise
@@ -218,7 +313,12 @@ class VideoDownloader:
             # Create a temporary yt-dlp instance with incrementing filename for actual download
             download_opts = self.ydl_opts.copy()
             if self.custom_base_name:
-                download_opts['outtmpl'] = str(self.output_dir / self._get_custom_filename_with_increment())
+                if video_number is None:
+                    with self._counter_lock:
+                        filename = self._get_custom_filename_with_increment()
+                else:
+                    filename = f"{self.custom_base_name}__{video_number}.%(ext)s"
+                download_opts['outtmpl'] = str(self.output_dir / filename)
             
             with yt_dlp.YoutubeDL(download_opts) as ydl:
                 # Extract info first
@@ -268,12 +368,14 @@ class VideoDownloader:
         
         return results
     
-    def get_download_path(self, info: Dict[str, Any]) -> str:
+    def get_download_path(self, info: Dict[str, Any], video_number: Optional[int] = None) -> str:
         """
         Get the expected download path for a video based on its info.
         
         Args:
             info (Dict[str, Any]): Video information dictionary
+            video_number (Optional[int]): Number the video was downloaded with;
+                defaults to the most recently used counter value
             
         Returns:
             str: Expected download path for the video
@@ -288,15 +390,14 @@ class VideoDownloader:
             # For custom names, we need to find the actual file that was downloaded
             # Since the counter was incremented during download, we need to find the file
             # with the current counter - 1 (since it was incremented after the filename was generated)
-            current_counter = self.video_counter - 1
+            current_counter = self.video_counter - 1 if video_number is None else video_number
             filename = f"{self.custom_base_name}__{current_counter}.{ext}"
             return str(self.output_dir / filename)
         else:
             # For default naming, use the title
             title = info.get('title', 'Unknown')
             # Clean the title for filename
-            import re
-            clean_title = re.sub(r'[<>:"/\\|?*]', '', title)
+            clean_title = _UNSAFE_FILENAME_CHARS_RE.sub('', title)
             filename = f"{clean_title}.{ext}"
             return str(self.output_dir / filename)
     
@@ -329,6 +430,28 @@ class VideoDownloader:
         if custom_base_name is not None:
             self.custom_base_name = custom_base_name
         
-        # Reconfigure yt-dlp options
-        self.ydl_opts = self._configure_ydl_options()
+        ydl_opts = self._configure_ydl_options()
+        if ydl_opts == self.ydl_opts:
+            logger.debug("Downloader settings unchanged, keeping yt-dlp instances")
+            return
+        
+        # The pooled instances only extract metadata, which ignores the output
+        # template, so a template change alone (the video counter moving on
+        # between batches) does not need them rebuilt
+        if self._without_outtmpl(ydl_opts) != self._without_outtmpl(self.ydl_opts):
+            self.close()
+        self.ydl_opts = ydl_opts
         logger.info("Downloader settings updated and yt-dlp options reconfigured")
+    
+    @staticmethod
+    def _without_outtmpl(options: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Copy yt-dlp options without the output template.
+        
+        Args:
+            options (Dict[str, Any]): yt-dlp options
+            
+        Returns:
+            Dict[str, Any]: Options without the 'outtmpl' entry
+        """
+        return {key: value for key, value in options.items() if key != 'outtmpl'}
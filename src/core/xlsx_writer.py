@@ -0,0 +1,218 @@
+"""
+XLSX Row Append Module
+
+This module appends rows to the active worksheet of an existing .xlsx file by
+editing the worksheet XML directly, without loading the workbook into openpyxl.
+New rows are spliced in before </sheetData> as inline-string cells, so the
+shared strings table is left untouched; only the worksheet (and, if needed,
+the styles part) is modified.
+
+A ZIP member cannot grow in place, so the whole archive is recompressed
+member by member into a temporary file next to the original and swapped in
+atomically. An append therefore still costs time proportional to the file
+size; it only avoids openpyxl's parse and re-serialization of every cell.
+
+Usage:
+    from core.xlsx_writer import append_rows
+    
+    append_rows("downloads/videos_metadata.xlsx", [["id1", "Title", ...]])
+"""
+
+import math
+import os
+import re
+import shutil
+import tempfile
+import zipfile
+import xml.etree.ElementTree as ET
+from contextlib import suppress
+from datetime import date, datetime
+from pathlib import Path
+from typing import Any, Iterable, Optional, Sequence, Tuple, Union
+from xml.sax.saxutils import escape
+
+from utils.xlsx_reader import NS_MAIN, active_sheet_path, column_index
+
+# Built-in number format id for '#,##0'
+_THOUSANDS_FORMAT_ID = "3"
+
+# Characters that are not allowed in XML 1.0 documents
+_ILLEGAL_XML_CHARS_RE = re.compile(r"[\x00-\x08\x0b\x0c\x0e-\x1f]")
+
+_LAST_ROW_RE = re.compile(rb'<row\b[^>]*?\br="(\d+)"')
+_DIMENSION_RE = re.compile(rb'<dimension ref="(?:[A-Z]+\d+:)?([A-Z]+)\d+"')
+_CELL_XFS_COUNT_RE = re.compile(rb'(<cellXfs\b[^>]*?\bcount=")(\d+)(")')
+
+
+def column_letter(index: int) -> str:
+    """
+    Convert a 1-based column index to its column letter(s).
+    
+    Args:
+        index (int): 1-based column index
+        
+    Returns:
+        str: Column letter(s), e.g. "A" or "AB"
+    """
+    letters = ""
+    while index > 0:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def _cell_xml(ref: str, value: Any, style: Optional[str]) -> str:
+    """
+    Serialize one cell value as a SpreadsheetML <c> element.
+    
+    Args:
+        ref (str): Cell reference, e.g. "P12"
+        value (Any): Cell value
+        style (Optional[str]): Index into cellXfs, or None for the default style
+        
+    Returns:
+        str: The <c> element, or an empty string for an empty value
+    """
+    if value is None or value == "":
+        return ""
+    
+    style_attr = f' s="{style}"' if style is not None else ""
+    
+    if isinstance(value, bool):
+        return f'<c r="{ref}" t="b"><v>{int(value)}</v></c>'
+    if isinstance(value, int) or (isinstance(value, float) and math.isfinite(value)):
+        return f'<c r="{ref}"{style_attr}><v>{value!r}</v></c>'
+    if isinstance(value, (datetime, date)):
+        value = value.isoformat(sep=" ") if isinstance(value, datetime) else value.isoformat()
+    
+    text = escape(_ILLEGAL_XML_CHARS_RE.sub("", str(value)))
+    return f'<c r="{ref}" t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+
+def _thousands_style(styles: bytes) -> Tuple[str, Optional[bytes]]:
+    """
+    Find (or add) a cell style that only applies the '#,##0' number format.
+    
+    Args:
+        styles (bytes): Contents of xl/styles.xml
+        
+    Returns:
+        Tuple[str, Optional[bytes]]: (cellXfs index, updated styles.xml or None if unchanged)
+    """
+    cell_xfs = ET.fromstring(styles).find(f"{{{NS_MAIN}}}cellXfs")
+    xfs = list(cell_xfs) if cell_xfs is not None else []
+    for index, xf in enumerate(xfs):
+        if (xf.get("numFmtId") == _THOUSANDS_FORMAT_ID
+                and xf.get("fontId", "0") == "0" and xf.get("fillId", "0") == "0"):
+            return str(index), None
+    
+    if cell_xfs is None:
+        raise ValueError("styles.xml has no cellXfs element")
+    
+    new_xf = (f'<xf numFmtId="{_THOUSANDS_FORMAT_ID}" fontId="0" fillId="0" borderId="0" '
+              f'xfId="0" applyNumberFormat="1"/>').encode()
+    end = styles.rindex(b"</cellXfs>")
+    styles = styles[:end] + new_xf + styles[end:]
+    styles = _CELL_XFS_COUNT_RE.sub(
+        lambda m: m.group(1) + str(len(xfs) + 1).encode() + m.group(3), styles, count=1
+    )
+    return str(len(xfs)), styles
+
+
+def append_rows(xlsx_path: Union[str, Path], rows: Iterable[Sequence[Any]],
+                number_columns: Sequence[int] = ()) -> int:
+    """
+    Append rows to the end of the active worksheet of an existing .xlsx file.
+    
+    Args:
+        xlsx_path (Union[str, Path]): Path to the .xlsx file
+        rows (Iterable[Sequence[Any]]): Row values, starting at column A
+        number_columns (Sequence[int]): 1-based columns to format as '#,##0' when non-zero
+        
+    Returns:
+        int: Number of rows appended
+        
+    Raises:
+        zipfile.BadZipFile, KeyError, ValueError, ET.ParseError: If the file is not a workbook
+            this function can append to; the file is left unchanged in that case
+    """
+    rows = list(rows)
+    if not rows:
+        return 0
+    
+    xlsx_path = Path(xlsx_path)
+    replacements = {}
+    
+    temp_name = None
+    try:
+        with zipfile.ZipFile(str(xlsx_path)) as archive:
+            sheet_path = active_sheet_path(archive)
+            sheet = archive.read(sheet_path)
+            
+            # Where the new rows go, and the number of the current last row
+            end = sheet.rfind(b"</sheetData>")
+            if end == -1:
+                empty = sheet.rfind(b"<sheetData/>")
+                if empty == -1:
+                    raise ValueError(f"No sheetData element in {sheet_path}")
+                sheet = sheet[:empty] + b"<sheetData></sheetData>" + sheet[empty + len(b"<sheetData/>"):]
+                end = empty + len(b"<sheetData>")
+            
+            last_row_start = sheet.rfind(b"<row ", 0, end)
+            last_row = 0
+            if last_row_start != -1:
+                match = _LAST_ROW_RE.match(sheet, last_row_start)
+                if match is None:
+                    raise ValueError(f"Last row of {sheet_path} has no row number")
+                last_row = int(match.group(1))
+            
+            number_style = None
+            if number_columns:
+                number_style, styles = _thousands_style(archive.read("xl/styles.xml"))
+                if styles is not None:
+                    replacements["xl/styles.xml"] = styles
+            
+            # Serialize the new rows
+            number_indexes = {col - 1 for col in number_columns}
+            width = max(len(row) for row in rows)
+            letters = [column_letter(col) for col in range(1, width + 1)]
+            parts = []
+            for row_number, row in enumerate(rows, last_row + 1):
+                cells = "".join(
+                    _cell_xml(
+                        f"{letters[index]}{row_number}", value,
+                        number_style if index in number_indexes and value else None
+                    )
+                    for index, value in enumerate(row)
+                )
+                parts.append(f'<row r="{row_number}">{cells}</row>')
+            sheet = sheet[:end] + "".join(parts).encode("utf-8") + sheet[end:]
+            
+            # Grow the used range to cover the new rows
+            dimension = _DIMENSION_RE.search(sheet)
+            if dimension is not None:
+                last_column = column_letter(max(width, column_index(dimension.group(1).decode())))
+                new_ref = f'<dimension ref="A1:{last_column}{last_row + len(rows)}"'.encode()
+                sheet = sheet[:dimension.start()] + new_ref + sheet[dimension.end():]
+            replacements[sheet_path] = sheet
+            
+            # Copy the archive with the updated parts
+            fd, temp_name = tempfile.mkstemp(suffix=".tmp", dir=str(xlsx_path.parent))
+            with os.fdopen(fd, "wb") as temp_file:
+                with zipfile.ZipFile(temp_file, "w") as output:
+                    for item in archive.infolist():
+                        data = replacements.get(item.filename)
+                        output.writestr(item, data if data is not None else archive.read(item))
+        
+        # Swap it in once the original is closed, keeping its permissions
+        # (mkstemp creates the copy as 0600)
+        shutil.copymode(str(xlsx_path), temp_name)
+        os.replace(temp_name, str(xlsx_path))
+    except BaseException:
+        # Leave no temporary copy behind, whether writing or swapping failed
+        if temp_name is not None:
+            with suppress(OSError):
+                os.unlink(temp_name)
+        raise
+    
+    return len(rows)
@@ -7,7 +7,7 @@ Each component is responsible for a specific functionality area.
 
 from .video_url_component import VideoURLComponent
 from .batch_mode_component import BatchModeComponent
-from .download_settings_component import DownloadSettingsComponent
+from .download_settings_component import DownloadSettingsComponent, DownloadSettings
 from .excel_integration_component import ExcelIntegrationComponent
 from .log_component import LogComponent
 
@@ -15,6 +15,7 @@ __all__ = [
     'VideoURLComponent',
     'BatchModeComponent', 
     'DownloadSettingsComponent',
+    'DownloadSettings',
     'ExcelIntegrationComponent',
     'LogComponent',
 ]
@@ -116,7 +116,7 @@ class BatchModeComponent:
             return []
         
         text = self.batch_text.get(1.0, tk.END)
-        urls = [url.strip() for url in text.strip().split('\n') if url.strip()]
+        urls = [url for url in map(str.strip, text.splitlines()) if url]
         return urls
     
     def set_urls(self, urls: List[str]):
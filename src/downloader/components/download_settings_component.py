@@ -18,9 +18,51 @@ Usage:
     settings_component.reset_to_defaults()
 """
 
+import logging
 import tkinter as tk
 from tkinter import ttk, filedialog
-from typing import Dict, Any
+from dataclasses import dataclass, asdict
+from typing import Dict, Any, Optional
+
+# Configure logging
+logger = logging.getLogger(__name__)
+
+
+# Parallel downloads: default and upper bound (kept low to stay friendly to rate limits)
+DEFAULT_CONCURRENCY = 1
+MAX_CONCURRENCY = 8
+
+
+@dataclass(frozen=True)
+class DownloadSettings:
+    """
+    Immutable snapshot of the download settings, taken once per download run.
+    
+    Attributes:
+        output_dir (str): Output directory path
+        quality (str): Video quality selection
+        custom_base_name (Optional[str]): Custom base name for files, or None
+        extract_audio (bool): Whether to extract audio only
+        add_metadata (bool): Whether to add metadata to downloaded files
+        export_to_excel (bool): Whether to export metadata to Excel
+        concurrency (int): Number of parallel downloads
+    """
+    output_dir: str
+    quality: str
+    custom_base_name: Optional[str]
+    extract_audio: bool
+    add_metadata: bool
+    export_to_excel: bool
+    concurrency: int
+    
+    def as_dict(self) -> Dict[str, Any]:
+        """
+        Convert the settings to keyword arguments for DownloadManager.update_settings.
+        
+        Returns:
+            Dict[str, Any]: Dictionary containing all settings
+        """
+        return asdict(self)
 
 
 class DownloadSettingsComponent:
@@ -38,6 +80,7 @@ class DownloadSettingsComponent:
         audio_only_var (tk.BooleanVar): Variable to store audio-only flag
         metadata_var (tk.BooleanVar): Variable to store metadata flag
         excel_export_var (tk.BooleanVar): Variable to store Excel export flag
+        concurrency_var (tk.IntVar): Variable to store the number of parallel downloads
         frame (ttk.LabelFrame): Main frame containing all settings widgets
     """
     
@@ -59,6 +102,7 @@ class DownloadSettingsComponent:
         self.audio_only_var = tk.BooleanVar()
         self.metadata_var = tk.BooleanVar(value=False)  # Changed to False by default
         self.excel_export_var = tk.BooleanVar(value=True)
+        self.concurrency_var = tk.IntVar(value=DEFAULT_CONCURRENCY)
         
         self.frame = None
         
@@ -77,6 +121,7 @@ class DownloadSettingsComponent:
             self.audio_only_var.trace_add("write", self._on_setting_changed)
             self.metadata_var.trace_add("write", self._on_setting_changed)
             self.excel_export_var.trace_add("write", self._on_setting_changed)
+            self.concurrency_var.trace_add("write", self._on_setting_changed)
     
     def _on_setting_changed(self, *args):
         """Callback when any setting changes."""
@@ -85,8 +130,6 @@ class DownloadSettingsComponent:
                 self.on_settings_changed()
             except Exception as e:
                 # Log error but don't crash the application
-                import logging
-                logger = logging.getLogger(__name__)
                 logger.error(f"Error in settings change callback: {e}")
     
     def _create_widgets(self):
@@ -130,6 +173,18 @@ class DownloadSettingsComponent:
         excel_check = ttk.Checkbutton(self.frame, text="Export to Excel", variable=self.excel_export_var)
         excel_check.grid(row=3, column=2, sticky=tk.W, padx=(10, 0), pady=(0, 5))
         
+        # Parallel downloads
+        ttk.Label(self.frame, text="Parallel Downloads:").grid(row=4, column=0, sticky=tk.W, pady=(0, 5))
+        concurrency_spinbox = ttk.Spinbox(
+            self.frame,
+            textvariable=self.concurrency_var,
+            from_=1,
+            to=MAX_CONCURRENCY,
+            width=5,
+            state="readonly"
+        )
+        concurrency_spinbox.grid(row=4, column=1, sticky=tk.W, padx=(10, 0), pady=(0, 5))
+        
         # Configure grid weights for proper expansion
         self.frame.columnconfigure(1, weight=1)
     
@@ -151,14 +206,25 @@ class DownloadSettingsComponent:
         Returns:
             Dict[str, Any]: Dictionary containing all current settings
         """
-        return {
-            'output_dir': self.output_dir_var.get(),
-            'quality': self.quality_var.get(),
-            'custom_base_name': self.custom_name_var.get().strip() if self.custom_name_var.get().strip() else None,
-            'extract_audio': self.audio_only_var.get(),
-            'add_metadata': self.metadata_var.get(),
-            'export_to_excel': self.excel_export_var.get()
-        }
+        return self.get_download_settings().as_dict()
+    
+    def get_download_settings(self) -> DownloadSettings:
+        """
+        Get all current download settings as an immutable snapshot.
+        
+        Returns:
+            DownloadSettings: Current settings
+        """
+        custom_base_name = self.custom_name_var.get().strip()
+        return DownloadSettings(
+            output_dir=self.output_dir_var.get(),
+            quality=self.quality_var.get(),
+            custom_base_name=custom_base_name or None,
+            extract_audio=self.audio_only_var.get(),
+            add_metadata=self.metadata_var.get(),
+            export_to_excel=self.excel_export_var.get(),
+            concurrency=self.get_concurrency()
+        )
     
     def update_settings(self, **kwargs):
         """
@@ -184,6 +250,9 @@ class DownloadSettingsComponent:
         
         if 'export_to_excel' in kwargs:
             self.excel_export_var.set(kwargs['export_to_excel'])
+        
+        if 'concurrency' in kwargs:
+            self.concurrency_var.set(kwargs['concurrency'])
     
     def reset_to_defaults(self):
         """Reset all settings to their default values."""
@@ -193,6 +262,7 @@ class DownloadSettingsComponent:
         self.audio_only_var.set(False)
         self.metadata_var.set(False)  # Updated to False by default
         self.excel_export_var.set(True)
+        self.concurrency_var.set(DEFAULT_CONCURRENCY)
     
     def validate_settings(self) -> tuple[bool, str]:
         """
@@ -210,6 +280,13 @@ class DownloadSettingsComponent:
         if quality not in valid_qualities:
             return False, f"Invalid quality: {quality}. Must be one of {valid_qualities}"
         
+        try:
+            concurrency = self.concurrency_var.get()
+        except tk.TclError:
+            return False, "Parallel downloads must be a number"
+        if not 1 <= concurrency <= MAX_CONCURRENCY:
+            return False, f"Parallel downloads must be between 1 and {MAX_CONCURRENCY}"
+        
         return True, ""
     
     def get_output_directory(self) -> str:
@@ -266,6 +343,19 @@ class DownloadSettingsComponent:
         """
         return self.excel_export_var.get()
     
+    def get_concurrency(self) -> int:
+        """
+        Get the number of videos to download in parallel.
+        
+        Returns:
+            int: Parallel downloads, clamped to 1..MAX_CONCURRENCY
+        """
+        try:
+            concurrency = self.concurrency_var.get()
+        except tk.TclError:
+            return 1
+        return max(1, min(MAX_CONCURRENCY, concurrency))
+    
     def get_widget(self) -> ttk.LabelFrame:
         """
         Get the main frame widget for this component.
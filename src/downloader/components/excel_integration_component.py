@@ -22,7 +22,7 @@ Usage:
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox
 import os
-from typing import List, Optional, Callable
+from typing import List, Optional, Callable, Tuple
 
 
 class ExcelIntegrationComponent:
@@ -41,9 +41,12 @@ class ExcelIntegrationComponent:
         excel_status_var (tk.StringVar): Variable to store Excel status messages
         frame (ttk.LabelFrame): Main frame containing all Excel-related widgets
         on_url_validation (Callable): Callback function for URL validation
+        on_batch_validation (Callable): Callback validating a list of URLs in one call,
+            returning (valid_urls, invalid_urls)
     """
     
-    def __init__(self, parent: tk.Widget, excel_loader, on_url_validation: Optional[Callable] = None):
+    def __init__(self, parent: tk.Widget, excel_loader, on_url_validation: Optional[Callable] = None,
+                 on_batch_validation: Optional[Callable] = None):
         """
         Initialize the ExcelIntegrationComponent.
         
@@ -51,10 +54,13 @@ class ExcelIntegrationComponent:
             parent (tk.Widget): Parent widget to contain this component
             excel_loader: Excel loader utility for file operations
             on_url_validation (Callable, optional): Callback function for URL validation
+            on_batch_validation (Callable, optional): Callback validating a list of URLs,
+                preferred over on_url_validation when given
         """
         self.parent = parent
         self.excel_loader = excel_loader
         self.on_url_validation = on_url_validation
+        self.on_batch_validation = on_batch_validation
         
         # Initialize variables
         self.excel_file_var = tk.StringVar()
@@ -63,6 +69,8 @@ class ExcelIntegrationComponent:
         
         self.frame = None
         self.url_column_combo = None
+        self.download_btn = None
+        self.process_existing_btn = None
         
         self._create_widgets()
         self._setup_layout()
@@ -89,8 +97,10 @@ class ExcelIntegrationComponent:
         
         ttk.Button(excel_button_frame, text="Load Columns", command=self._load_excel_columns).pack(side=tk.LEFT, padx=(0, 10))
         ttk.Button(excel_button_frame, text="Preview URLs", command=self._preview_excel_urls).pack(side=tk.LEFT, padx=(0, 10))
-        ttk.Button(excel_button_frame, text="Download from Excel", command=self._start_excel_download).pack(side=tk.LEFT, padx=(0, 10))
-        ttk.Button(excel_button_frame, text="Process Existing", command=self._process_existing_downloads).pack(side=tk.LEFT)
+        self.download_btn = ttk.Button(excel_button_frame, text="Download from Excel", command=self._start_excel_download)
+        self.download_btn.pack(side=tk.LEFT, padx=(0, 10))
+        self.process_existing_btn = ttk.Button(excel_button_frame, text="Process Existing", command=self._process_existing_downloads)
+        self.process_existing_btn.pack(side=tk.LEFT)
         
         # Excel status
         ttk.Label(self.frame, textvariable=self.excel_status_var, foreground="blue").grid(row=3, column=0, columnspan=3, pady=(5, 0))
@@ -112,7 +122,7 @@ class ExcelIntegrationComponent:
         file_path = filedialog.askopenfilename(
             title="Select Excel File",
             filetypes=[
-                ("Excel files", "*.xlsx *.xls"),
+                ("Excel files", "*.xlsx *.xlsm *.xlsb *.xls"),
                 ("All files", "*.*")
             ]
         )
@@ -162,18 +172,21 @@ class ExcelIntegrationComponent:
             return
         
         try:
-            # Use Excel loader to get preview
-            preview_text = self.excel_loader.get_excel_preview(excel_path, url_column, max_preview=5)
+            # Read the column once for both the preview and the validation info
+            data = self.excel_loader.extract_data_from_column(excel_path, url_column)
+            preview_text = self.excel_loader.format_preview(data, url_column, max_preview=5)
             
             # Get valid URLs for additional info if validation callback is available
-            if self.on_url_validation:
-                urls = self.excel_loader.extract_urls_from_column(excel_path, url_column, self.on_url_validation)
-                valid_urls = [url for url in urls if self.on_url_validation(url)]
+            if self.on_batch_validation or self.on_url_validation:
+                urls = [url for url in data if url]
+                valid_urls, _ = self._validate_urls(urls)
                 
                 # Enhance preview with validation info
-                enhanced_preview = f"Total URLs in column '{url_column}': {len(urls)}\n"
-                enhanced_preview += f"Valid TikTok URLs: {len(valid_urls)}\n\n"
-                enhanced_preview += preview_text
+                enhanced_preview = (
+                    f"Total URLs in column '{url_column}': {len(urls)}\n"
+                    f"Valid TikTok URLs: {len(valid_urls)}\n\n"
+                    f"{preview_text}"
+                )
                 
                 messagebox.showinfo("URL Preview", enhanced_preview)
             else:
@@ -250,7 +263,10 @@ class ExcelIntegrationComponent:
         
         try:
             # Use Excel loader to extract URLs with validation if available
-            if self.on_url_validation:
+            if self.on_batch_validation:
+                urls = self.excel_loader.extract_urls_from_column(excel_path, url_column)
+                urls, _ = self._validate_urls(urls)
+            elif self.on_url_validation:
                 urls = self.excel_loader.extract_urls_from_column(
                     excel_path, 
                     url_column, 
@@ -265,6 +281,27 @@ class ExcelIntegrationComponent:
             self.excel_status_var.set(f"Error reading Excel file: {str(e)}")
             return []
     
+    def _validate_urls(self, urls: List[str]) -> Tuple[List[str], List[str]]:
+        """
+        Split URLs into valid and invalid ones using the validation callbacks.
+        
+        Args:
+            urls (List[str]): URLs to validate
+            
+        Returns:
+            Tuple[List[str], List[str]]: (valid_urls, invalid_urls), stripped
+        """
+        urls = [url.strip() for url in urls]
+        
+        if self.on_batch_validation:
+            return self.on_batch_validation(urls)
+        
+        valid_urls = []
+        invalid_urls = []
+        for url in urls:
+            (valid_urls if self.on_url_validation(url) else invalid_urls).append(url)
+        return valid_urls, invalid_urls
+    
     def is_file_selected(self) -> bool:
         """
         Check if an Excel file is selected.
@@ -358,6 +395,17 @@ class ExcelIntegrationComponent:
         if on_process_existing:
             self.on_process_existing = on_process_existing
     
+    def set_download_enabled(self, enabled: bool):
+        """
+        Enable or disable the buttons that start background work.
+        
+        Args:
+            enabled (bool): Whether the buttons should accept clicks
+        """
+        state = ['!disabled'] if enabled else ['disabled']
+        self.download_btn.state(state)
+        self.process_existing_btn.state(state)
+    
     def get_widget(self) -> ttk.LabelFrame:
         """
         Get the main frame widget for this component.
@@ -11,6 +11,9 @@ Usage:
     # Add log message
     log_component.log_message("Download started", "INFO")
     
+    # Add several log messages at once
+    log_component.log_messages_bulk(["URL 1: ...", "URL 2: ..."], "INFO")
+    
     # Clear log
     log_component.clear_log()
     
@@ -22,7 +25,8 @@ import tkinter as tk
 from tkinter import ttk
 import datetime
 import queue
-from typing import Optional
+from collections import deque
+from typing import List, Optional
 
 
 class LogComponent:
@@ -38,9 +42,14 @@ class LogComponent:
         status_var (tk.StringVar): Variable to store current status
         progress_bar (ttk.Progressbar): Progress bar for download operations
         message_queue (queue.Queue): Queue for thread-safe message updates
+        _wakeup_callback (callable): Optional callback invoked after a message is queued
+        max_lines (int): Maximum number of lines kept in the log; older lines are dropped
         frame (ttk.LabelFrame): Main frame containing all log-related widgets
     """
     
+    # Default number of log lines kept, so long runs use bounded memory
+    DEFAULT_MAX_LINES = 2000
+    
     def __init__(self, parent: tk.Widget):
         """
         Initialize the LogComponent.
@@ -53,6 +62,8 @@ class LogComponent:
         # Initialize variables
         self.status_var = tk.StringVar(value="Ready")
         self.message_queue = queue.Queue()
+        self._wakeup_callback = None
+        self.max_lines = self.DEFAULT_MAX_LINES
         
         self.frame = None
         self.log_text = None
@@ -78,17 +89,19 @@ class LogComponent:
             row=1, column=0, columnspan=2, pady=(0, 10)
         )
         
-        # Log area
-        self.log_text = tk.Text(self.frame, height=10, width=80)
+        # Log area (no undo stack and no line wrapping, so inserts stay cheap)
+        self.log_text = tk.Text(self.frame, height=10, width=80, undo=False, wrap='none')
         log_scrollbar = ttk.Scrollbar(self.frame, orient=tk.VERTICAL, command=self.log_text.yview)
-        self.log_text.configure(yscrollcommand=log_scrollbar.set)
+        log_hscrollbar = ttk.Scrollbar(self.frame, orient=tk.HORIZONTAL, command=self.log_text.xview)
+        self.log_text.configure(yscrollcommand=log_scrollbar.set, xscrollcommand=log_hscrollbar.set)
         
         self.log_text.grid(row=2, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         log_scrollbar.grid(row=2, column=1, sticky=(tk.N, tk.S))
+        log_hscrollbar.grid(row=3, column=0, sticky=(tk.W, tk.E))
         
         # Control buttons
         control_frame = ttk.Frame(self.frame)
-        control_frame.grid(row=3, column=0, columnspan=2, pady=(10, 0))
+        control_frame.grid(row=4, column=0, columnspan=2, pady=(10, 0))
         
         ttk.Button(control_frame, text="Clear Log", command=self.clear_log).pack(side=tk.LEFT)
         ttk.Button(control_frame, text="Copy Log", command=self.copy_log).pack(side=tk.LEFT, padx=(10, 0))
@@ -113,14 +126,26 @@ class LogComponent:
         Process messages from the queue (thread-safe).
         
         This method should be called periodically by the parent GUI to process
-        queued log messages in a thread-safe manner.
+        queued log messages in a thread-safe manner. All pending messages are
+        written to the text widget with a single insert.
         """
+        messages = []
         try:
             while True:
-                message = self.message_queue.get_nowait()
-                self._add_message_direct(message)
+                messages.append(self.message_queue.get_nowait())
         except queue.Empty:
             pass
+        
+        if messages:
+            text = "".join(messages)
+            
+            # Keep only the newest max_lines lines of a large burst, so lines
+            # are not inserted into the widget just to be trimmed again
+            if text.count("\n") > self.max_lines:
+                text = "".join(deque(text.splitlines(keepends=True), maxlen=self.max_lines))
+                self.log_text.delete("1.0", tk.END)
+            
+            self._add_message_direct(text)
     
     def _add_message_direct(self, message: str):
         """
@@ -130,8 +155,14 @@ class LogComponent:
             message (str): Message to add
         """
         self.log_text.insert(tk.END, message)
+        self._trim_to_max_lines()
         self.log_text.see(tk.END)
-        self.log_text.update_idletasks()
+    
+    def _trim_to_max_lines(self):
+        """Drop the oldest lines when the log holds more than max_lines lines."""
+        excess = self.get_log_line_count() - self.max_lines
+        if excess > 0:
+            self.log_text.delete("1.0", f"{excess + 1}.0")
     
     def log_message(self, message: str, level: str = "INFO"):
         """
@@ -146,6 +177,42 @@ class LogComponent:
         
         # Add to queue for thread-safe update
         self.message_queue.put(formatted_message)
+        self._notify()
+    
+    def log_messages_bulk(self, messages: List[str], level: str = "INFO"):
+        """
+        Add several messages to the log as a single queued update.
+        
+        Each message gets its own timestamped line, but the lines are inserted
+        into the text widget with one call.
+        
+        Args:
+            messages (List[str]): The messages to log
+            level (str): Log level applied to every message
+        """
+        if not messages:
+            return
+        
+        prefix = f"[{datetime.datetime.now().strftime('%H:%M:%S')}] {level}: "
+        self.message_queue.put("".join(f"{prefix}{message}\n" for message in messages))
+        self._notify()
+    
+    def set_wakeup_callback(self, callback):
+        """
+        Set a callback invoked (from any thread) after a message is queued.
+        
+        The parent GUI uses this to process messages as soon as they arrive
+        instead of polling the queue.
+        
+        Args:
+            callback (callable): Thread-safe function taking no arguments, or None
+        """
+        self._wakeup_callback = callback
+    
+    def _notify(self):
+        """Invoke the wakeup callback, if one is set."""
+        if self._wakeup_callback is not None:
+            self._wakeup_callback()
     
     def set_status(self, status: str, is_error: bool = False):
         """
@@ -281,11 +348,10 @@ class LogComponent:
         Args:
             max_lines (int): Maximum number of lines to keep
         """
-        current_lines = self.get_log_line_count()
-        if current_lines > max_lines:
-            # Remove oldest lines
-            lines_to_remove = current_lines - max_lines
-            self.log_text.delete("1.0", f"{lines_to_remove + 1}.0")
+        self.max_lines = max(1, max_lines)
+        
+        # Remove oldest lines
+        self._trim_to_max_lines()
     
     def get_widget(self) -> ttk.LabelFrame:
         """
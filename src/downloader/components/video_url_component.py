@@ -146,6 +146,15 @@ class VideoURLComponent:
         """
         return not bool(self.get_url())
     
+    def set_download_enabled(self, enabled: bool):
+        """
+        Enable or disable the download button.
+        
+        Args:
+            enabled (bool): Whether the button should accept clicks
+        """
+        self.download_btn.state(['!disabled'] if enabled else ['disabled'])
+    
     def get_widget(self) -> ttk.LabelFrame:
         """
         Get the main frame widget for this component.
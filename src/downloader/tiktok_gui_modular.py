@@ -15,73 +15,206 @@ Usage:
 """
 
 import tkinter as tk
-from tkinter import ttk, messagebox
+from tkinter import ttk
+import atexit
+import importlib
+import itertools
+import multiprocessing
+import queue
 import threading
 import os
+import re
+import sys
+import traceback
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
-# Import our modular components
-try:
-    from .components import (
-        VideoURLComponent,
-        BatchModeComponent,
-        DownloadSettingsComponent,
-        ExcelIntegrationComponent,
-        LogComponent
-    )
-except ImportError:
-    try:
-        from components import (
-            VideoURLComponent,
-            BatchModeComponent,
-            DownloadSettingsComponent,
-            ExcelIntegrationComponent,
-            LogComponent
-        )
-    except ImportError:
-        # Fallback for when running the file directly
-        import sys
-        import os
-        sys.path.append(os.path.join(os.path.dirname(__file__), 'components'))
-        from components import (
-            VideoURLComponent,
-            BatchModeComponent,
-            DownloadSettingsComponent,
-            ExcelIntegrationComponent,
-            LogComponent
-        )
+def _import_first(*module_names: str):
+    """
+    Import the first resolvable module among package-relative and top-level names.
+    
+    Relative names are tried only when this file is imported as part of a
+    package. If nothing resolves (the file is run directly), the parent
+    directory is added to sys.path once and the top-level names are retried.
+    
+    Args:
+        *module_names (str): Candidate module names, e.g. '..core', 'core'
+        
+    Returns:
+        module: The first module that imported successfully
+        
+    Raises:
+        ImportError: If none of the candidates can be imported
+    """
+    for name in module_names:
+        if name.startswith('.') and not __package__:
+            continue
+        try:
+            return importlib.import_module(name, __package__)
+        except ImportError:
+            continue
+    
+    # Fallback for when running the file directly
+    parent_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), '..')
+    if parent_dir not in sys.path:
+        sys.path.append(parent_dir)
+    return importlib.import_module(next(n for n in module_names if not n.startswith('.')))
 
-# Import core functionality
-try:
-    from ..core import DownloadManager
-except ImportError:
-    try:
-        from core import DownloadManager
-    except ImportError:
-        # Fallback for when running the file directly
-        import sys
-        import os
-        sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-        from core import DownloadManager
 
-# Import Excel utilities
-try:
-    from ..utils.excel_loader import ExcelLoader
-except ImportError:
-    try:
-        from utils.excel_loader import ExcelLoader
-    except ImportError:
-        # Fallback for when running the file directly
-        import sys
-        import os
-        sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
-        from utils.excel_loader import ExcelLoader
+# Import our modular components
+_components = _import_first('.components', 'components')
+VideoURLComponent = _components.VideoURLComponent
+BatchModeComponent = _components.BatchModeComponent
+DownloadSettingsComponent = _components.DownloadSettingsComponent
+DownloadSettings = _components.DownloadSettings
+ExcelIntegrationComponent = _components.ExcelIntegrationComponent
+LogComponent = _components.LogComponent
 
 # Configure logging
 import logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
+logger.addHandler(logging.NullHandler())
+
+
+def configure_logging(level: int = logging.INFO):
+    """
+    Configure console logging for the application (called by the entry points).
+    
+    Handlers are only installed if the root logger has none yet, and yt-dlp's
+    per-fragment messages are limited to warnings.
+    
+    Args:
+        level (int): Root logging level (default: logging.INFO)
+    """
+    if not logging.getLogger().handlers:
+        logging.basicConfig(level=level)
+    logging.getLogger('yt_dlp').setLevel(logging.WARNING)
+
+# Initial DownloadManager settings, shared by the GUI and the download process
+_MANAGER_DEFAULTS = {
+    'output_dir': "downloads",
+    'quality': "best",
+    'extract_audio': False,
+    'add_metadata': False,  # Changed to False by default
+    'custom_base_name': "tiktok_video",  # Added default custom name
+    'platform': "tiktok",
+}
+
+
+def _download_process_main(jobs, events):
+    """
+    Entry point of the download worker process.
+    
+    Runs download jobs one at a time with a DownloadManager that lives as long
+    as the process, so its start-up cost is paid once. Log lines, progress and
+    completion are reported to the GUI as (kind, args) tuples.
+    
+    Args:
+        jobs (multiprocessing.Queue): Queue of (urls, source, settings, debug) jobs;
+            None stops the process
+        events (multiprocessing.Queue): Queue receiving events for the GUI
+    """
+    # A spawned process starts without the parent's logging configuration
+    configure_logging()
+    manager = _import_first('..core', 'core').DownloadManager(**_MANAGER_DEFAULTS)
+    
+    while True:
+        job = jobs.get()
+        if job is None:
+            break
+        
+        try:
+            _run_download_job(manager, events, *job)
+        finally:
+            events.put(("finished", ()))
+    
+    manager.cleanup()
+
+
+def _run_download_job(manager, events, urls: List[str], source: str,
+                      settings: DownloadSettings, debug: bool):
+    """
+    Download a batch of URLs inside the download worker process.
+    
+    Args:
+        manager (DownloadManager): Download manager owned by the worker process
+        events (multiprocessing.Queue): Queue receiving events for the GUI
+        urls (List[str]): URLs to download
+        source (str): Where the URLs came from ("Excel", "Single URL", ...)
+        settings (DownloadSettings): Download settings captured when the download started
+        debug (bool): Whether to report full tracebacks
+    """
+    def log(message: str, level: str = "INFO"):
+        events.put(("log", (message, level)))
+    
+    try:
+        log(f"Download settings: {settings}", "INFO")
+        
+        # Update download manager settings
+        manager.update_settings(**settings.as_dict())
+        
+        log(f"Starting download of {len(urls)} video(s) from {source}")
+        log(f"Output directory: {manager.output_dir}")
+        log(f"Quality: {manager.quality}")
+        log(f"Platform: {manager.platform}")
+        
+        # Log each URL being processed
+        events.put(("log_bulk", ([f"URL {i}: {url}" for i, url in enumerate(urls, 1)], "INFO")))
+        
+        # Use different download method based on source and settings
+        # Always use Excel-optimized method when export_to_excel is enabled
+        # or when the source is explicitly Excel
+        use_excel_method = (source == "Excel" or settings.export_to_excel)
+        
+        log(f"Source: {source}, Export to Excel: {settings.export_to_excel}", "INFO")
+        log(f"Using Excel method: {use_excel_method}", "INFO")
+        
+        if use_excel_method:
+            # Use the new Excel-specific method for better metadata handling
+            log("Using Excel-optimized download method...", "INFO")
+            
+            # Create a progress callback for Excel downloads
+            def progress_callback(current: int, total: int, video_title: str = ""):
+                events.put(("progress", (current, total, video_title)))
+            
+            # Pass the progress callback to the download method
+            results = manager.download_videos_from_excel(
+                urls, 
+                export_to_excel=settings.export_to_excel,
+                progress_callback=progress_callback
+            )
+        else:
+            # Use the standard method for other sources
+            log("Using standard download method...", "INFO")
+            results = manager.download_multiple_videos(
+                urls, 
+                export_to_excel=settings.export_to_excel
+            )
+        
+        log(f"Download results: {results}", "INFO")
+        
+        # Log results
+        log(
+            f"Download completed: {results['successful']}/{results['valid_urls']} successful", 
+            "SUCCESS"
+        )
+        
+        if settings.export_to_excel and results['excel_file']:
+            log(f"Excel file saved: {results['excel_file']}", "SUCCESS")
+        
+        # Update Excel integration component status if it was an Excel download
+        if source == "Excel":
+            events.put(("excel_status", (
+                f"Download completed: {results['successful']}/{results['valid_urls']} videos processed successfully",
+            )))
+        
+    except Exception as e:
+        log(f"Unexpected error: {str(e)}", "ERROR")
+        log(f"Error type: {type(e)}", "ERROR")
+        if debug:
+            log(f"Traceback: {traceback.format_exc()}", "ERROR")
 
 
 class TikTokDownloaderModularGUI:
@@ -94,12 +227,34 @@ class TikTokDownloaderModularGUI:
     
     Attributes:
         root (tk.Tk): Main tkinter window
+        style (ttk.Style): Shared ttk style for the application
         download_manager (DownloadManager): Core download manager instance
         excel_loader (ExcelLoader): Excel loader utility
         components (dict): Dictionary containing all GUI components
-        download_thread (threading.Thread): Thread for download operations
+        c_url, c_batch, c_settings, c_excel, c_log: Direct references to the
+            video URL, batch mode, download settings, Excel integration and log components
+        _executor (ThreadPoolExecutor): Single background worker reused for the application lifetime
+        _future (Future): Most recent task submitted to the background worker
+        _download_active (bool): Whether a download is currently running
+        _download_process (multiprocessing.Process): Worker process running the downloads
+        _ui_queue (queue.Queue): Widget updates posted by worker threads for the Tk thread
     """
     
+    # TikTok URL pattern used when the URL processor result cannot be used
+    _TT_RE = re.compile(
+        r"^https?://(?:www\.|vm\.|vt\.|m\.)?tiktok\.com/\S+$",
+        re.IGNORECASE
+    )
+    
+    # Maximum number of invalid URLs listed individually in the log
+    _MAX_LOGGED_INVALID = 20
+    
+    # Minimum interval between writes to the log widget, in milliseconds
+    LOG_FLUSH_MS = 50
+    
+    # How long to wait for the download process to shut down on exit, in seconds
+    PROCESS_STOP_TIMEOUT = 5.0
+    
     def __init__(self):
         """Initialize the modular GUI application."""
         self.root = tk.Tk()
@@ -107,40 +262,101 @@ class TikTokDownloaderModularGUI:
         self.root.geometry("900x700")
         self.root.resizable(True, True)
         
-        # Initialize core components
-        self.download_manager = DownloadManager(
-            output_dir="downloads",
-            quality="best",
-            extract_audio=False,
-            add_metadata=False,  # Changed to False by default
-            custom_base_name="tiktok_video",  # Added default custom name
-            platform="tiktok"
-        )
-        
-        self.excel_loader = ExcelLoader()
+        # Configure ttk styles once, before any widget references them
+        self._setup_styles()
         
         # Initialize GUI components
         self.components = {}
-        self.download_thread = None
+        
+        # Background work runs on one worker thread reused for the application lifetime
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="dl")
+        self._future = None
+        atexit.register(self._executor.shutdown, wait=False, cancel_futures=True)
+        self._download_lock = threading.Lock()
+        self._download_active = False
+        
+        # Downloads run in a separate, reused worker process (started on demand)
+        self._download_process = None
+        self._download_jobs = None
+        
+        # Download settings snapshot, invalidated whenever a setting changes
+        self._settings_cache: Optional[DownloadSettings] = None
+        
+        # Full tracebacks are written to the log only when debugging is enabled
+        self._debug = (
+            os.environ.get("TIKTOK_GUI_DEBUG") == "1"
+            or bool(os.environ.get("TIKTOK_DEBUG"))
+        )
+        
+        # Widget updates requested by worker threads, run on the Tk thread
+        self._ui_queue = queue.Queue()
+        
+        # Pending after() token for the debounced scroll region update
+        self._scrollregion_after = None
+        
+        # Pending after() token for the batched log flush
+        self._log_flush_after = None
         
         # Create GUI elements
         self._create_widgets()
         self._setup_layout()
         self._setup_callbacks()
         
-        # Start message processing
-        self.root.after(100, self._process_messages)
+        # Re-enable geometry propagation and lay out all components in one pass
+        self.content_frame.grid_propagate(True)
+        self.content_frame.update_idletasks()
+        
+        # Start message processing: event-driven where Tk supports file
+        # handlers, polling otherwise
+        self._wakeup_fds = None
+        self._wakeup_lock = threading.Lock()
+        if not self._setup_message_wakeup():
+            self.root.after(100, self._process_messages)
         
-        # Update Excel file status display
-        self._update_excel_file_status()
+        # Update Excel file status display once the window has been drawn;
+        # this is the first use of the core package
+        self.root.after_idle(self._update_excel_file_status)
         
         logger.info("TikTok Downloader Modular GUI initialized")
     
+    @cached_property
+    def download_manager(self):
+        """
+        Core download manager, created (and the core package imported) on first use.
+        
+        Returns:
+            DownloadManager: Download manager configured with the initial settings
+        """
+        manager = _import_first('..core', 'core').DownloadManager(**_MANAGER_DEFAULTS)
+        
+        # Release pooled yt-dlp connections and the workbook on exit
+        atexit.register(manager.cleanup)
+        return manager
+    
+    @cached_property
+    def excel_loader(self):
+        """
+        Excel loader utility, created (and openpyxl imported) on first use.
+        
+        Returns:
+            ExcelLoader: Excel loader utility
+        """
+        return _import_first('..utils.excel_loader', 'utils.excel_loader').ExcelLoader()
+    
+    def _setup_styles(self):
+        """Create the shared ttk style and configure the custom styles used by the widgets."""
+        self.style = ttk.Style(self.root)
+        self.style.configure('Title.TLabel', font=('TkDefaultFont', 14, 'bold'))
+    
     def _create_widgets(self):
         """Create all GUI widgets and components with scrollable functionality."""
         # Create main scrollable frame
         self._create_scrollable_frame()
         
+        # Suspend geometry propagation while the components are added so the
+        # content frame is not re-measured after every grid() call
+        self.content_frame.grid_propagate(False)
+        
         # Title and control buttons
         title_frame = ttk.Frame(self.content_frame)
         title_frame.grid(row=0, column=0, columnspan=2, pady=(0, 20), sticky=(tk.W, tk.E))
@@ -190,7 +406,10 @@ class TikTokDownloaderModularGUI:
         self.main_container.grid(row=0, column=0, sticky=(tk.W, tk.E, tk.N, tk.S))
         
         # Create canvas for scrolling
-        self.canvas = tk.Canvas(self.main_container, bg='white')
+        # No focus ring or border: keyboard scrolling is bound on the root window
+        self.canvas = tk.Canvas(
+            self.main_container, bg='white', highlightthickness=0, bd=0, takefocus=0
+        )
         
         # Create scrollbars
         self.v_scrollbar = ttk.Scrollbar(self.main_container, orient="vertical", command=self.canvas.yview)
@@ -233,29 +452,16 @@ class TikTokDownloaderModularGUI:
         - Handle mouse wheel scrolling
         - Resize canvas window when main window is resized
         """
-        # Bind mouse wheel scrolling with better cross-platform support
-        self.canvas.bind("<MouseWheel>", self._on_mousewheel)
-        self.canvas.bind("<Button-4>", self._on_mousewheel)
-        self.canvas.bind("<Button-5>", self._on_mousewheel)
-        
-        # Bind to the content frame as well for better coverage
-        self.content_frame.bind("<MouseWheel>", self._on_mousewheel)
-        self.content_frame.bind("<Button-4>", self._on_mousewheel)
-        self.content_frame.bind("<Button-5>", self._on_mousewheel)
+        # Bind mouse wheel scrolling using the handler for the current platform
+        self._mousewheel_handler, self._mousewheel_events = self._get_mousewheel_binding()
+        for widget in (self.canvas, self.content_frame, self.v_scrollbar,
+                       self.h_scrollbar, self.main_container):
+            self._bind_mousewheel(widget)
         
         # Bind window resize events
         self.content_frame.bind("<Configure>", self._on_frame_configure)
         self.canvas.bind("<Configure>", self._on_canvas_configure)
         
-        # Bind mouse wheel to scrollbars for better cross-platform support
-        self.v_scrollbar.bind("<MouseWheel>", self._on_mousewheel)
-        self.h_scrollbar.bind("<MouseWheel>", self._on_mousewheel)
-        
-        # Bind to the main container for comprehensive coverage
-        self.main_container.bind("<MouseWheel>", self._on_mousewheel)
-        self.main_container.bind("<Button-4>", self._on_mousewheel)
-        self.main_container.bind("<Button-5>", self._on_mousewheel)
-        
         # Bind keyboard shortcuts for scrolling
         self.root.bind("<Up>", self._on_key_scroll_up)
         self.root.bind("<Down>", self._on_key_scroll_down)
@@ -276,15 +482,40 @@ class TikTokDownloaderModularGUI:
         """
         try:
             # Bind to current widget
-            widget.bind("<MouseWheel>", self._on_mousewheel)
-            widget.bind("<Button-4>", self._on_mousewheel)
-            widget.bind("<Button-5>", self._on_mousewheel)
+            self._bind_mousewheel(widget)
             
             # Recursively bind to all children
             for child in widget.winfo_children():
                 self._bind_mousewheel_to_children(child)
-        except:
-            pass  # Ignore binding errors
+        except tk.TclError:
+            pass  # Ignore widgets that were destroyed or do not accept bindings
+    
+    def _get_mousewheel_binding(self):
+        """
+        Select the mouse wheel handler and event sequences for the running platform.
+        
+        The platform cannot change at runtime, so this is resolved once instead
+        of probing every wheel event.
+        
+        Returns:
+            tuple: (handler, event sequences to bind it to)
+        """
+        if sys.platform == "darwin":
+            return self._scroll_mac, ("<MouseWheel>",)
+        if sys.platform == "win32":
+            return self._scroll_win, ("<MouseWheel>",)
+        # X11 reports wheel movement as button 4/5 presses
+        return self._scroll_x11, ("<Button-4>", "<Button-5>")
+    
+    def _bind_mousewheel(self, widget):
+        """
+        Bind the platform mouse wheel handler to a widget.
+        
+        Args:
+            widget: The widget to bind the mouse wheel events to
+        """
+        for sequence in self._mousewheel_events:
+            widget.bind(sequence, self._mousewheel_handler)
     
     def _on_key_scroll_up(self, event):
         """Handle Up arrow key for scrolling up."""
@@ -316,61 +547,51 @@ class TikTokDownloaderModularGUI:
         self.canvas.yview_moveto(1)
         return "break"  # Prevent default behavior
     
-    def _on_mousewheel(self, event):
+    def _scroll_x11(self, event):
         """
-        Handle mouse wheel scrolling events with improved cross-platform support.
+        Handle mouse wheel scrolling on X11 (Button-4 up, Button-5 down).
         
         Args:
             event: The mouse wheel event
         """
-        try:
-            # Handle different mouse wheel events across platforms
-            if hasattr(event, 'num'):
-                # Linux scroll events
-                if event.num == 4:  # Linux scroll up
-                    self.canvas.yview_scroll(-1, "units")
-                elif event.num == 5:  # Linux scroll down
-                    self.canvas.yview_scroll(1, "units")
-            elif hasattr(event, 'delta'):
-                # Windows/Mac scroll events
-                if event.delta != 0:
-                    # Normalize the delta value for consistent scrolling
-                    scroll_amount = int(-1 * (event.delta / 120))
-                    self.canvas.yview_scroll(scroll_amount, "units")
-            else:
-                # Fallback for other platforms or event types
-                # Try to determine scroll direction from event state
-                if hasattr(event, 'state'):
-                    # Check if shift is pressed for horizontal scrolling
-                    if event.state & 1:  # Shift key
-                        if event.delta > 0:
-                            self.canvas.xview_scroll(-1, "units")
-                        else:
-                            self.canvas.xview_scroll(1, "units")
-                    else:
-                        if event.delta > 0:
-                            self.canvas.yview_scroll(-1, "units")
-                        else:
-                            self.canvas.yview_scroll(1, "units")
-                else:
-                    # Default vertical scrolling
-                    self.canvas.yview_scroll(-1, "units")
-                    
-        except Exception as e:
-            # Fallback scrolling if event handling fails
-            try:
-                self.canvas.yview_scroll(-1, "units")
-            except:
-                pass  # Silently fail if scrolling is not possible
+        self.canvas.yview_scroll(-1 if event.num == 4 else 1, "units")
+    
+    def _scroll_mac(self, event):
+        """
+        Handle mouse wheel scrolling on macOS, where delta is already in units.
+        
+        Args:
+            event: The mouse wheel event
+        """
+        self.canvas.yview_scroll(-event.delta, "units")
+    
+    def _scroll_win(self, event):
+        """
+        Handle mouse wheel scrolling on Windows, where one notch is 120 delta.
+        
+        Args:
+            event: The mouse wheel event
+        """
+        self.canvas.yview_scroll(int(-event.delta / 120), "units")
     
     def _on_frame_configure(self, event=None):
         """
-        Update the scroll region when the content frame is configured.
+        Schedule a scroll region update when the content frame is configured.
+        
+        Configure events arrive in bursts while components are built and while
+        the window is resized, so the update is debounced to run at most once
+        per 50 ms.
         
         Args:
             event: The configure event (optional)
         """
-        # Update the scroll region to encompass the inner frame
+        if self._scrollregion_after is not None:
+            self.root.after_cancel(self._scrollregion_after)
+        self._scrollregion_after = self.root.after(50, self._apply_scrollregion)
+    
+    def _apply_scrollregion(self):
+        """Update the scroll region to encompass the inner frame."""
+        self._scrollregion_after = None
         self.canvas.configure(scrollregion=self.canvas.bbox("all"))
     
     def _on_canvas_configure(self, event):
@@ -386,39 +607,40 @@ class TikTokDownloaderModularGUI:
     def _create_components(self):
         """Create all GUI components."""
         # Video URL component
-        self.components['video_url'] = VideoURLComponent(self.content_frame)
-        self.components['video_url'].get_widget().grid(
+        self.c_url = self.components['video_url'] = VideoURLComponent(self.content_frame)
+        self.c_url.get_widget().grid(
             row=1, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10)
         )
         
         # Batch mode component
-        self.components['batch_mode'] = BatchModeComponent(self.content_frame)
-        self.components['batch_mode'].get_widget().grid(
+        self.c_batch = self.components['batch_mode'] = BatchModeComponent(self.content_frame)
+        self.c_batch.get_widget().grid(
             row=2, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10)
         )
         
         # Download settings component
-        self.components['download_settings'] = DownloadSettingsComponent(
+        self.c_settings = self.components['download_settings'] = DownloadSettingsComponent(
             self.content_frame,
             on_settings_changed=self._on_settings_changed
         )
-        self.components['download_settings'].get_widget().grid(
+        self.c_settings.get_widget().grid(
             row=3, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10)
         )
         
         # Excel integration component
-        self.components['excel_integration'] = ExcelIntegrationComponent(
+        self.c_excel = self.components['excel_integration'] = ExcelIntegrationComponent(
             self.content_frame, 
             self.excel_loader,
-            on_url_validation=self.download_manager.validate_url
+            on_url_validation=lambda url: self.download_manager.validate_url(url),
+            on_batch_validation=lambda urls: self.download_manager.validate_urls_with_details(urls)
         )
-        self.components['excel_integration'].get_widget().grid(
+        self.c_excel.get_widget().grid(
             row=4, column=0, columnspan=2, sticky=(tk.W, tk.E), pady=(0, 10)
         )
         
         # Log component
-        self.components['log'] = LogComponent(self.content_frame)
-        self.components['log'].get_widget().grid(
+        self.c_log = self.components['log'] = LogComponent(self.content_frame)
+        self.c_log.get_widget().grid(
             row=5, column=0, columnspan=2, sticky=(tk.W, tk.E, tk.N, tk.S), pady=(10, 0)
         )
     
@@ -426,13 +648,16 @@ class TikTokDownloaderModularGUI:
     def _setup_callbacks(self):
         """Setup callback functions for components."""
         # Set Excel integration callbacks
-        self.components['excel_integration'].set_callbacks(
+        self.c_excel.set_callbacks(
             on_columns_loaded=self._on_excel_columns_loaded,
             on_excel_download_start=self._on_excel_download_start,
             on_process_existing=self._on_process_existing_downloads
         )
         # Set Video URL component download callback for single URL downloads
-        self.components['video_url'].set_download_callback(self._start_download_with_urls)
+        self.c_url.set_download_callback(self._start_download_with_urls)
+        
+        # Closing the window goes through the same exit path as the Exit button
+        self.root.protocol("WM_DELETE_WINDOW", self._exit_application)
     
     def _setup_layout(self):
         """Setup the main layout and grid weights."""
@@ -442,11 +667,12 @@ class TikTokDownloaderModularGUI:
     
     def _on_excel_columns_loaded(self, columns: List[str]):
         """Callback when Excel columns are loaded."""
-        self.components['log'].log_message(f"Loaded Excel file with {len(columns)} columns", "INFO")
+        self.c_log.log_message(f"Loaded Excel file with {len(columns)} columns", "INFO")
     
     def _on_excel_download_start(self, urls: List[str]):
         """Callback when Excel download starts."""
         if not urls:
+            from tkinter import messagebox
             messagebox.showerror("Error", "No valid TikTok URLs found in Excel file")
             return
         
@@ -460,17 +686,30 @@ class TikTokDownloaderModularGUI:
         """Update the Excel file status display."""
         try:
             status_message = self.download_manager.get_excel_file_status_message()
-            self.components['excel_integration'].set_excel_file_status(status_message)
+            self.c_excel.set_excel_file_status(status_message)
         except Exception as e:
             logger.error(f"Error updating Excel file status: {e}")
-            self.components['excel_integration'].set_excel_file_status("Error checking file status")
+            self.c_excel.set_excel_file_status("Error checking file status")
+    
+    def _settings(self) -> DownloadSettings:
+        """
+        Get the current download settings, reading the Tk variables only when
+        a setting has changed since the last read.
+        
+        Returns:
+            DownloadSettings: Immutable snapshot of the current settings
+        """
+        if self._settings_cache is None:
+            self._settings_cache = self.c_settings.get_download_settings()
+        return self._settings_cache
     
     def _on_settings_changed(self):
         """Callback when download settings change."""
+        self._settings_cache = None
         try:
             # Update download manager settings
-            settings = self.components['download_settings'].get_settings()
-            self.download_manager.update_settings(**settings)
+            settings = self._settings()
+            self.download_manager.update_settings(**settings.as_dict())
             
             # Update Excel file status display
             self._update_excel_file_status()
@@ -479,66 +718,180 @@ class TikTokDownloaderModularGUI:
         except Exception as e:
             logger.error(f"Error updating settings: {e}")
     
+    def _setup_message_wakeup(self) -> bool:
+        """
+        Wake the Tk event loop through a pipe whenever a log message is queued.
+        
+        Queued messages are then processed as soon as they arrive instead of on
+        a polling timer. Tk file handlers are not available on Windows.
+        
+        Returns:
+            bool: True if event-driven wakeups are enabled, False if polling is needed
+        """
+        if not hasattr(self.root.tk, 'createfilehandler'):
+            return False
+        
+        try:
+            read_fd, write_fd = os.pipe()
+            os.set_blocking(read_fd, False)
+            os.set_blocking(write_fd, False)
+            self.root.tk.createfilehandler(read_fd, tk.READABLE, self._on_wakeup)
+        except (OSError, tk.TclError) as e:
+            logger.warning(f"Event-driven message processing unavailable, polling instead: {e}")
+            return False
+        
+        self._wakeup_fds = (read_fd, write_fd)
+        self.c_log.set_wakeup_callback(self._wakeup)
+        
+        # Deliver anything logged while the widgets were being built
+        self._wakeup()
+        return True
+    
+    def _wakeup(self):
+        """Signal the Tk event loop that messages are waiting (thread-safe)."""
+        with self._wakeup_lock:
+            if self._wakeup_fds is None:
+                return  # Pipe already closed on exit
+            try:
+                os.write(self._wakeup_fds[1], b"\0")
+            except BlockingIOError:
+                pass  # Pipe is full, so a wakeup is already pending
+    
+    def _close_message_wakeup(self):
+        """Unregister the wakeup pipe from Tk and close both ends."""
+        with self._wakeup_lock:
+            fds, self._wakeup_fds = self._wakeup_fds, None
+        if fds is None:
+            return
+        
+        self.c_log.set_wakeup_callback(None)
+        try:
+            self.root.tk.deletefilehandler(fds[0])
+        except tk.TclError:
+            pass
+        for fd in fds:
+            try:
+                os.close(fd)
+            except OSError:
+                pass
+    
+    def _on_wakeup(self, fd, mask):
+        """
+        Tk file handler: drain the wakeup pipe and process queued messages.
+        
+        Args:
+            fd (int): Read end of the wakeup pipe
+            mask (int): Tk event mask
+        """
+        try:
+            while os.read(fd, 4096):
+                pass
+        except BlockingIOError:
+            pass
+        
+        self._drain_ui_queue()
+        
+        # Coalesce log output: flush at most once per LOG_FLUSH_MS instead of per message
+        if self._log_flush_after is None:
+            self._log_flush_after = self.root.after(self.LOG_FLUSH_MS, self._flush_log)
+    
+    def _flush_log(self):
+        """Write all queued log messages to the log widget (Tk thread)."""
+        self._log_flush_after = None
+        self.c_log.process_messages()
+    
+    def _post(self, func, *args):
+        """
+        Run a widget update on the Tk thread (safe to call from worker threads).
+        
+        Args:
+            func (callable): Function to call on the Tk thread
+            *args: Positional arguments for the function
+        """
+        self._ui_queue.put((func, args))
+        if self._wakeup_fds is not None:
+            self._wakeup()
+    
+    def _drain_ui_queue(self):
+        """Run all widget updates posted by worker threads."""
+        get_update = self._ui_queue.get_nowait
+        try:
+            while True:
+                func, args = get_update()
+                try:
+                    func(*args)
+                except Exception as e:
+                    logger.error(f"Error running UI update {func!r}: {e}")
+        except queue.Empty:
+            pass
+    
     def _process_messages(self):
-        """Process messages from all components."""
-        # Process log component messages
-        self.components['log'].process_messages()
+        """Process messages from all components (polling fallback)."""
+        # Run posted widget updates and process log component messages
+        self._drain_ui_queue()
+        self.c_log.process_messages()
         
-        # Schedule next check
-        self.root.after(100, self._process_messages)
+        # Poll quickly while a download is running or messages are pending,
+        # and back off while the application is idle
+        busy = (
+            self._download_active
+            or not self.c_log.message_queue.empty()
+            or not self._ui_queue.empty()
+        )
+        self.root.after(50 if busy else 250, self._process_messages)
     
     def _get_urls_from_input(self) -> List[str]:
         """Get URLs from both single and batch input components."""
-        urls = []
-        
-        # Get single URL if not empty
-        single_url = self.components['video_url'].get_url()
-        if single_url:
-            urls.append(single_url)
+        # Single URL (if any) followed by the batch URLs when batch mode is enabled
+        single_url = self.c_url.get_url()
+        batch_urls = self.c_batch.get_urls() if self.c_batch.is_batch_mode_enabled() else ()
         
-        # Get batch URLs if batch mode is enabled
-        if self.components['batch_mode'].is_batch_mode_enabled():
-            batch_urls = self.components['batch_mode'].get_urls()
-            urls.extend(batch_urls)
-        
-        # Filter out empty URLs
-        urls = [url for url in urls if url.strip()]
+        # Filter out empty URLs in one pass; isspace() avoids a stripped copy
+        urls = [
+            url for url in itertools.chain((single_url,), batch_urls)
+            if url and not url.isspace()
+        ]
         
         if not urls:
             return []
         
+        # Common case: a single pasted link needs no batch processing or logging
+        if len(urls) == 1:
+            url = urls[0].strip()
+            if ' ' not in url and self.download_manager.validate_url(url):
+                return [url]
+        
         try:
             # Use the download manager's URL processor with better error handling
-            batch_text = '\n'.join(urls)
-            self.components['log'].log_message(f"Processing {len(urls)} URLs...", "INFO")
+            self.c_log.log_message(f"Processing {len(urls)} URLs...", "INFO")
             
-            # Call process_batch_text and handle the result safely
-            result = self.download_manager.process_batch_text(batch_text)
+            # Call process_batch_list and handle the result safely
+            result = self.download_manager.process_batch_list(urls)
             
             # Check if result is a tuple with 2 elements
             if not isinstance(result, tuple) or len(result) != 2:
-                self.components['log'].log_message(
-                    f"Unexpected result from process_batch_text: {type(result)}, value: {result}", 
+                self.c_log.log_message(
+                    f"Unexpected result from process_batch_list: {type(result)}, value: {result}", 
                     "ERROR"
                 )
-                # Fallback: try to validate URLs individually
-                valid_urls = []
-                invalid_urls = []
-                for url in urls:
-                    if self.download_manager.primary_downloader.validate_url(url):
-                        valid_urls.append(url)
-                    else:
-                        invalid_urls.append(url)
+                # Fallback: dedupe (order preserved) and validate with the precompiled pattern
+                unique_urls = list(dict.fromkeys(url.strip() for url in urls))
+                valid_urls = list(filter(self._TT_RE.match, unique_urls))
+                valid_set = set(valid_urls)
+                invalid_urls = [url for url in unique_urls if url not in valid_set]
                 
-                if invalid_urls:
-                    self.components['log'].log_message(f"Found {len(invalid_urls)} invalid URLs", "WARNING")
-                    for invalid_url in invalid_urls:
-                        self.components['log'].log_message(f"  Invalid: {invalid_url}", "WARNING")
-                
-                if valid_urls:
-                    self.components['log'].log_message(f"Found {len(valid_urls)} valid URLs", "INFO")
-                    for valid_url in valid_urls:
-                        self.components['log'].log_message(f"  Valid: {valid_url}", "INFO")
+                self.c_log.log_message(
+                    f"{len(valid_urls)}/{len(unique_urls)} valid URLs", "INFO"
+                )
+                self.c_log.log_messages_bulk(
+                    [f"  Invalid: {invalid_url}" for invalid_url in invalid_urls[:self._MAX_LOGGED_INVALID]],
+                    "WARNING"
+                )
+                if len(invalid_urls) > self._MAX_LOGGED_INVALID:
+                    self.c_log.log_message(
+                        f"  ... and {len(invalid_urls) - self._MAX_LOGGED_INVALID} more invalid URLs",
+                        "WARNING"
+                    )
                 
                 return valid_urls
             
@@ -546,198 +899,265 @@ class TikTokDownloaderModularGUI:
             valid_urls, invalid_urls = result
             
             if invalid_urls:
-                self.components['log'].log_message(f"Found {len(invalid_urls)} invalid URLs", "WARNING")
-                for invalid_url in invalid_urls:
-                    self.components['log'].log_message(f"  Invalid: {invalid_url}", "WARNING")
+                self.c_log.log_messages_bulk(
+                    [f"Found {len(invalid_urls)} invalid URLs"]
+                    + [f"  Invalid: {invalid_url}" for invalid_url in invalid_urls],
+                    "WARNING"
+                )
             
             if valid_urls:
-                self.components['log'].log_message(f"Found {len(valid_urls)} valid URLs", "INFO")
-                for valid_url in valid_urls:
-                    self.components['log'].log_message(f"  Valid: {valid_url}", "INFO")
+                self.c_log.log_messages_bulk(
+                    [f"Found {len(valid_urls)} valid URLs"]
+                    + [f"  Valid: {valid_url}" for valid_url in valid_urls],
+                    "INFO"
+                )
             
             return valid_urls
             
         except Exception as e:
-            self.components['log'].log_message(f"Error processing URLs: {str(e)}", "ERROR")
-            self.components['log'].log_message(f"Error type: {type(e)}", "ERROR")
-            import traceback
-            self.components['log'].log_message(f"Traceback: {traceback.format_exc()}", "ERROR")
+            self.c_log.log_message(f"Error processing URLs: {str(e)}", "ERROR")
+            self.c_log.log_message(f"Error type: {type(e)}", "ERROR")
+            if self._debug:
+                self.c_log.log_message(f"Traceback: {traceback.format_exc()}", "ERROR")
+            logger.exception("Error processing URLs")
             return []
     
     def _start_download_with_urls(self, urls: List[str], source: str):
         """Start download process with specified URLs."""
-        # Update UI state
-        self.components['log'].start_progress()
-        self.components['log'].set_status(f"Downloading from {source}...")
-        
-        # Start download thread
-        self.download_thread = threading.Thread(
-            target=self._download_worker, 
-            args=(urls, source)
-        )
-        self.download_thread.daemon = True
-        self.download_thread.start()
-    
-    def _download_worker(self, urls: List[str], source: str):
-        """Worker thread for downloading videos."""
-        try:
-            # Get current settings from components
-            settings = self.components['download_settings'].get_settings()
-            
-            self.components['log'].log_message(f"Download settings: {settings}", "INFO")
-            
-            # Update download manager settings
-            self.download_manager.update_settings(**settings)
-            
-            self.components['log'].log_message(f"Starting download of {len(urls)} video(s) from {source}")
-            self.components['log'].log_message(f"Output directory: {self.download_manager.output_dir}")
-            self.components['log'].log_message(f"Quality: {self.download_manager.quality}")
-            self.components['log'].log_message(f"Platform: {self.download_manager.platform}")
-            
-            # Log each URL being processed
-            for i, url in enumerate(urls, 1):
-                self.components['log'].log_message(f"URL {i}: {url}", "INFO")
-            
-            # Use different download method based on source and settings
-            # Always use Excel-optimized method when export_to_excel is enabled
-            # or when the source is explicitly Excel
-            use_excel_method = (source == "Excel" or settings.get('export_to_excel', False))
-            
-            self.components['log'].log_message(f"Source: {source}, Export to Excel: {settings.get('export_to_excel', False)}", "INFO")
-            self.components['log'].log_message(f"Using Excel method: {use_excel_method}", "INFO")
-            
-            if use_excel_method:
-                # Use the new Excel-specific method for better metadata handling
-                self.components['log'].log_message("Using Excel-optimized download method...", "INFO")
-                
-                # Create a progress callback for Excel downloads
-                def progress_callback(current: int, total: int, video_title: str = ""):
-                    self.root.after(0, lambda: self.components['excel_integration'].update_download_progress(
-                        current, total, video_title
-                    ))
-                
-                # Pass the progress callback to the download method
-                results = self.download_manager.download_videos_from_excel(
-                    urls, 
-                    export_to_excel=settings['export_to_excel'],
-                    progress_callback=progress_callback
-                )
-            else:
-                # Use the standard method for other sources
-                self.components['log'].log_message("Using standard download method...", "INFO")
-                results = self.download_manager.download_multiple_videos(
-                    urls, 
-                    export_to_excel=settings['export_to_excel']
+        with self._download_lock:
+            if self._download_active:
+                self.c_log.log_message(
+                    "A download is already in progress, please wait for it to finish", "WARNING"
                 )
+                return
             
-            self.components['log'].log_message(f"Download results: {results}", "INFO")
-            
-            # Log results
-            self.components['log'].log_message(
-                f"Download completed: {results['successful']}/{results['valid_urls']} successful", 
-                "SUCCESS"
-            )
-            
-            if settings['export_to_excel'] and results['excel_file']:
-                self.components['log'].log_message(
-                    f"Excel file saved: {results['excel_file']}", 
-                    "SUCCESS"
-                )
+            self._ensure_download_process()
+            self._download_active = True
             
-            # Update Excel integration component status if it was an Excel download
-            if source == "Excel":
-                self.root.after(0, lambda: self.components['excel_integration'].set_status_message(
-                    f"Download completed: {results['successful']}/{results['valid_urls']} videos processed successfully"
-                ))
+            # Update UI state
+            self._update_busy_state()
+            self.c_log.start_progress()
+            self.c_log.set_status(f"Downloading from {source}...")
             
-        except Exception as e:
-            self.components['log'].log_message(f"Unexpected error: {str(e)}", "ERROR")
-            self.components['log'].log_message(f"Error type: {type(e)}", "ERROR")
-            import traceback
-            self.components['log'].log_message(f"Traceback: {traceback.format_exc()}", "ERROR")
+            # Settings are read here on the Tk thread and handed to the worker process
+            self._download_jobs.put((urls, source, self._settings(), self._debug))
+    
+    def _ensure_download_process(self):
+        """Start the download worker process and its event relay if not running."""
+        if self._download_process is not None and self._download_process.is_alive():
+            return
         
-        finally:
-            # Update UI on main thread
-            self.root.after(0, self._finish_download)
+        # spawn: never fork a process that is running a Tk event loop
+        context = multiprocessing.get_context("spawn")
+        self._download_jobs = context.Queue()
+        events = context.Queue()
+        
+        self._download_process = context.Process(
+            target=_download_process_main,
+            args=(self._download_jobs, events),
+            name="downloader",
+            daemon=True
+        )
+        self._download_process.start()
+        
+        threading.Thread(
+            target=self._relay_download_events,
+            args=(events, self._download_process),
+            name="dl-events",
+            daemon=True
+        ).start()
+    
+    def _relay_download_events(self, events, process):
+        """
+        Forward events from the download process to the GUI (runs on a helper thread).
+        
+        Args:
+            events (multiprocessing.Queue): Event queue of the download process
+            process (multiprocessing.Process): The download process
+        """
+        # Bind the per-event handlers once; this loop runs for every log line
+        get_event = events.get
+        log = self.c_log.log_message
+        log_bulk = self.c_log.log_messages_bulk
+        post = self._post
+        update_progress = self.c_excel.update_download_progress
+        set_excel_status = self.c_excel.set_status_message
+        
+        while True:
+            try:
+                kind, args = get_event(timeout=1.0)
+            except queue.Empty:
+                if not process.is_alive():
+                    if self._download_active:
+                        log("Download process exited unexpectedly", "ERROR")
+                        post(self._finish_download)
+                    return
+                continue
+            except (EOFError, OSError):
+                return
+            
+            if kind == "log":
+                log(*args)
+            elif kind == "log_bulk":
+                log_bulk(*args)
+            elif kind == "progress":
+                post(update_progress, *args)
+            elif kind == "excel_status":
+                post(set_excel_status, *args)
+            elif kind == "finished":
+                post(self._finish_download)
     
     def _finish_download(self):
         """Finish download process and update UI."""
-        self.components['log'].stop_progress()
-        self.components['log'].set_status("Ready")
+        self._download_active = False
+        self._update_busy_state()
+        self.c_log.stop_progress()
+        self.c_log.set_status("Ready")
+        
+        # The download process wrote the metadata file; reload it on the
+        # background worker, since a full workbook load would freeze the UI
+        self._future = self._executor.submit(self._reload_excel_worker)
+        self._future.add_done_callback(lambda _: self._post(self._update_busy_state))
+        self._update_busy_state()
+    
+    def _reload_excel_worker(self):
+        """Worker task: reload the metadata file and show its status."""
+        try:
+            self.download_manager.reload_excel_file()
+            status_message = self.download_manager.get_excel_file_status_message()
+        except Exception as e:
+            logger.error(f"Error reloading Excel metadata file: {e}")
+            status_message = "Error checking file status"
+        
+        # Update UI on main thread
+        self._post(self.c_excel.set_excel_file_status, status_message)
+    
+    def _is_busy(self) -> bool:
+        """
+        Check whether a download or a background task is running.
+        
+        Returns:
+            bool: True if new downloads should not be started
+        """
+        return self._download_active or (self._future is not None and not self._future.done())
+    
+    def _update_busy_state(self):
+        """Disable the download buttons while work is running, re-enable them afterwards."""
+        enabled = not self._is_busy()
+        self.c_url.set_download_enabled(enabled)
+        self.c_excel.set_download_enabled(enabled)
     
     def _process_existing_downloads(self):
         """Process existing downloads and create Excel file."""
+        if self._is_busy():
+            self.c_log.log_message(
+                "Another operation is in progress, please wait for it to finish", "WARNING"
+            )
+            return
+        
         try:
             # Get current settings
-            settings = self.components['download_settings'].get_settings()
+            settings = self._settings()
             
             # Update download manager settings
-            self.download_manager.update_settings(**settings)
+            self.download_manager.update_settings(**settings.as_dict())
             
-            self.components['log'].log_message("Processing existing downloads for Excel export...")
-            self.components['log'].set_status("Processing existing downloads...")
+            self.c_log.log_message("Processing existing downloads for Excel export...")
+            self.c_log.set_status("Processing existing downloads...")
             
-            # Process in separate thread
-            process_thread = threading.Thread(target=self._process_existing_worker)
-            process_thread.daemon = True
-            process_thread.start()
+            # Process on the background worker; re-enable the buttons once it is done
+            self._future = self._executor.submit(self._process_existing_worker)
+            self._future.add_done_callback(lambda _: self._post(self._update_busy_state))
+            self._update_busy_state()
             
         except Exception as e:
-            self.components['log'].log_message(f"Error starting process: {str(e)}", "ERROR")
+            self.c_log.log_message(f"Error starting process: {str(e)}", "ERROR")
     
     def _process_existing_worker(self):
-        """Worker thread for processing existing downloads."""
+        """Worker task for processing existing downloads."""
         try:
             result = self.download_manager.process_existing_downloads(export_to_excel=True)
             
             if result['processed'] > 0:
-                self.components['log'].log_message(
+                self.c_log.log_message(
                     f"Successfully processed {result['processed']} existing downloads", 
                     "SUCCESS"
                 )
-                self.components['log'].log_message(
+                self.c_log.log_message(
                     f"Excel file saved: {result['excel_file']}", 
                     "SUCCESS"
                 )
             else:
-                self.components['log'].log_message("No existing downloads found to process", "INFO")
+                self.c_log.log_message("No existing downloads found to process", "INFO")
             
         except Exception as e:
-            self.components['log'].log_message(f"Error processing existing downloads: {str(e)}", "ERROR")
+            self.c_log.log_message(f"Error processing existing downloads: {str(e)}", "ERROR")
         
         finally:
             # Update UI on main thread
-            self.root.after(0, lambda: self.components['log'].set_status("Ready"))
+            self._post(self.c_log.set_status, "Ready")
     
     def _reset_all(self):
         """Reset all components to their default state."""
         try:
             # Reset video URL component
-            self.components['video_url'].clear_url()
+            self.c_url.clear_url()
             
             # Reset batch mode component
-            self.components['batch_mode'].clear_urls()
-            self.components['batch_mode'].batch_mode_var.set(False)
+            self.c_batch.clear_urls()
+            self.c_batch.batch_mode_var.set(False)
             
             # Reset download settings component
-            self.components['download_settings'].reset_to_defaults()
+            self.c_settings.reset_to_defaults()
             
             # Reset Excel integration component
-            self.components['excel_integration'].clear_selection()
+            self.c_excel.clear_selection()
             
             # Reset log component
-            self.components['log'].clear_log()
-            self.components['log'].set_status("Ready")
+            self.c_log.clear_log()
+            self.c_log.set_status("Ready")
             
-            self.components['log'].log_message("All components reset to defaults", "INFO")
+            self.c_log.log_message("All components reset to defaults", "INFO")
             
         except Exception as e:
-            self.components['log'].log_message(f"Error resetting components: {str(e)}", "ERROR")
+            self.c_log.log_message(f"Error resetting components: {str(e)}", "ERROR")
     
     def _exit_application(self):
-        """Exit the application."""
-        if messagebox.askokcancel("Exit", "Are you sure you want to exit?"):
-            self.root.quit()
+        """Exit the application, asking for confirmation only while work is running."""
+        if self._is_busy():
+            from tkinter import messagebox
+            if not messagebox.askokcancel("Exit", "A download is still running. Are you sure you want to exit?"):
+                return
+        
+        self._stop_download_process(force=self._download_active)
+        self._executor.shutdown(wait=False, cancel_futures=True)
+        self._close_message_wakeup()
+        self.root.destroy()
+    
+    def _stop_download_process(self, force: bool):
+        """
+        Shut down the download worker process.
+        
+        An idle worker is asked to stop with the None sentinel so it can run
+        its cleanup; a worker in the middle of a download (which the user has
+        agreed to abandon) is terminated.
+        
+        Args:
+            force (bool): Terminate the process instead of asking it to stop
+        """
+        process = self._download_process
+        if process is None or not process.is_alive():
+            return
+        
+        if force:
+            logger.info("Terminating the download process")
+            process.terminate()
+        else:
+            self._download_jobs.put(None)
+        
+        process.join(self.PROCESS_STOP_TIMEOUT)
+        if process.is_alive():
+            logger.warning("Download process did not stop in time")
     
     def run(self):
         """Run the GUI application."""
@@ -751,11 +1171,11 @@ class TikTokDownloaderModularGUI:
 def main():
     """Main function to run the modular GUI."""
     try:
+        configure_logging()
         app = TikTokDownloaderModularGUI()
         app.run()
     except Exception as e:
         print(f"Failed to start modular GUI: {e}")
-        import traceback
         traceback.print_exc()
 
 
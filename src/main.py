@@ -13,14 +13,17 @@ import sys
 import os
 
 # Add the src directory to the Python path
-sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+src_dir = os.path.dirname(os.path.abspath(__file__))
+if src_dir not in sys.path:
+    sys.path.insert(0, src_dir)
 
 def main():
     """Main entry point for the TikTok Video Downloader application."""
     try:
-        from downloader.tiktok_gui_modular import TikTokDownloaderModularGUI
+        from downloader.tiktok_gui_modular import TikTokDownloaderModularGUI, configure_logging
         
         print("Starting TikTok Video Downloader - Modular Version...")
+        configure_logging()
         app = TikTokDownloaderModularGUI()
         app.run()
         
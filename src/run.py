@@ -12,34 +12,23 @@ Usage:
 import sys
 import os
 
-# Add the current directory to Python path
+# Add the src directory to Python path; the downloader, core and utils
+# packages are all imported from here
 current_dir = os.path.dirname(os.path.abspath(__file__))
-sys.path.insert(0, current_dir)
-
-# Add the downloader directory to Python path for component imports
-downloader_dir = os.path.join(current_dir, 'downloader')
-sys.path.insert(0, downloader_dir)
-
-# Add the core directory to Python path
-core_dir = os.path.join(current_dir, 'core')
-sys.path.insert(0, core_dir)
-
-# Add the utils directory to Python path
-utils_dir = os.path.join(current_dir, 'utils')
-sys.path.insert(0, utils_dir)
+if current_dir not in sys.path:
+    sys.path.insert(0, current_dir)
 
 def main():
     """Launch the TikTok Video Downloader application."""
     try:
-        print("Setting up Python path...")
-        print(f"Current directory: {current_dir}")
-        print(f"Downloader directory: {downloader_dir}")
-        print(f"Core directory: {core_dir}")
-        print(f"Utils directory: {utils_dir}")
-        
-        print("\nStarting TikTok Video Downloader - Modular Version...")
-        from downloader.tiktok_gui_modular import TikTokDownloaderModularGUI
+        print(
+            "Setting up Python path...\n"
+            f"Current directory: {current_dir}\n"
+            "\nStarting TikTok Video Downloader - Modular Version..."
+        )
+        from downloader.tiktok_gui_modular import TikTokDownloaderModularGUI, configure_logging
         
+        configure_logging()
         app = TikTokDownloaderModularGUI()
         app.run()
         
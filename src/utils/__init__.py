@@ -6,11 +6,19 @@ It includes Excel handling utilities and other helper functions.
 
 Available modules:
 - excel_loader: For loading and reading Excel files
-- excel_reader: For displaying and analyzing Excel data
+- xlsx_reader: Streaming reads of one column straight from the .xlsx XML
 """
 
-from .excel_loader import ExcelLoader, load_excel_columns, extract_urls_from_excel, validate_excel_file
-from .excel_reader import ExcelReader, show_excel_data, find_latest_excel_file
+import importlib
+
+# Re-exports are resolved on first access, so importing a light submodule such
+# as utils.xlsx_reader (used by core) does not load openpyxl via excel_loader
+_LAZY_EXPORTS = {
+    'ExcelLoader': '.excel_loader',
+    'load_excel_columns': '.excel_loader',
+    'extract_urls_from_excel': '.excel_loader',
+    'validate_excel_file': '.excel_loader',
+}
 
 __all__ = [
     # Excel Loader
@@ -18,12 +26,28 @@ __all__ = [
     'load_excel_columns',
     'extract_urls_from_excel',
     'validate_excel_file',
-    
-    # Excel Reader
-    'ExcelReader',
-    'show_excel_data',
-    'find_latest_excel_file',
 ]
 
 __version__ = "1.0.0"
 __author__ = "TikTok Downloader Team"
+
+
+def __getattr__(name):
+    """
+    Import a re-exported name from its submodule on first access.
+    
+    Args:
+        name (str): Attribute name
+        
+    Returns:
+        Any: The re-exported object
+        
+    Raises:
+        AttributeError: If the name is not exported by this package
+    """
+    module_name = _LAZY_EXPORTS.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(module_name, __name__), name)
+    globals()[name] = value
+    return value
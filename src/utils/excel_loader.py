@@ -14,14 +14,123 @@ Usage:
 """
 
 import os
+import zipfile
 import openpyxl
+import xml.etree.ElementTree as ET
+from contextlib import closing
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import Any, Dict, List, Optional, Tuple
 import logging
 
+try:
+    # Optional native (Rust) reader, much faster than openpyxl for bulk reads
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+from .xlsx_reader import active_sheet_index, read_column
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Excel file types accepted by ExcelLoader; python-calamine reads all of them
+_EXCEL_EXTENSIONS = ('.xlsx', '.xlsm', '.xlsb', '.xls')
+
+# File types openpyxl cannot read (binary .xlsb and legacy .xls)
+_CALAMINE_ONLY_EXTENSIONS = ('.xlsb', '.xls')
+
+# File types read straight from the worksheet XML when python-calamine is not available
+_FAST_XLSX_EXTENSIONS = ('.xlsx', '.xlsm')
+
+# Errors that make the XML fast path hand over to openpyxl
+_FAST_XLSX_ERRORS = (zipfile.BadZipFile, KeyError, ET.ParseError, ValueError)
+
+
+def _load_workbook(file_path: str) -> Any:
+    """
+    Open a workbook in read-only mode for streaming reads.
+    
+    Read-only workbooks keep the file open until closed, so callers wrap
+    the result in contextlib.closing to release it on every exit path.
+    
+    Args:
+        file_path (str): Path to the Excel file
+        
+    Returns:
+        openpyxl.Workbook: The opened read-only workbook
+    """
+    return openpyxl.load_workbook(file_path, read_only=True, data_only=True, keep_links=False)
+
+
+@lru_cache(maxsize=16)
+def _column_positions(header: Tuple[Any, ...]) -> Dict[str, int]:
+    """
+    Map the case-folded names in a header row to their column positions.
+    
+    Args:
+        header (Tuple[Any, ...]): Header cell values
+        
+    Returns:
+        Dict[str, int]: Column index (1-based) of the first column with each name
+    """
+    positions = {}
+    for i, cell_value in enumerate(header, 1):
+        if cell_value:
+            positions.setdefault(str(cell_value).strip().casefold(), i)
+    return positions
+
+
+def _use_calamine(file_path: str) -> bool:
+    """
+    Check whether a file should be read with python-calamine.
+    
+    Args:
+        file_path (str): Path to the Excel file
+        
+    Returns:
+        bool: True if python-calamine is installed and supports the file type
+    """
+    return CalamineWorkbook is not None and file_path.lower().endswith(_EXCEL_EXTENSIONS)
+
+
+def _calamine_value(value: Any) -> Any:
+    """
+    Convert a python-calamine cell value to what openpyxl would return.
+    
+    Args:
+        value (Any): Cell value from python-calamine
+        
+    Returns:
+        Any: None for empty cells, int for whole numbers, the value otherwise
+    """
+    if value == "":
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _calamine_rows(file_path: str, nrows: Optional[int] = None) -> List[List[Any]]:
+    """
+    Read the rows of the active sheet with python-calamine.
+    
+    Rows and columns start at A1 (empty leading rows and columns are kept),
+    so positions match openpyxl's.
+    
+    Args:
+        file_path (str): Path to the Excel file
+        nrows (Optional[int]): Number of rows to read (default: all)
+        
+    Returns:
+        List[List[Any]]: Raw row values
+    """
+    workbook = CalamineWorkbook.from_path(file_path)
+    sheet = workbook.get_sheet_by_index(active_sheet_index(file_path))
+    if nrows is None:
+        return sheet.to_python(skip_empty_area=False)
+    return sheet.to_python(skip_empty_area=False, nrows=nrows)
+
 
 class ExcelLoader:
     """
@@ -32,24 +141,23 @@ class ExcelLoader:
     TikTok video URL data but can be used for any Excel file.
     
     Attributes:
-        None - This is a utility class with no instance state
+        _header_cache (Dict[str, Tuple[int, Tuple[Any, ...]]]): First row of each file read
+            so far, keyed by absolute path, with the modification time it was read at
     """
     
     def __init__(self):
         """Initialize the Excel loader."""
-        pass
+        self._header_cache = {}
     
-    def validate_excel_file(self, file_path: str) -> Tuple[bool, str]:
+    def _check_file_path(self, file_path: str) -> Tuple[bool, str]:
         """
-        Validate if the provided file path is a valid Excel file.
+        Check that a path points to an existing Excel file, without opening it.
         
         Args:
-            file_path (str): Path to the Excel file to validate
+            file_path (str): Path to the Excel file to check
             
         Returns:
             Tuple[bool, str]: (is_valid, error_message)
-                - is_valid: True if file is valid, False otherwise
-                - error_message: Description of the error if invalid
         """
         if not file_path or not file_path.strip():
             return False, "No file path provided"
@@ -59,14 +167,100 @@ class ExcelLoader:
         if not os.path.exists(file_path):
             return False, f"File does not exist: {file_path}"
         
-        if not file_path.lower().endswith(('.xlsx', '.xls')):
+        if not file_path.lower().endswith(_EXCEL_EXTENSIONS):
             return False, f"File is not an Excel file: {file_path}"
         
+        # Binary and legacy workbooks can only be read by python-calamine
+        if file_path.lower().endswith(_CALAMINE_ONLY_EXTENSIONS) and CalamineWorkbook is None:
+            return False, f"Reading {os.path.splitext(file_path)[1]} files requires python-calamine: {file_path}"
+        
+        return True, "File is valid"
+    
+    def _get_header(self, file_path: str, worksheet=None) -> Tuple[Any, ...]:
+        """
+        Get the first row of an Excel file, reading it only if the file changed.
+        
+        Args:
+            file_path (str): Path to the Excel file
+            worksheet (optional): Already opened worksheet of the file to read from
+            
+        Returns:
+            Tuple[Any, ...]: Header cell values, including empty cells
+        """
+        key = os.path.abspath(file_path)
+        mtime = os.stat(key).st_mtime_ns
+        
+        cached = self._header_cache.get(key)
+        if cached is not None and cached[0] == mtime:
+            return cached[1]
+        
+        header = None
+        if worksheet is not None:
+            header = next(worksheet.iter_rows(max_row=1, values_only=True), ())
+        elif _use_calamine(file_path):
+            try:
+                rows = _calamine_rows(file_path, nrows=1)
+                header = tuple(_calamine_value(value) for value in rows[0]) if rows else ()
+            except Exception as e:
+                logger.warning(f"python-calamine could not read {file_path}, using openpyxl: {e}")
+        elif file_path.lower().endswith(_FAST_XLSX_EXTENSIONS):
+            try:
+                # Finding no column stops the read after the header row
+                header, _ = read_column(file_path, lambda header: None)
+            except _FAST_XLSX_ERRORS as e:
+                logger.debug(f"Fast header read failed for {file_path}, using openpyxl: {e}")
+        
+        if header is None:
+            # Load workbook in read-only mode and stream only the first row
+            with closing(_load_workbook(file_path)) as wb:
+                header = next(wb.active.iter_rows(max_row=1, values_only=True), ())
+        
+        self._header_cache[key] = (mtime, header)
+        return header
+    
+    @staticmethod
+    def _match_column(header: Tuple[Any, ...], column_name: str) -> Optional[int]:
+        """
+        Find a column by name in a header row (case-insensitive).
+        
+        Args:
+            header (Tuple[Any, ...]): Header cell values
+            column_name (str): Name of the column to find
+            
+        Returns:
+            Optional[int]: Column index (1-based) if found, None otherwise
+        """
+        return _column_positions(header).get(column_name.strip().casefold())
+    
+    def validate_excel_file(self, file_path: str) -> Tuple[bool, str]:
+        """
+        Validate if the provided file path is a valid Excel file.
+        
+        Args:
+            file_path (str): Path to the Excel file to validate
+            
+        Returns:
+            Tuple[bool, str]: (is_valid, error_message)
+                - is_valid: True if file is valid, False otherwise
+                - error_message: Description of the error if invalid
+        """
+        is_valid, error_message = self._check_file_path(file_path)
+        if not is_valid:
+            return False, error_message
+        
+        file_path = file_path.strip()
+        
         try:
             # Try to open the file to verify it's a valid Excel file
-            wb = openpyxl.load_workbook(file_path, read_only=True)
-            wb.close()
-            return True, "File is valid"
+            if _use_calamine(file_path):
+                try:
+                    CalamineWorkbook.from_path(file_path)
+                    return True, "File is valid"
+                except Exception:
+                    pass  # Let openpyxl decide below
+            
+            with closing(_load_workbook(file_path)):
+                return True, "File is valid"
         except Exception as e:
             return False, f"Invalid Excel file: {str(e)}"
     
@@ -83,24 +277,16 @@ class ExcelLoader:
         Raises:
             ValueError: If file path is invalid or file cannot be read
         """
-        # Validate file first
-        is_valid, error_message = self.validate_excel_file(file_path)
+        # Check the path first; opening the workbook validates its contents
+        is_valid, error_message = self._check_file_path(file_path)
         if not is_valid:
             raise ValueError(f"Cannot read Excel file: {error_message}")
         
         try:
-            # Load workbook in read-only mode for better performance
-            wb = openpyxl.load_workbook(file_path, read_only=True)
-            ws = wb.active
+            header = self._get_header(file_path)
             
             # Extract column names from first row
-            columns = []
-            for col in range(1, ws.max_column + 1):
-                cell_value = ws.cell(row=1, column=col).value
-                if cell_value:
-                    columns.append(str(cell_value))
-            
-            wb.close()
+            columns = [str(cell_value) for cell_value in header if cell_value]
             
             logger.info(f"Successfully loaded {len(columns)} columns from Excel file")
             return columns
@@ -121,13 +307,15 @@ class ExcelLoader:
             Optional[int]: Column index (1-based) if found, None otherwise
         """
         try:
-            columns = self.get_column_names(file_path)
+            is_valid, error_message = self._check_file_path(file_path)
+            if not is_valid:
+                raise ValueError(error_message)
             
-            # Find the column index (case-insensitive)
-            for i, col in enumerate(columns, 1):
-                if col.strip().lower() == column_name.strip().lower():
-                    logger.info(f"Found column '{column_name}' at index {i}")
-                    return i
+            # Position in the header row, so empty header cells are counted too
+            column_index = self._match_column(self._get_header(file_path), column_name)
+            if column_index is not None:
+                logger.info(f"Found column '{column_name}' at index {column_index}")
+                return column_index
             
             logger.warning(f"Column '{column_name}' not found in Excel file")
             return None
@@ -152,36 +340,101 @@ class ExcelLoader:
         Raises:
             ValueError: If file path is invalid or column not found
         """
-        # Validate file first
-        is_valid, error_message = self.validate_excel_file(file_path)
+        # Check the path first; the workbook is opened once for header and data
+        is_valid, error_message = self._check_file_path(file_path)
         if not is_valid:
             raise ValueError(f"Cannot read Excel file: {error_message}")
         
-        # Find column index
-        column_index = self.find_column_index(file_path, column_name)
-        if column_index is None:
-            raise ValueError(f"Column '{column_name}' not found in Excel file")
+        if _use_calamine(file_path):
+            try:
+                data = self._extract_with_calamine(file_path, column_name, start_row)
+            except Exception as e:
+                logger.warning(f"python-calamine could not read {file_path}, using openpyxl: {e}")
+            else:
+                if data is None:
+                    raise ValueError(f"Column '{column_name}' not found in Excel file")
+                logger.info(f"Successfully extracted {len(data)} values from column '{column_name}'")
+                return data
+        elif file_path.lower().endswith(_FAST_XLSX_EXTENSIONS):
+            # Stream the header and the one column straight from the sheet XML
+            try:
+                mtime = os.stat(file_path).st_mtime_ns
+                header, data = read_column(
+                    file_path, lambda header: self._match_column(header, column_name), start_row
+                )
+            except _FAST_XLSX_ERRORS as e:
+                logger.debug(f"Fast column read failed for {file_path}, using openpyxl: {e}")
+            else:
+                self._header_cache[os.path.abspath(file_path)] = (mtime, header)
+                if data is None:
+                    raise ValueError(f"Column '{column_name}' not found in Excel file")
+                logger.info(f"Successfully extracted {len(data)} values from column '{column_name}'")
+                return data
         
         try:
-            # Load workbook in read-only mode
-            wb = openpyxl.load_workbook(file_path, read_only=True)
+            wb = _load_workbook(file_path)
+        except Exception as e:
+            raise ValueError(f"Cannot read Excel file: Invalid Excel file: {str(e)}")
+        
+        with closing(wb):
             ws = wb.active
             
-            # Extract data from the specified column
-            data = []
-            for row in range(start_row, ws.max_row + 1):
-                cell_value = ws.cell(row=row, column=column_index).value
-                if cell_value:
-                    data.append(str(cell_value).strip())
-            
-            wb.close()
-            
-            logger.info(f"Successfully extracted {len(data)} values from column '{column_name}'")
-            return data
+            # Find column index
+            column_index = self._match_column(self._get_header(file_path, ws), column_name)
+            if column_index is None:
+                raise ValueError(f"Column '{column_name}' not found in Excel file")
+            
+            try:
+                # Random cell access re-reads the sheet in read-only mode,
+                # so stream the one column with iter_rows
+                data = [
+                    str(cell_value).strip()
+                    for (cell_value,) in ws.iter_rows(
+                        min_row=start_row, min_col=column_index, max_col=column_index,
+                        values_only=True
+                    )
+                    if cell_value
+                ]
+            except Exception as e:
+                logger.error(f"Error extracting data from column: {str(e)}")
+                raise ValueError(f"Failed to extract data from column: {str(e)}")
+        
+        logger.info(f"Successfully extracted {len(data)} values from column '{column_name}'")
+        return data
+    
+    def _extract_with_calamine(self, file_path: str, column_name: str,
+                               start_row: int) -> Optional[List[str]]:
+        """
+        Extract the values of a column with python-calamine in a single read of the sheet.
+        
+        Args:
+            file_path (str): Path to the Excel file
+            column_name (str): Name of the column to extract data from
+            start_row (int): Row to start extracting from (1-based)
             
-        except Exception as e:
-            logger.error(f"Error extracting data from column: {str(e)}")
-            raise ValueError(f"Failed to extract data from column: {str(e)}")
+        Returns:
+            Optional[List[str]]: List of values from the specified column, or None if
+                the column is not found
+        """
+        mtime = os.stat(file_path).st_mtime_ns
+        rows = _calamine_rows(file_path)
+        
+        # The header comes from the same read; keep it cached for later calls
+        header = tuple(_calamine_value(value) for value in rows[0]) if rows else ()
+        self._header_cache[os.path.abspath(file_path)] = (mtime, header)
+        
+        column_index = self._match_column(header, column_name)
+        if column_index is None:
+            return None
+        
+        data = []
+        for row in rows[max(start_row, 1) - 1:]:
+            if len(row) < column_index:
+                continue
+            cell_value = _calamine_value(row[column_index - 1])
+            if cell_value:
+                data.append(str(cell_value).strip())
+        return data
     
     def extract_urls_from_column(self, file_path: str, column_name: str, 
                                 url_validator=None) -> List[str]:
@@ -195,23 +448,36 @@ class ExcelLoader:
                 Should take a URL string and return True if valid, False otherwise
             
         Returns:
-            List[str]: List of valid URLs from the specified column
+            List[str]: Distinct valid URLs from the specified column, in sheet order
         """
         try:
             # Extract all data from the column
             all_data = self.extract_data_from_column(file_path, column_name)
             
+            # Values come back stripped, so only empty ones need dropping.
+            # Duplicate URLs (common in sheets merged from several crawls) are
+            # kept once, in first-seen order, so each video is downloaded once.
             if url_validator is None:
-                # If no validator provided, return all non-empty values
-                valid_urls = [url for url in all_data if url.strip()]
+                # If no validator provided, return all distinct non-empty values
+                valid_urls = list(dict.fromkeys(url for url in all_data if url))
+                distinct = len(valid_urls)
             else:
-                # Validate URLs using the provided validator
+                # Validate each distinct URL once using the provided validator
+                seen = set()
                 valid_urls = []
                 for url in all_data:
-                    if url.strip() and url_validator(url.strip()):
-                        valid_urls.append(url.strip())
-                    elif url.strip():
+                    if not url or url in seen:
+                        continue
+                    seen.add(url)
+                    if url_validator(url):
+                        valid_urls.append(url)
+                    else:
                         logger.warning(f"Invalid URL found: {url}")
+                distinct = len(seen)
+            
+            duplicates = sum(1 for url in all_data if url) - distinct
+            if duplicates:
+                logger.info(f"Skipped {duplicates} duplicate URLs in column '{column_name}'")
             
             logger.info(f"Extracted {len(valid_urls)} valid URLs from column '{column_name}'")
             return valid_urls
@@ -235,23 +501,43 @@ class ExcelLoader:
         """
         try:
             data = self.extract_data_from_column(file_path, column_name)
-            
-            preview_text = f"Total items in column '{column_name}': {len(data)}\n\n"
-            preview_text += f"First {min(max_preview, len(data))} items:\n"
-            
-            for i, item in enumerate(data[:max_preview], 1):
-                # Truncate long items
-                display_item = item[:100] + "..." if len(item) > 100 else item
-                preview_text += f"{i}. {display_item}\n"
-            
-            if len(data) > max_preview:
-                preview_text += f"\n... and {len(data) - max_preview} more items"
-            
-            return preview_text
+            return self.format_preview(data, column_name, max_preview)
             
         except Exception as e:
             return f"Error generating preview: {str(e)}"
     
+    @staticmethod
+    def format_preview(data: List[str], column_name: str, max_preview: int = 5) -> str:
+        """
+        Format a preview of column values that have already been extracted.
+        
+        Lets callers that also need the full column (e.g. to validate it)
+        read the file once instead of once for the preview and once for the data.
+        
+        Args:
+            data (List[str]): Values from the column
+            column_name (str): Name of the column
+            max_preview (int): Maximum number of items to show in preview
+            
+        Returns:
+            str: Formatted preview string
+        """
+        # Collect the lines and join them once
+        parts = [
+            f"Total items in column '{column_name}': {len(data)}\n\n",
+            f"First {min(max_preview, len(data))} items:\n",
+        ]
+        
+        for i, item in enumerate(data[:max_preview], 1):
+            # Truncate long items
+            display_item = item[:100] + "..." if len(item) > 100 else item
+            parts.append(f"{i}. {display_item}\n")
+        
+        if len(data) > max_preview:
+            parts.append(f"\n... and {len(data) - max_preview} more items")
+        
+        return "".join(parts)
+    
     def get_excel_info(self, file_path: str) -> dict:
         """
         Get basic information about an Excel file.
@@ -263,26 +549,34 @@ class ExcelLoader:
             dict: Dictionary containing file information
         """
         try:
-            # Validate file first
-            is_valid, error_message = self.validate_excel_file(file_path)
+            # Check the path first; a file that cannot be opened is reported below
+            is_valid, error_message = self._check_file_path(file_path)
             if not is_valid:
                 return {"error": error_message}
             
-            # Load workbook
-            wb = openpyxl.load_workbook(file_path, read_only=True)
-            ws = wb.active
-            
-            # Get basic info
-            info = {
-                "file_path": file_path,
-                "file_name": os.path.basename(file_path),
-                "total_rows": ws.max_row,
-                "total_columns": ws.max_column,
-                "data_rows": max(0, ws.max_row - 1),  # Exclude header row
-                "column_names": self.get_column_names(file_path)
-            }
+            # Load workbook in read-only mode
+            with closing(_load_workbook(file_path)) as wb:
+                ws = wb.active
+                
+                # Files saved without a dimension record report no (or an A1:A1) size
+                # in read-only mode; measure the sheet by streaming it instead
+                if not ws.max_row or not ws.max_column or (ws.max_row, ws.max_column) == (1, 1):
+                    ws.reset_dimensions()
+                    ws.calculate_dimension(force=True)
+                
+                header = self._get_header(file_path, ws)
+                max_row = ws.max_row or 0
+                
+                # Get basic info
+                info = {
+                    "file_path": file_path,
+                    "file_name": os.path.basename(file_path),
+                    "total_rows": max_row,
+                    "total_columns": ws.max_column or 0,
+                    "data_rows": max(0, max_row - 1),  # Exclude header row
+                    "column_names": [str(cell_value) for cell_value in header if cell_value]
+                }
             
-            wb.close()
             return info
             
         except Exception as e:
@@ -0,0 +1,334 @@
+"""
+Fast XLSX Column Reader
+
+Reads the header row and one column of the active worksheet of an .xlsx file
+straight from the worksheet XML with zipfile and ElementTree.iterparse, without
+building openpyxl cell objects. Used by ExcelLoader as a fast path and by the
+core package to look up recorded URLs and to locate the sheet that
+core.xlsx_writer appends to; callers fall back to openpyxl when this module raises.
+
+Usage:
+    from utils.xlsx_reader import read_column, read_column_values
+    
+    header, values = read_column("urls.xlsx", lambda header: 1)
+    urls = set(read_column_values("downloads/videos_metadata.xlsx", "P"))
+"""
+
+import os
+import posixpath
+import re
+import threading
+import zipfile
+import xml.etree.ElementTree as ET
+from collections import OrderedDict
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Callable, List, Optional, Tuple, Union
+
+# SpreadsheetML and relationship namespaces
+NS_MAIN = "http://schemas.openxmlformats.org/spreadsheetml/2006/main"
+_NS_REL = "http://schemas.openxmlformats.org/officeDocument/2006/relationships"
+_NS_PKG_REL = "http://schemas.openxmlformats.org/package/2006/relationships"
+
+_ROW_TAG = f"{{{NS_MAIN}}}row"
+_CELL_TAG = f"{{{NS_MAIN}}}c"
+_VALUE_TAG = f"{{{NS_MAIN}}}v"
+_TEXT_TAG = f"{{{NS_MAIN}}}t"
+_INLINE_TAG = f"{{{NS_MAIN}}}is"
+_PHONETIC_TAG = f"{{{NS_MAIN}}}rPh"
+
+# Column letters at the start of a cell reference such as "B12"
+_CELL_REF_RE = re.compile(r"[A-Z]+")
+
+# Parsed shared strings tables of recently read files, keyed by
+# (absolute path, modification time, size); most recently used last
+_SHARED_STRINGS_CACHE_SIZE = 4
+_shared_strings_cache = OrderedDict()
+_shared_strings_lock = threading.Lock()
+
+
+class UnsupportedCellError(ValueError):
+    """Raised when a cell needs openpyxl to be read correctly (e.g. a styled number that may be a date)."""
+
+
+@lru_cache(maxsize=None)
+def column_index(letters: str) -> int:
+    """
+    Convert column letters to a 1-based column index.
+    
+    Args:
+        letters (str): Column letters, e.g. "A" or "AB" (case-insensitive)
+        
+    Returns:
+        int: 1-based column index
+    """
+    index = 0
+    for char in letters.upper():
+        index = index * 26 + ord(char) - 64
+    return index
+
+
+def _read_workbook_xml(archive: zipfile.ZipFile) -> ET.Element:
+    """
+    Parse xl/workbook.xml of an open .xlsx archive.
+    
+    Args:
+        archive (zipfile.ZipFile): Open .xlsx archive
+        
+    Returns:
+        ET.Element: The workbook element
+    """
+    return ET.fromstring(archive.read("xl/workbook.xml"))
+
+
+def _active_tab(workbook: ET.Element) -> int:
+    """
+    Get the index of the active sheet from a parsed workbook.xml.
+    
+    Args:
+        workbook (ET.Element): The workbook element
+        
+    Returns:
+        int: Active sheet index (0 if not recorded)
+    """
+    view = workbook.find(f"{{{NS_MAIN}}}bookViews/{{{NS_MAIN}}}workbookView")
+    return int(view.get("activeTab", 0)) if view is not None else 0
+
+
+def active_sheet_index(file_path: str) -> int:
+    """
+    Get the index of the sheet that is active when the file is opened (openpyxl's wb.active).
+    
+    Args:
+        file_path (str): Path to the Excel file
+        
+    Returns:
+        int: Sheet index (0 if it cannot be determined)
+    """
+    if not file_path.lower().endswith(('.xlsx', '.xlsm')):
+        return 0
+    
+    try:
+        with zipfile.ZipFile(file_path) as archive:
+            return _active_tab(_read_workbook_xml(archive))
+    except (zipfile.BadZipFile, KeyError, ET.ParseError, ValueError):
+        return 0
+
+
+def active_sheet_path(archive: zipfile.ZipFile) -> str:
+    """
+    Resolve the archive path of the active worksheet (the one openpyxl's wb.active returns).
+    
+    Args:
+        archive (zipfile.ZipFile): Open .xlsx archive
+        
+    Returns:
+        str: Path of the worksheet XML inside the archive
+    """
+    workbook = _read_workbook_xml(archive)
+    sheets = workbook.findall(f"{{{NS_MAIN}}}sheets/{{{NS_MAIN}}}sheet")
+    rel_id = sheets[min(_active_tab(workbook), len(sheets) - 1)].get(f"{{{_NS_REL}}}id")
+    
+    rels = ET.fromstring(archive.read("xl/_rels/workbook.xml.rels"))
+    for rel in rels.iter(f"{{{_NS_PKG_REL}}}Relationship"):
+        if rel.get("Id") == rel_id:
+            target = rel.get("Target")
+            if target.startswith("/"):
+                return target.lstrip("/")
+            return posixpath.normpath(posixpath.join("xl", target))
+    
+    raise KeyError(f"Worksheet relationship {rel_id} not found")
+
+
+def _read_shared_strings(archive: zipfile.ZipFile) -> List[str]:
+    """
+    Read the shared strings table into a list, once per file.
+    
+    Args:
+        archive (zipfile.ZipFile): Open .xlsx archive
+        
+    Returns:
+        List[str]: Shared strings in index order (empty if the table is missing)
+    """
+    if "xl/sharedStrings.xml" not in archive.namelist():
+        return []
+    
+    strings = []
+    with archive.open("xl/sharedStrings.xml") as f:
+        for _, elem in ET.iterparse(f):
+            if elem.tag == f"{{{NS_MAIN}}}si":
+                # Plain and rich text runs, without phonetic hints
+                for phonetic in elem.findall(_PHONETIC_TAG):
+                    elem.remove(phonetic)
+                strings.append("".join(t.text or "" for t in elem.iter(_TEXT_TAG)))
+                elem.clear()
+    return strings
+
+
+def _cached_shared_strings(archive: zipfile.ZipFile, key: Tuple[str, int, int]) -> List[str]:
+    """
+    Get the shared strings table of a file, parsing it only if it is not cached.
+    
+    A header lookup followed by a column read of the same file then inflates
+    and parses sharedStrings.xml once.
+    
+    Args:
+        archive (zipfile.ZipFile): Open .xlsx archive
+        key (Tuple[str, int, int]): (absolute path, modification time, size) of the file
+        
+    Returns:
+        List[str]: Shared strings in index order
+    """
+    with _shared_strings_lock:
+        strings = _shared_strings_cache.get(key)
+        if strings is not None:
+            _shared_strings_cache.move_to_end(key)
+            return strings
+    
+    strings = _read_shared_strings(archive)
+    
+    with _shared_strings_lock:
+        _shared_strings_cache[key] = strings
+        while len(_shared_strings_cache) > _SHARED_STRINGS_CACHE_SIZE:
+            _shared_strings_cache.popitem(last=False)
+    return strings
+
+
+def _cell_value(cell: ET.Element, shared_strings: Callable[[], List[str]]) -> Optional[str]:
+    """
+    Get the value of a worksheet cell as openpyxl would show it, as text.
+    
+    Args:
+        cell (ET.Element): The <c> element
+        shared_strings (Callable[[], List[str]]): Returns the shared strings table
+        
+    Returns:
+        Optional[str]: Cell text, or None for an empty cell
+        
+    Raises:
+        UnsupportedCellError: For styled numeric cells, which may be dates
+    """
+    cell_type = cell.get("t", "n")
+    
+    if cell_type == "inlineStr":
+        inline = cell.find(_INLINE_TAG)
+        return None if inline is None else "".join(t.text or "" for t in inline.iter(_TEXT_TAG))
+    
+    value = cell.find(_VALUE_TAG)
+    if value is None or value.text is None:
+        return None
+    
+    if cell_type == "s":
+        return shared_strings()[int(value.text)]
+    if cell_type == "b":
+        return "True" if value.text == "1" else "False"
+    if cell_type == "n" and cell.get("s", "0") != "0":
+        raise UnsupportedCellError(f"Styled numeric cell {cell.get('r', '')}")
+    return value.text
+
+
+def read_column(file_path: str, find_column: Callable[[Tuple[Any, ...]], Optional[int]],
+                start_row: int = 2) -> Tuple[Tuple[Any, ...], Optional[List[str]]]:
+    """
+    Read the header row and one column of the active worksheet in a single streaming pass.
+    
+    Rows are discarded as soon as they are read, so memory use does not grow
+    with the sheet. The shared strings table is loaded only if a cell uses it,
+    and is reused across calls for the same unchanged file.
+    
+    Args:
+        file_path (str): Path to the .xlsx file
+        find_column (Callable[[Tuple[Any, ...]], Optional[int]]): Picks the 1-based
+            column index from the header row, or returns None if it is not there
+        start_row (int): First row to collect values from (default: 2, skipping the header)
+        
+    Returns:
+        Tuple[Tuple[Any, ...], Optional[List[str]]]: (header row, stripped values of the
+            non-empty cells of the column, or None if find_column found no column)
+        
+    Raises:
+        zipfile.BadZipFile, KeyError, ET.ParseError, ValueError: If the file cannot be
+            read this way (UnsupportedCellError for cells only openpyxl can convert)
+    """
+    stat = os.stat(file_path)
+    cache_key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size)
+    
+    with zipfile.ZipFile(file_path) as archive:
+        strings = None
+        
+        def shared_strings() -> List[str]:
+            nonlocal strings
+            if strings is None:
+                strings = _cached_shared_strings(archive, cache_key)
+            return strings
+        
+        header = ()
+        column = None
+        values = []
+        
+        with archive.open(active_sheet_path(archive)) as f:
+            row_number = 0
+            for _, elem in ET.iterparse(f):
+                if elem.tag != _ROW_TAG:
+                    continue
+                
+                row_number = int(elem.get("r", row_number + 1))
+                
+                if row_number == 1:
+                    # Header row: all cells, placed at their column positions
+                    cells = {}
+                    col = 0
+                    for cell in elem.iter(_CELL_TAG):
+                        ref = cell.get("r")
+                        col = column_index(_CELL_REF_RE.match(ref).group()) if ref else col + 1
+                        cells[col] = _cell_value(cell, shared_strings)
+                    header = tuple(cells.get(i) for i in range(1, max(cells, default=0) + 1))
+                
+                if column is None:
+                    column = find_column(header)
+                    if column is None:
+                        return header, None
+                
+                if row_number >= start_row:
+                    col = 0
+                    for cell in elem.iter(_CELL_TAG):
+                        ref = cell.get("r")
+                        col = column_index(_CELL_REF_RE.match(ref).group()) if ref else col + 1
+                        if col == column:
+                            text = _cell_value(cell, shared_strings)
+                            if text:
+                                values.append(text.strip())
+                            break
+                        if col > column:
+                            break
+                
+                elem.clear()
+        
+        if column is None:
+            column = find_column(header)
+            if column is None:
+                return header, None
+        
+        return header, values
+
+
+def read_column_values(xlsx_path: Union[str, Path], column_letter: str,
+                       min_row: int = 2) -> List[str]:
+    """
+    Read the non-empty values of one column of the active worksheet, as text.
+    
+    Args:
+        xlsx_path (Union[str, Path]): Path to the .xlsx file
+        column_letter (str): Column to read, e.g. "P"
+        min_row (int): First row to read (default: 2, skipping the header)
+        
+    Returns:
+        List[str]: Stripped cell values in row order
+        
+    Raises:
+        zipfile.BadZipFile, KeyError, ET.ParseError, ValueError: If the file cannot be
+            read this way (UnsupportedCellError for cells only openpyxl can convert)
+    """
+    target = column_index(column_letter)
+    _, values = read_column(str(xlsx_path), lambda header: target, min_row)
+    return values
@@ -50,7 +50,9 @@ def test_custom_naming():
     print("Testing download_videos_from_excel method with custom naming...")
     
     def progress_callback(current, total, video_title):
-        print(f"Progress: {current}/{total} - {video_title}")
+        # Print about 20 progress lines per run plus the final one
+        if current % max(1, total // 20) == 0 or current == total:
+            print(f"Progress: {current}/{total} - {video_title}")
     
     try:
         results = download_manager.download_videos_from_excel(
@@ -71,27 +73,28 @@ def test_custom_naming():
             print(f"\nExcel file created successfully at: {results['excel_file']}")
         
         # Show detailed results for each video
-        print("\nDetailed Results:")
+        # Collect the lines and write them in one call instead of one print per line
+        lines = ["\nDetailed Results:"]
         for i, result in enumerate(results['results'], 1):
-            print(f"\nVideo {i}:")
-            print(f"  URL: {result['url']}")
-            print(f"  Success: {result['success']}")
-            print(f"  Step: {result['step']}")
+            lines.append(f"\nVideo {i}:")
+            lines.append(f"  URL: {result['url']}")
+            lines.append(f"  Success: {result['success']}")
+            lines.append(f"  Step: {result['step']}")
             if result['error']:
-                print(f"  Error: {result['error']}")
+                lines.append(f"  Error: {result['error']}")
             if result['metadata']:
                 title = result['metadata'].get('title', 'Unknown')
-                print(f"  Title: {title}")
+                lines.append(f"  Title: {title}")
             if result['download_path']:
-                print(f"  Download Path: {result['download_path']}")
+                lines.append(f"  Download Path: {result['download_path']}")
+        sys.stdout.write("\n".join(lines) + "\n")
         
         # Check the output directory for downloaded files
         print(f"\nChecking output directory: {download_manager.output_dir}")
         if download_manager.output_dir.exists():
             files = list(download_manager.output_dir.glob("*"))
             print(f"Found {len(files)} files:")
-            for file in files:
-                print(f"  {file.name}")
+            sys.stdout.write("".join(f"  {file.name}\n" for file in files))
         else:
             print("Output directory does not exist")
         
@@ -8,12 +8,19 @@ to existing Excel files instead of overwriting them.
 
 import sys
 import os
+import stat
+import tempfile
+from datetime import datetime
 from pathlib import Path
 
 # Add the src directory to Python path
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), 'src'))
 
+import openpyxl
+
 from core.excel_metadata_manager import ExcelMetadataManager
+from core.xlsx_writer import append_rows
+from utils.xlsx_reader import read_column, read_column_values
 
 def test_excel_append():
     """Test that Excel metadata manager appends data correctly."""
@@ -130,5 +137,106 @@ def test_excel_append():
     else:
         print("   ❌ FAIL: Excel file did not append data correctly")
 
+def test_excel_batch_append():
+    """Test that bulk mode batches append to an existing file and skip duplicates."""
+    print("\nTesting Excel metadata manager batch append in bulk mode...")
+    
+    def make_video(number):
+        return {
+            'id': f'batch_video_{number}',
+            'title': f'Batch Video {number}',
+            'description': f'This is batch video {number} #test',
+            'uploader': f'BatchUser{number}',
+            'upload_date': '20240101',
+            'duration': 60 * number,
+            'view_count': 1000 * number,
+            'webpage_url': f'https://tiktok.com/@batchuser/video/{number}',
+            'ext': 'mp4'
+        }
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        # Create the file with the first video in one batch
+        manager1 = ExcelMetadataManager(output_dir=temp_dir, filename="batch_metadata.xlsx", bulk_mode=True)
+        assert manager1.add_video_metadata_batch([make_video(1)], ["downloads/batch_video_1.mp4"]) == 1
+        manager1.save_excel_file()
+        
+        # Reopen it, add a new video and a duplicate of the first in one batch
+        manager2 = ExcelMetadataManager(output_dir=temp_dir, filename="batch_metadata.xlsx", bulk_mode=True)
+        added = manager2.add_video_metadata_batch(
+            [make_video(2), make_video(1)],
+            ["downloads/batch_video_2.mp4", "downloads/batch_video_1.mp4"]
+        )
+        manager2.save_excel_file()
+        assert added == 1
+        
+        # Reopen in the default mode to verify what was written
+        manager3 = ExcelMetadataManager(output_dir=temp_dir, filename="batch_metadata.xlsx")
+        info = manager3.get_excel_info()
+        manager3.close_workbook()
+        assert info['data_rows'] == 2
+    
+    print("   ✅ PASS: Batch append kept both videos and skipped the duplicate")
+
+def test_xlsx_append_round_trip():
+    """Test that rows appended straight into the sheet XML read back correctly with openpyxl."""
+    print("\nTesting in-place xlsx append round trip...")
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        excel_file = Path(temp_dir) / "round_trip.xlsx"
+        
+        # Workbook written by openpyxl: shared strings, a styled header,
+        # a formula and a second sheet that must all survive the append
+        wb = openpyxl.Workbook()
+        ws = wb.active
+        ws.title = "Video Metadata"
+        ws.append(["Video ID", "Title", "Views", "Original URL"])
+        ws.append(["video_1", "First", 1500, "https://tiktok.com/@user/video/1"])
+        ws["A1"].font = openpyxl.styles.Font(bold=True)
+        notes = wb.create_sheet("Notes")
+        notes["A1"] = "keep me"
+        notes["B1"] = "=1+1"
+        wb.save(excel_file)
+        os.chmod(excel_file, 0o644)
+        
+        rows = [
+            ["video_2", "Tom & Jerry <3>", 1234567, "https://tiktok.com/@user/video/2"],
+            ["video_3", "Line\nbreak", 0, "https://tiktok.com/@user/video/3", True,
+             datetime(2024, 1, 2, 3, 4, 5)],
+        ]
+        assert append_rows(excel_file, rows, number_columns=(3,)) == 2
+        
+        # No temporary copy is left next to the workbook
+        assert [p.name for p in Path(temp_dir).iterdir()] == ["round_trip.xlsx"]
+        
+        # The rewritten file keeps the original permissions
+        assert stat.S_IMODE(excel_file.stat().st_mode) == 0o644
+        
+        wb = openpyxl.load_workbook(excel_file)
+        ws = wb["Video Metadata"]
+        assert wb.sheetnames == ["Video Metadata", "Notes"]
+        assert wb["Notes"]["A1"].value == "keep me"
+        assert wb["Notes"]["B1"].value == "=1+1"
+        assert ws["A1"].font.b
+        assert ws.max_row == 4
+        assert [cell.value for cell in ws[3]][:4] == rows[0]
+        assert ws["C3"].number_format == "#,##0"
+        assert ws["C4"].value == 0 and ws["C4"].number_format == "General"
+        assert ws["B4"].value == "Line\nbreak"
+        assert ws["E4"].value is True
+        assert ws["F4"].value == "2024-01-02 03:04:05"
+        assert ws.calculate_dimension() == "A1:F4"
+        wb.close()
+        
+        # The streaming reader sees the same values
+        urls = read_column_values(excel_file, "D")
+        assert urls == [f"https://tiktok.com/@user/video/{i}" for i in (1, 2, 3)]
+        header, titles = read_column(str(excel_file), lambda header: header.index("Title") + 1)
+        assert header == ("Video ID", "Title", "Views", "Original URL")
+        assert titles == ["First", "Tom & Jerry <3>", "Line\nbreak"]
+    
+    print("   ✅ PASS: Appended rows, styles and other sheets read back correctly")
+
 if __name__ == "__main__":
     test_excel_append()
+    test_excel_batch_append()
+    test_xlsx_append_round_trip()
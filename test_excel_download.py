@@ -72,19 +72,21 @@ def test_excel_download():
             print(f"\nExcel file created successfully at: {results['excel_file']}")
         
         # Show detailed results for each video
-        print("\nDetailed Results:")
+        # Collect the lines and write them in one call instead of one print per line
+        lines = ["\nDetailed Results:"]
         for i, result in enumerate(results['results'], 1):
-            print(f"\nVideo {i}:")
-            print(f"  URL: {result['url']}")
-            print(f"  Success: {result['success']}")
-            print(f"  Step: {result['step']}")
+            lines.append(f"\nVideo {i}:")
+            lines.append(f"  URL: {result['url']}")
+            lines.append(f"  Success: {result['success']}")
+            lines.append(f"  Step: {result['step']}")
             if result['error']:
-                print(f"  Error: {result['error']}")
+                lines.append(f"  Error: {result['error']}")
             if result['metadata']:
                 title = result['metadata'].get('title', 'Unknown')
-                print(f"  Title: {title}")
+                lines.append(f"  Title: {title}")
             if result['download_path']:
-                print(f"  Download Path: {result['download_path']}")
+                lines.append(f"  Download Path: {result['download_path']}")
+        sys.stdout.write("\n".join(lines) + "\n")
         
     except Exception as e:
         print(f"Error during download: {e}")
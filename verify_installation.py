@@ -10,14 +10,62 @@ Usage:
 """
 
 import sys
-import importlib
+import io
 import os
+import threading
+from functools import lru_cache
+
+
+class _ThreadBufferedOutput:
+    """Stdout stand-in that collects each worker thread's output separately."""
+    
+    def __init__(self, stream):
+        self.stream = stream
+        self._local = threading.local()
+    
+    def run(self, check):
+        """Run a check, returning its result and everything it printed."""
+        self._local.buffer = io.StringIO()
+        try:
+            return check(), self._local.buffer.getvalue()
+        finally:
+            del self._local.buffer
+    
+    def write(self, text):
+        return getattr(self._local, 'buffer', self.stream).write(text)
+    
+    def flush(self):
+        self.stream.flush()
+
+@lru_cache(maxsize=None)
+def _list_files(directory):
+    """
+    List the regular files in a directory, reading each directory only once.
+    
+    The directory listing already carries each entry's type, so no extra
+    stat call is needed per file on most platforms.
+    """
+    try:
+        with os.scandir(directory or '.') as entries:
+            return frozenset(entry.name for entry in entries if entry.is_file())
+    except OSError:
+        return frozenset()
+
+def _file_exists(file_path):
+    """Check whether a regular file exists using the cached directory listing."""
+    directory, name = os.path.split(file_path)
+    return name in _list_files(directory)
+
+@lru_cache(maxsize=1)
+def _python_version_ok():
+    """Check if the running Python is 3.7 or higher."""
+    return sys.version_info >= (3, 7)
 
 def check_python_version():
     """Check if Python version is compatible."""
     print("Checking Python version...")
     version = sys.version_info
-    if version.major < 3 or (version.major == 3 and version.minor < 7):
+    if not _python_version_ok():
         print(f"❌ Python {version.major}.{version.minor} is not supported.")
         print("Please install Python 3.7 or higher.")
         return False
@@ -25,56 +73,80 @@ def check_python_version():
         print(f"✅ Python {version.major}.{version.minor}.{version.micro} is compatible.")
         return True
 
+# Required packages: import name -> pip package name
+REQUIRED_PACKAGES = {
+    'yt_dlp': 'yt-dlp',
+    'requests': 'requests',
+    'colorama': 'colorama',
+    'selenium': 'selenium',
+    'webdriver_manager': 'webdriver-manager',
+    'openpyxl': 'openpyxl',
+    'fake_useragent': 'fake-useragent',
+    'cv2': 'opencv-python',
+    'numpy': 'numpy',
+    'PIL': 'pillow',
+}
+
+def find_missing_packages():
+    """Return the import names of the required packages that are not installed."""
+    import importlib.util
+    
+    missing_packages = []
+    
+    # Only locate each package; importing it would run its module code
+    # (native libraries, codecs, logging setup)
+    for package in REQUIRED_PACKAGES:
+        # Already-loaded and built-in modules need no finder lookup
+        if package in sys.modules or package in sys.builtin_module_names:
+            continue
+        try:
+            if importlib.util.find_spec(package) is not None:
+                continue
+        except (ImportError, ValueError):
+            pass
+        missing_packages.append(package)
+    
+    return missing_packages
+
 def check_required_packages():
     """Check if all required packages are installed."""
     print("\nChecking required packages...")
     
-    required_packages = [
-        'yt_dlp',
-        'requests',
-        'colorama',
-        'selenium',
-        'webdriver_manager',
-        'openpyxl',
-        'fake_useragent',
-        'cv2',  # opencv-python
-        'numpy',
-        'PIL',  # pillow
-    ]
-    
-    missing_packages = []
+    missing_packages = find_missing_packages()
     
-    for package in required_packages:
-        try:
-            importlib.import_module(package)
-            print(f"✅ {package} is installed.")
-        except ImportError:
+    for package in REQUIRED_PACKAGES:
+        if package in missing_packages:
             print(f"❌ {package} is missing.")
-            missing_packages.append(package)
+        else:
+            print(f"✅ {package} is installed.")
     
     if missing_packages:
+        pip_names = [REQUIRED_PACKAGES[package] for package in missing_packages]
         print(f"\n❌ Missing packages: {', '.join(missing_packages)}")
-        print("Please run the setup script again.")
+        print("Please run the setup script again, or install them with:")
+        print(f"    pip install {' '.join(pip_names)}")
+        print("(or rerun this script with --auto-install)")
         return False
     else:
         print("\n✅ All required packages are installed.")
         return True
 
+# Application files that must be present
+REQUIRED_FILES = [
+    'src/run.py',
+    'src/downloader/tiktok_gui_modular.py',
+    'src/core/tiktok_downloader.py',
+    'requirements.txt',
+]
+
 def check_application_files():
     """Check if all required application files exist."""
     print("\nChecking application files...")
     
-    required_files = [
-        'src/run.py',
-        'src/downloader/tiktok_gui_modular.py',
-        'src/core/tiktok_downloader.py',
-        'requirements.txt',
-    ]
-    
     missing_files = []
     
-    for file_path in required_files:
-        if os.path.exists(file_path):
+    for file_path in REQUIRED_FILES:
+        if _file_exists(file_path):
             print(f"✅ {file_path} exists.")
         else:
             print(f"❌ {file_path} is missing.")
@@ -89,56 +161,193 @@ def check_application_files():
 
 def test_imports():
     """Test if the application modules can be imported."""
+    import compileall
+    
     print("\nTesting application imports...")
     
+    # Compile each module to bytecode without running it; running the
+    # module code would load yt-dlp, tkinter and the rest of the app.
+    # check_required_packages() covers the third-party dependencies, and
+    # the cached .pyc files also speed up the first real start.
+    modules = [
+        ('src/core/tiktok_downloader.py', 'TikTokDownloader'),
+        ('src/downloader/tiktok_gui_modular.py', 'TikTokDownloaderModularGUI'),
+    ]
+    
     try:
-        # Add src to path
-        sys.path.insert(0, os.path.join(os.getcwd(), 'src'))
+        all_compiled = True
+        for file_path, class_name in modules:
+            # Shares the directory listings read by check_application_files()
+            if not _file_exists(file_path):
+                print(f"❌ {class_name} module is missing: {file_path}")
+                all_compiled = False
+            # quiet=1 prints only the compile errors
+            elif compileall.compile_file(file_path, quiet=1):
+                print(f"✅ {class_name} module compiled successfully.")
+            else:
+                print(f"❌ {class_name} module failed to compile.")
+                all_compiled = False
         
-        # Test core imports
-        from core.tiktok_downloader import TikTokDownloader
-        print("✅ TikTokDownloader imported successfully.")
+        if not all_compiled:
+            return False
         
-        # Test downloader imports
-        from downloader.tiktok_gui_modular import TikTokDownloaderModularGUI
-        print("✅ TikTokDownloaderModularGUI imported successfully.")
-        
-        print("\n✅ All application modules can be imported.")
+        print("\n✅ All application modules compile.")
         return True
         
-    except ImportError as e:
+    except OSError as e:
         print(f"❌ Import error: {e}")
         return False
     except Exception as e:
         print(f"❌ Unexpected error: {e}")
         return False
 
+def install_missing_packages():
+    """Install the missing required packages with a single pip run."""
+    import subprocess
+    
+    missing_packages = find_missing_packages()
+    if not missing_packages:
+        return True
+    
+    pip_names = [REQUIRED_PACKAGES[package] for package in missing_packages]
+    print(f"\nInstalling missing packages: {', '.join(pip_names)}")
+    
+    # One pip process lets the resolver handle all packages together
+    result = subprocess.run([sys.executable, '-m', 'pip', 'install', *pip_names])
+    if result.returncode == 0:
+        print("✅ Packages installed. Run this script again to verify the installation.")
+        return True
+    else:
+        print("❌ pip could not install the packages. Please run the setup script again.")
+        return False
+
+# Record of the last successful verification
+VERIFY_MARKER = '.verify_ok.json'
+
+def _installation_fingerprint():
+    """
+    Describe everything a successful verification depends on.
+    
+    Installing or removing a package changes the modification time of the
+    site-packages directory it lives in, and editing the requirements or
+    the application modules changes theirs, so any of these invalidates a
+    recorded result.
+    """
+    import site
+    import sysconfig
+    
+    paths = list(REQUIRED_FILES)
+    paths += sorted({sysconfig.get_path('purelib'), sysconfig.get_path('platlib'),
+                     site.getusersitepackages()})
+    
+    mtimes = {}
+    for path in paths:
+        try:
+            mtimes[path] = os.stat(path).st_mtime_ns
+        except OSError:
+            mtimes[path] = None
+    
+    return {
+        'python': list(sys.version_info[:3]),
+        'executable': sys.executable,
+        'mtimes': mtimes,
+    }
+
+def _verification_cached():
+    """Check whether a previous successful verification still applies."""
+    import json
+    
+    try:
+        with open(VERIFY_MARKER, encoding='utf-8') as f:
+            return json.load(f) == _installation_fingerprint()
+    except (OSError, ValueError):
+        return False
+
+def _record_verification():
+    """Record a successful verification so unchanged installs can skip the checks."""
+    import json
+    
+    try:
+        with open(VERIFY_MARKER, 'w', encoding='utf-8') as f:
+            json.dump(_installation_fingerprint(), f)
+    except OSError:
+        pass  # Only a speed-up; verification itself succeeded
+
 def main():
     """Main verification function."""
-    print("=" * 50)
-    print("Social Downloader - Installation Verification")
-    print("=" * 50)
-    
-    checks = [
-        check_python_version(),
-        check_required_packages(),
-        check_application_files(),
-        test_imports(),
+    import argparse
+    from concurrent.futures import ThreadPoolExecutor
+    
+    parser = argparse.ArgumentParser(description="Verify the Social Downloader installation.")
+    parser.add_argument('--full', action='store_true',
+                        help="run every check, even if the Python version is not supported "
+                             "or a previous verification is still valid")
+    parser.add_argument('--auto-install', action='store_true',
+                        help="install any missing required packages with pip")
+    args = parser.parse_args()
+    
+    # Show the banner right away, in a single write
+    print("=" * 50 + "\nSocial Downloader - Installation Verification\n" + "=" * 50, flush=True)
+    
+    # Nothing relevant has changed since the last successful run
+    if not args.full and not args.auto_install and _verification_cached():
+        print("✅ Cached verification is still valid (use --full to check again).")
+        print("=" * 50)
+        return
+    
+    check_functions = [
+        check_required_packages,
+        check_application_files,
+        test_imports,
     ]
     
-    print("\n" + "=" * 50)
+    # The other checks are meaningless on an unsupported Python, so stop
+    # here unless the user asked for the full report
+    checks = [check_python_version()]
+    if not checks[0] and not args.full:
+        check_functions = []
+    
+    # The remaining checks are independent, so run them side by side and print each
+    # one's output in order once all have finished
+    output = _ThreadBufferedOutput(sys.stdout)
+    sys.stdout = output
+    try:
+        with ThreadPoolExecutor(max_workers=max(len(check_functions), 1)) as executor:
+            futures = [executor.submit(output.run, check) for check in check_functions]
+    finally:
+        sys.stdout = output.stream
+    
+    # Collect the check reports and the summary, then write them out at once
+    report = []
+    for future in futures:
+        result, text = future.result()
+        report.append(text)
+        checks.append(result)
+    
+    report.append("\n" + "=" * 50 + "\n")
     if all(checks):
-        print("🎉 Installation verification completed successfully!")
-        print("You can now run the application using:")
-        print("- Windows: Double-click start_windows.bat")
-        print("- Mac: Double-click start_mac.sh")
-        print("- Linux: Double-click start_linux.sh")
-        print("- Or run: python src/run.py")
+        _record_verification()
+        report.append(
+            "🎉 Installation verification completed successfully!\n"
+            "You can now run the application using:\n"
+            "- Windows: Double-click start_windows.bat\n"
+            "- Mac: Double-click start_mac.sh\n"
+            "- Linux: Double-click start_linux.sh\n"
+            "- Or run: python src/run.py\n"
+        )
     else:
-        print("❌ Installation verification failed.")
-        print("Please run the setup script again and try this verification again.")
+        report.append(
+            "❌ Installation verification failed.\n"
+            "Please run the setup script again and try this verification again.\n"
+        )
+    
+    report.append("=" * 50 + "\n")
+    sys.stdout.write("".join(report))
+    sys.stdout.flush()
     
-    print("=" * 50)
+    # Installing is pointless on an unsupported Python
+    if args.auto_install and checks[0]:
+        install_missing_packages()
 
 if __name__ == "__main__":
     main()